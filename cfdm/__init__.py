@@ -59,14 +59,18 @@ from .functions import (
     atol,
     chunksize,
     configuration,
+    dataset_pool_size,
+    dataset_pool_timeout,
     dirname,
     display_data,
     environment,
     integer_dtype,
+    lock_policy,
     log_level,
     parse_indices,
     persist_data,
     rtol,
+    tie_point_cache_size,
     unique_constructs,
     _disable_logging,
     _reset_log_emergence_level,
@@ -165,12 +169,57 @@ from .fieldancillary import FieldAncillary
 from .abstract import Implementation
 from .cfdmimplementation import CFDMImplementation, implementation
 
-from .read_write import read, write
-from .read_write.netcdf.flatten import dataset_flatten
+from .abstract import Container
 
-from .examplefield import example_field, example_fields, example_domain
+# --------------------------------------------------------------------
+# Lazily imported attributes
+# --------------------------------------------------------------------
+# The modules that define these attributes are only imported when one
+# of their attributes is first accessed (PEP 562), which speeds up
+# 'import cfdm' for applications that do not read or write datasets.
+#
+# E.g. {'read': '.read_write'}
+_lazy_attributes = {
+    "read": ".read_write",
+    "write": ".read_write",
+    "dataset_flatten": ".read_write.netcdf.flatten",
+    "example_field": ".examplefield",
+    "example_fields": ".examplefield",
+    "example_domain": ".examplefield",
+}
+
+# Lazily imported submodules
+_lazy_submodules = ("examplefield", "read_write")
+
+
+def __getattr__(name):
+    """Import a lazily imported attribute on first access.
+
+    .. versionadded:: (cfdm) NEXTVERSION
+
+    """
+    from importlib import import_module
+
+    module = _lazy_attributes.get(name)
+    if module is not None:
+        value = getattr(import_module(module, __name__), name)
+    elif name in _lazy_submodules:
+        value = import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Return the module attributes, including those not yet imported.
+
+    .. versionadded:: (cfdm) NEXTVERSION
+
+    """
+    return sorted(set(globals()).union(_lazy_attributes, _lazy_submodules))
 
-from .abstract import Container
 
 # --------------------------------------------------------------------
 # Set up basic logging for the full project with a root logger
@@ -197,3 +246,13 @@ def detail(self, message, *args, **kwargs):
 
 
 logging.Logger.detail = detail
+
+# --------------------------------------------------------------------
+# Names imported by 'from cfdm import *', which must include the
+# lazily imported attributes and submodules
+# --------------------------------------------------------------------
+__all__ = sorted(
+    name
+    for name in set(globals()).union(_lazy_attributes, _lazy_submodules)
+    if not name.startswith("_")
+)
@@ -1725,6 +1725,34 @@ class CFDMImplementation(Implementation):
         """
         return construct.get_node_count(default=None)
 
+    def get_offset_index(self, construct):
+        """Return the offset index of ragged compressed data.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            construct: construct
+
+        :Returns:
+
+            `dict` or `None`
+                The offset index, or `None` if the data are not
+                compressed as a ragged array.
+
+        """
+        if self.is_domain(construct):
+            return
+
+        data = construct.get_data(None)
+        if data is None:
+            return
+
+        try:
+            return data.source(None).offset_index()
+        except AttributeError:
+            return
+
     def get_parameter(self, parent, parameter, default=None):
         """Get a parameter value from a component.
 
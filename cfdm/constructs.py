@@ -1,6 +1,7 @@
 import logging
 from copy import deepcopy
 from itertools import zip_longest
+from numbers import Number
 from re import Pattern
 
 from .core import Constructs as core_Constructs
@@ -311,7 +312,7 @@ class Constructs(Container, core_Constructs):
                         "auxiliary_coordinate",
                         todict=True,
                     ).items():
-                        if axes != self.data_axes().get(ckey, ()):
+                        if axes != self._construct_axes.get(ckey, ()):
                             continue
 
                         # This coordinate construct spans the deleted
@@ -856,6 +857,129 @@ class Constructs(Container, core_Constructs):
 
         return out
 
+    @classmethod
+    def _filter_memoise_key(cls, x):
+        """Convert filter arguments to a hashable memoisation key.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        .. seealso:: `_filter_memoised`
+
+        :Parameters:
+
+            x:
+                The filter arguments, which may be nested in
+                dictionaries, lists, tuples and sets.
+
+        :Returns:
+
+                The hashable key.
+
+        **Examples**
+
+        >>> c._filter_memoise_key({'filter_by_type': ['domain_axis']})
+        (<class 'dict'>, (('filter_by_type', ('domain_axis',)),))
+        >>> c._filter_memoise_key(numpy.arange(3))
+        Traceback (most recent call last):
+            ...
+        TypeError: Can't memoise filter argument: array([0, 1, 2])
+
+        """
+        if isinstance(x, (str, Number, Pattern)) or x is None:
+            return x
+
+        if isinstance(x, dict):
+            return (
+                dict,
+                tuple((k, cls._filter_memoise_key(v)) for k, v in x.items()),
+            )
+
+        if isinstance(x, (tuple, list)):
+            return tuple(map(cls._filter_memoise_key, x))
+
+        if isinstance(x, (set, frozenset)):
+            return (set, frozenset(map(cls._filter_memoise_key, x)))
+
+        # Only memoise arguments that are known to have well-behaved
+        # hashes and equality comparisons
+        raise TypeError(f"Can't memoise filter argument: {x!r}")
+
+    def _filter_memoised(self, key, todict, func, *args):
+        """Return the memoised result of a filter.
+
+        Only dictionary results are memoised, since a `Constructs`
+        result records the filters that created it.
+
+        If the result for the given key has not been memoised, or
+        the constructs have been modified since it was memoised,
+        then the filter is applied and its result is memoised. A
+        construct modification is the addition, removal, or
+        replacement of a construct, or a change to a construct
+        component (such as a property or netCDF variable name) that
+        could affect the outcome of a filter.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        .. seealso:: `_filter_memoise_key`, `filter`
+
+        :Parameters:
+
+            key:
+                The filter name and its arguments, from which the
+                memoisation key is created. If the key can not be
+                created then the filter is applied without
+                memoisation.
+
+            todict: `bool`
+                Whether or not *func* returns a dictionary. If False
+                then the filter is applied without memoisation.
+
+            func: callable
+                The function that applies the filter.
+
+            args:
+                The positional arguments to *func*.
+
+        :Returns:
+
+            `Constructs` or `dict`
+                The filtered constructs. A memoised dictionary is
+                always returned as a new copy.
+
+        """
+        if not todict:
+            return func(*args)
+
+        try:
+            key = self._filter_memoise_key(
+                (self._ignore, self._field_data_axes, key)
+            )
+        except TypeError:
+            return func(*args)
+
+        stamp = self._mutation_stamp()
+        cache = getattr(self, "_filter_memos", None)
+        if cache is None or cache[0] != stamp:
+            # Replace, rather than modify, stale memos so that they
+            # are never shared with a view created from an earlier
+            # state
+            cache = (stamp, {})
+            self._filter_memos = cache
+
+        memos = cache[1]
+        out = memos.get(key)
+        if out is None:
+            out = func(*args)
+            if len(memos) >= 1024:
+                # Limit the memory used by memos of many different
+                # filters
+                memos.clear()
+
+            memos[key] = out.copy()
+            return out
+
+        return out.copy()
+
     @classmethod
     def _filter_preprocess(cls, arg, todict=False, filter_applied=None):
         """Preprocess a `dict` or `Constructs` prior to filtering.
@@ -902,6 +1026,108 @@ class Constructs(Container, core_Constructs):
 
         return arg, arg._pop
 
+    def _identity_index(self, short):
+        """Return an index from construct identities to construct keys.
+
+        The index is cached, and is automatically rebuilt after any
+        construct is added, removed, or replaced, or after any
+        component (such as a property or netCDF variable name) of any
+        of the constructs has been modified.
+
+        The index includes constructs of all types, regardless of any
+        construct types that are being ignored.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        .. seealso:: `_filter_by_identity`
+
+        :Parameters:
+
+            short: `bool`
+                If True then only index the first identity of each
+                construct, otherwise index all of its identities.
+
+        :Returns:
+
+            `dict` or `None`
+                The index, mapping each identity to the list of keys
+                of the constructs that have that identity. `None` is
+                returned if any identity is not hashable.
+
+        """
+        stamp = self._mutation_stamp()
+        cache = getattr(self, "_identity_indices", None)
+        if cache is None or cache[0] != stamp:
+            # Replace, rather than modify, the cache so that it is
+            # never shared with a view created from an earlier state
+            cache = (stamp, {})
+            self._identity_indices = cache
+
+        indices = cache[1]
+        if short in indices:
+            return indices[short]
+
+        index = {}
+        try:
+            for constructs in self._constructs.values():
+                for cid, construct in constructs.items():
+                    for identity in construct.identities(
+                        generator=True, short=short
+                    ):
+                        index.setdefault(identity, []).append(cid)
+        except TypeError:
+            # Unhashable identity
+            index = None
+
+        indices[short] = index
+        return index
+
+    def _mutation_stamp(self):
+        """Return a stamp that changes when the constructs are modified.
+
+        A construct modification is the addition, removal, or
+        replacement of a construct, or a change to a construct
+        component (such as a property or netCDF variable name) that
+        could affect the outcome of a filter.
+
+        Only modifications to these constructs change the stamp, but
+        the constructs are only inspected after a modification has
+        been made to any construct.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        .. seealso:: `_filter_memoised`, `_identity_index`
+
+        :Returns:
+
+            `tuple`
+                The stamp.
+
+        """
+        count = self._mutation_count
+        version = self._version[0]
+        cache = getattr(self, "_mutation_stamps", None)
+        if cache is not None and cache[:2] == (version, count):
+            # Nothing has been modified
+            return cache[2]
+
+        stamp = (
+            version,
+            tuple(
+                (id(construct), construct._mutation_state())
+                for constructs in self._constructs.values()
+                for construct in constructs.values()
+            ),
+        )
+        if cache is not None and stamp == cache[2]:
+            # None of these constructs have been modified, so keep
+            # the previous stamp, which has quicker comparisons by
+            # identity
+            stamp = cache[2]
+
+        self._mutation_stamps = (version, count, stamp)
+        return stamp
+
     @classmethod
     def _matching_values(cls, value0, construct, value1, basic=False):
         """Whether or not two values are the same.
@@ -1628,6 +1854,54 @@ class Constructs(Container, core_Constructs):
             out, _ = self._filter_preprocess(self, todict=todict)
             return out
 
+        if not _identity_config:
+            return self._filter_memoised(
+                ("filter", axis_mode, property_mode, filters),
+                todict,
+                self._filter_chain,
+                filters,
+                todict,
+                axis_mode,
+                property_mode,
+                _identity_config,
+            )
+
+        return self._filter_chain(
+            filters, todict, axis_mode, property_mode, _identity_config
+        )
+
+    def _filter_chain(
+        self, filters, todict, axis_mode, property_mode, _identity_config
+    ):
+        """Worker function for `filter`.
+
+        See `filter` for details.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            filters: `dict`
+                The filters to apply, keyed by filter method name.
+
+            todict: `bool`
+                See `filter`.
+
+            axis_mode: `str`
+                See `filter`.
+
+            property_mode: `str`
+                See `filter`.
+
+            _identity_config: `dict`
+                See `filter`.
+
+        :Returns:
+
+            `Constructs` or `dict`
+                The selected constructs.
+
+        """
         out = self
 
         for method, args in filters.items():
@@ -1791,31 +2065,34 @@ class Constructs(Container, core_Constructs):
 
         axes = set(axes2)
 
-        data_axes = self._construct_axes
-
-        for cid in tuple(out):
-            x = data_axes.get(cid)
-            if x is None:
-                pop(cid)
-                continue
+        # Find the constructs that span the axes from the reverse
+        # index of domain axes to constructs
+        axis_constructs = self._axis_constructs
+        spanning = [set(axis_constructs.get(axis, ())) for axis in axes]
+        if _or or _subset:
+            matched = set().union(*spanning)
+        else:
+            matched = set.intersection(*spanning)
 
-            ok = True
+        if _exact or _subset:
+            data_axes = self._construct_axes
             if _exact:
-                if set(x) != axes:
-                    ok = False
-            elif _subset:
-                if not set(x).issubset(axes):
-                    ok = False
+                matched = {
+                    cid for cid in matched if set(data_axes[cid]) == axes
+                }
             else:
-                for axis_key in axes:
-                    ok = axis_key in x
-                    if _or:
-                        if ok:
-                            break
-                    elif not ok:
-                        break
+                matched = {
+                    cid for cid in matched if axes.issuperset(data_axes[cid])
+                }
 
-            if not ok:
+                # Constructs that span no domain axes are a subset of
+                # any domain axes
+                matched.update(
+                    cid for cid in out if data_axes.get(cid, True) == ()
+                )
+
+        for cid in tuple(out):
+            if cid not in matched:
                 pop(cid)
 
         return out
@@ -1934,7 +2211,15 @@ class Constructs(Container, core_Constructs):
         if cached is not None:
             return cached
 
-        return self._filter_by_axis(self, axes, todict, axis_mode)
+        return self._filter_memoised(
+            ("filter_by_axis", axes, axis_mode),
+            todict,
+            self._filter_by_axis,
+            self,
+            axes,
+            todict,
+            axis_mode,
+        )
 
     def _filter_by_cell(self, arg, cells, todict):
         """Worker function for `filter_by_cell` and `filter`.
@@ -2019,7 +2304,14 @@ class Constructs(Container, core_Constructs):
         if cached is not None:
             return cached
 
-        return self._filter_by_cell(self, cells, todict)
+        return self._filter_memoised(
+            ("filter_by_cell", cells),
+            todict,
+            self._filter_by_cell,
+            self,
+            cells,
+            todict,
+        )
 
     def _filter_by_connectivity(self, arg, connectivities, todict):
         """Worker function for `filter_by_connectivity` and `filter`.
@@ -2109,7 +2401,14 @@ class Constructs(Container, core_Constructs):
         if cached is not None:
             return cached
 
-        return self._filter_by_connectivity(self, connectivities, todict)
+        return self._filter_memoised(
+            ("filter_by_connectivity", connectivities),
+            todict,
+            self._filter_by_connectivity,
+            self,
+            connectivities,
+            todict,
+        )
 
     def _filter_by_data(self, arg, ignored, todict, filter_applied=None):
         """Worker function for `filter_by_data` and `filter`.
@@ -2168,7 +2467,14 @@ class Constructs(Container, core_Constructs):
         if cached is not None:
             return cached
 
-        return self._filter_by_data(self, None, todict, filter_applied=None)
+        return self._filter_memoised(
+            ("filter_by_data",),
+            todict,
+            self._filter_by_data,
+            self,
+            None,
+            todict,
+        )
 
     def _filter_by_identity(self, arg, identities, todict, _config):
         """Worker function for `filter_by_identity` and `filter`.
@@ -2232,30 +2538,50 @@ class Constructs(Container, core_Constructs):
 
                 identities_kwargs["short"] = short
 
-            # Dictionary of construct identifiers and construct
-            # identity generators
-            generators = {
-                cid: construct.identities(generator=True, **identities_kwargs)
-                for cid, construct in constructs.items()
-            }
-
-            for values in zip_longest(*generators.values(), fillvalue=None):
-                # Loop round the each construct's next identity
-                for (cid, generator), value1 in zip(
-                    generators.items(), values
-                ):
-                    if value1 is None:
-                        # This construct has run out of identities
-                        continue
+            index = None
+            if len(identities_kwargs) == 1 and all(
+                isinstance(value0, str) for value0 in identities
+            ):
+                # All of the given values are strings, so they can be
+                # looked up in the cached index of construct
+                # identities
+                index = self._identity_index(identities_kwargs["short"])
 
-                    # Loop round the given values
-                    for value0 in identities:
-                        if self._matching_values(
-                            value0, None, value1, basic=True
-                        ):
+            if index is not None:
+                for value0 in identities:
+                    for cid in index.get(value0, ()):
+                        if cid in constructs:
                             hits.append(value0)
                             matched.add(cid)
-                            break
+            else:
+                # Dictionary of construct identifiers and construct
+                # identity generators
+                generators = {
+                    cid: construct.identities(
+                        generator=True, **identities_kwargs
+                    )
+                    for cid, construct in constructs.items()
+                }
+
+                for values in zip_longest(
+                    *generators.values(), fillvalue=None
+                ):
+                    # Loop round the each construct's next identity
+                    for (cid, generator), value1 in zip(
+                        generators.items(), values
+                    ):
+                        if value1 is None:
+                            # This construct has run out of identities
+                            continue
+
+                        # Loop round the given values
+                        for value0 in identities:
+                            if self._matching_values(
+                                value0, None, value1, basic=True
+                            ):
+                                hits.append(value0)
+                                matched.add(cid)
+                                break
 
         if return_matched:
             hits = set(hits)
@@ -2359,7 +2685,18 @@ class Constructs(Container, core_Constructs):
         if cached is not None:
             return cached
 
-        return self._filter_by_identity(self, identities, todict, _config)
+        if _config:
+            return self._filter_by_identity(self, identities, todict, _config)
+
+        return self._filter_memoised(
+            ("filter_by_identity", identities),
+            todict,
+            self._filter_by_identity,
+            self,
+            identities,
+            todict,
+            {},
+        )
 
     def _filter_by_key(self, arg, keys, todict):
         """Worker function for `filter_by_key` and `filter`.
@@ -2439,7 +2776,14 @@ class Constructs(Container, core_Constructs):
         if cached is not None:
             return cached
 
-        return self._filter_by_key(self, keys, todict)
+        return self._filter_memoised(
+            ("filter_by_key", keys),
+            todict,
+            self._filter_by_key,
+            self,
+            keys,
+            todict,
+        )
 
     def _filter_by_measure(self, arg, measures, todict):
         """Worker function for `filter_by_measure` and `filter`.
@@ -2534,7 +2878,14 @@ class Constructs(Container, core_Constructs):
         if cached is not None:
             return cached
 
-        return self._filter_by_measure(self, measures, todict)
+        return self._filter_memoised(
+            ("filter_by_measure", measures),
+            todict,
+            self._filter_by_measure,
+            self,
+            measures,
+            todict,
+        )
 
     def _filter_by_method(self, arg, methods, todict):
         """Worker function for `filter_by_method` and `filter`.
@@ -2624,7 +2975,14 @@ class Constructs(Container, core_Constructs):
         if cached is not None:
             return cached
 
-        return self._filter_by_method(self, methods, todict)
+        return self._filter_memoised(
+            ("filter_by_method", methods),
+            todict,
+            self._filter_by_method,
+            self,
+            methods,
+            todict,
+        )
 
     def _filter_by_naxes(self, arg, naxes, todict):
         """Worker function for `filter_by_naxes` and `filter`.
@@ -2712,7 +3070,14 @@ class Constructs(Container, core_Constructs):
         if cached is not None:
             return cached
 
-        return self._filter_by_naxes(self, naxes, todict)
+        return self._filter_memoised(
+            ("filter_by_naxes", naxes),
+            todict,
+            self._filter_by_naxes,
+            self,
+            naxes,
+            todict,
+        )
 
     def _filter_by_ncdim(self, arg, ncdims, todict):
         """Worker function for `filter_by_ncdim` and `filter`.
@@ -2810,7 +3175,14 @@ class Constructs(Container, core_Constructs):
         if cached is not None:
             return cached
 
-        return self._filter_by_ncdim(self, ncdims, todict)
+        return self._filter_memoised(
+            ("filter_by_ncdim", ncdims),
+            todict,
+            self._filter_by_ncdim,
+            self,
+            ncdims,
+            todict,
+        )
 
     def _filter_by_ncvar(self, arg, ncvars, todict):
         """Worker function for `filter_by_ncvar` and `filter`.
@@ -2907,7 +3279,14 @@ class Constructs(Container, core_Constructs):
         if cached is not None:
             return cached
 
-        return self._filter_by_ncvar(self, ncvars, todict)
+        return self._filter_memoised(
+            ("filter_by_ncvar", ncvars),
+            todict,
+            self._filter_by_ncvar,
+            self,
+            ncvars,
+            todict,
+        )
 
     def _filter_by_property(self, arg, properties, todict, property_mode):
         """Worker function for `filter_by_property` and `filter`.
@@ -3159,7 +3538,14 @@ class Constructs(Container, core_Constructs):
         if cached is not None:
             return cached
 
-        return self._filter_by_size(self, sizes, todict)
+        return self._filter_memoised(
+            ("filter_by_size", sizes),
+            todict,
+            self._filter_by_size,
+            self,
+            sizes,
+            todict,
+        )
 
     def _filter_by_type(self, arg, types, todict, filter_applied=None):
         """Worker function for `filter_by_type` and `filter`.
@@ -3250,7 +3636,14 @@ class Constructs(Container, core_Constructs):
         if cached is not None:
             return cached
 
-        return self._filter_by_type(self, types, todict)
+        return self._filter_memoised(
+            ("filter_by_type", types),
+            todict,
+            self._filter_by_type,
+            self,
+            types,
+            todict,
+        )
 
     def filters_applied(self):
         """A history of filters that have been applied.
@@ -21,6 +21,21 @@ class Container(metaclass=DocstringRewriteMeta):
 
     """
 
+    # The number of modifications, made to any container, that could
+    # change the outcome of filtering metadata constructs (e.g. by
+    # identity or size). Used as a cheap test of whether or not
+    # cached indices of construct identities and memoised filter
+    # results need to be revalidated.
+    #
+    # .. versionadded:: (cfdm) NEXTVERSION
+    _mutation_count = 0
+
+    # The number of such modifications made to this container. Set
+    # on the instance by `_record_mutation`.
+    #
+    # .. versionadded:: (cfdm) NEXTVERSION
+    _mutations = 0
+
     def __init__(self, source=None, copy=True):
         """**Initialisation**
 
@@ -199,6 +214,56 @@ class Container(metaclass=DocstringRewriteMeta):
                 f"{self.__class__.__name__} has no {component!r} component",
             )
 
+    def _mutation_state(self):
+        """Return a record of the modifications made to the container.
+
+        The record changes whenever `_record_mutation` is called on
+        the container, or on any container that is one of its
+        components (such as bounds or a datum), other than its data.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        .. seealso:: `_record_mutation`
+
+        :Returns:
+
+            `tuple`
+                The record of modifications.
+
+        **Examples**
+
+        >>> f = {{package}}.{{class}}()
+        >>> f._mutation_state()
+        (0,)
+
+        """
+        state = [self._mutations]
+        for key, value in self._components.items():
+            if key != "data" and isinstance(value, Container):
+                state.append((key, id(value), value._mutation_state()))
+
+        return tuple(state)
+
+    def _record_mutation(self):
+        """Record a modification that could change filter outcomes.
+
+        Must be called by any method that modifies a component on
+        which the filtering of metadata constructs depends, such as
+        properties, netCDF variable names, or domain axis sizes.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        .. seealso:: `_del_component`, `_mutation_state`,
+                     `_set_component`
+
+        :Returns:
+
+            `None`
+
+        """
+        Container._mutation_count += 1
+        self._mutations += 1
+
     @property
     def _custom(self):
         """Customisable storage for additional attributes.
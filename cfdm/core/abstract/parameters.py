@@ -125,6 +125,7 @@ class Parameters(Container):
         None
 
         """
+        self._record_mutation()
         try:
             return self._get_component("parameters").pop(parameter)
         except KeyError:
@@ -313,6 +314,7 @@ class Parameters(Container):
             parameters = deepcopy(parameters)
 
         self._get_component("parameters").update(parameters)
+        self._record_mutation()
 
     def set_parameter(self, term, value, copy=True):
         """Set a parameter-valued term.
@@ -347,3 +349,4 @@ class Parameters(Container):
             value = deepcopy(value)
 
         self._get_component("parameters")[term] = value
+        self._record_mutation()
@@ -142,6 +142,7 @@ class ParametersDomainAncillaries(Parameters):
         None
 
         """
+        self._record_mutation()
         try:
             return self._get_component("domain_ancillaries").pop(
                 domain_ancillary
@@ -331,6 +332,7 @@ class ParametersDomainAncillaries(Parameters):
 
         """
         self._get_component("domain_ancillaries").update(domain_ancillaries)
+        self._record_mutation()
 
     def set_domain_ancillary(self, term, value, copy=True):
         """Set an domain ancillary-valued term.
@@ -374,3 +376,4 @@ class ParametersDomainAncillaries(Parameters):
 
         """
         self._get_component("domain_ancillaries")[term] = value
+        self._record_mutation()
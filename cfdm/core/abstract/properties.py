@@ -79,6 +79,7 @@ class Properties(Container):
         """
         out = self._get_component("properties")
         self._set_component("properties", {}, copy=False)
+        self._record_mutation()
         return out
 
     def del_property(self, prop, default=ValueError()):
@@ -125,6 +126,7 @@ class Properties(Container):
         None
 
         """
+        self._record_mutation()
         try:
             return self._get_component("properties").pop(prop)
         except KeyError:
@@ -420,6 +422,7 @@ class Properties(Container):
         #            properties = properties.copy()
 
         self._get_component("properties").update(properties)
+        self._record_mutation()
 
     def set_property(self, prop, value, copy=True):
         """Set a property.
@@ -466,3 +469,4 @@ class Properties(Container):
             value = deepcopy(value)
 
         self._get_component("properties")[prop] = value
+        self._record_mutation()
@@ -388,6 +388,7 @@ class PropertiesDataBounds(PropertiesData):
         None
 
         """
+        self._record_mutation()
         return self._del_component("bounds", default=default)
 
     #        try:
@@ -787,6 +788,7 @@ class PropertiesDataBounds(PropertiesData):
             bounds = bounds.copy()
 
         self._set_component("bounds", bounds, copy=False)
+        self._record_mutation()
 
     def set_geometry(self, value):
         """Set the geometry type.
@@ -144,6 +144,7 @@ class CellConnectivity(abstract.Topology):
         None
 
         """
+        self._record_mutation()
         return self._del_component("connectivity", default=default)
 
     def has_connectivity(self):
@@ -270,3 +271,4 @@ class CellConnectivity(abstract.Topology):
 
         """
         self._set_component("connectivity", connectivity, copy=False)
+        self._record_mutation()
@@ -135,6 +135,7 @@ class CellMeasure(abstract.PropertiesData):
         None
 
         """
+        self._record_mutation()
         return self._del_component("measure", default=default)
 
     def has_measure(self):
@@ -242,4 +243,5 @@ class CellMeasure(abstract.PropertiesData):
         None
 
         """
+        self._record_mutation()
         return self._set_component("measure", measure, copy=False)
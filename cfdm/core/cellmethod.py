@@ -214,6 +214,7 @@ class CellMethod(abstract.Container):
         'NO METHOD'
 
         """
+        self._record_mutation()
         return self._del_component("method", default=default)
 
     def del_qualifier(self, qualifier, default=ValueError()):
@@ -256,6 +257,7 @@ class CellMethod(abstract.Container):
         'no qualifier'
 
         """
+        self._record_mutation()
         try:
             return self._get_component("qualifiers").pop(qualifier)
         except KeyError:
@@ -622,6 +624,7 @@ class CellMethod(abstract.Container):
         'NO METHOD'
 
         """
+        self._record_mutation()
         return self._set_component("method", value, copy=False)
 
     def set_qualifier(self, qualifier, value):
@@ -653,3 +656,4 @@ class CellMethod(abstract.Container):
 
         """
         self._get_component("qualifiers")[qualifier] = value
+        self._record_mutation()
@@ -149,6 +149,11 @@ class Constructs(abstract.Container):
             self._non_array_constructs = source._non_array_constructs.copy()
             self._construct_axes = source._construct_axes.copy()
             self._construct_type = source._construct_type.copy()
+            self._key_counter = source._key_counter.copy()
+
+            # A count of the modifications made to the constructs,
+            # stored in a list so that it is shared with any views
+            self._version = [0]
 
             self_construct_axes = self._construct_axes
             self_construct_type = self._construct_type
@@ -199,6 +204,9 @@ class Constructs(abstract.Container):
 
             self._constructs = d
 
+            self._axis_constructs = {}
+            self._index_all_data_axes()
+
             self._ignore = ()
 
             return
@@ -214,6 +222,17 @@ class Constructs(abstract.Container):
 
         self._construct_axes = {}
 
+        # The keys of the constructs that span each domain axis, in
+        # the form of a reverse index of _construct_axes. For
+        # example: {'domainaxis1': {'dimensioncoordinate1': None,
+        #                           'auxiliarycoordinate0': None}}
+        self._axis_constructs = {}
+
+        # For each construct type, the number of the last new
+        # construct key, from which to start searching for an unused
+        # key
+        self._key_counter = {}
+
         # The construct type for each key. For example:
         # {'domainaxis1':'domain_axis',
         #  'auxiliarycoordinate3':'auxiliary_coordinate'}
@@ -221,6 +240,10 @@ class Constructs(abstract.Container):
 
         self._constructs = {}
 
+        # A count of the modifications made to the constructs, stored
+        # in a list so that it is shared with any views
+        self._version = [0]
+
         if auxiliary_coordinate:
             self._key_base["auxiliary_coordinate"] = auxiliary_coordinate
             self._array_constructs.add("auxiliary_coordinate")
@@ -372,8 +395,70 @@ class Constructs(abstract.Container):
         raised
 
         """
+        self._version[0] += 1
+        self._index_data_axes(k)
         return self._construct_axes.pop(k, *d)
 
+    def _index_all_data_axes(self):
+        """Rebuild the reverse index of domain axes to constructs.
+
+        The index is updated in-place, so that it remains shared with
+        any views.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        .. seealso:: `_index_data_axes`
+
+        :Returns:
+
+            `None`
+
+        """
+        axis_constructs = self._axis_constructs
+        axis_constructs.clear()
+        for key, axes in self._construct_axes.items():
+            for axis in axes:
+                axis_constructs.setdefault(axis, {})[key] = None
+
+    def _index_data_axes(self, key, axes=None):
+        """Update the reverse index of domain axes to constructs.
+
+        The construct is removed from the index entries of the domain
+        axes that it currently spans and, if *axes* is set, added to
+        the index entries of the new domain axes. Must be called
+        before the construct's domain axes are changed.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        .. seealso:: `_index_all_data_axes`
+
+        :Parameters:
+
+            key: `str`
+                The construct identifier.
+
+            axes: `tuple` or `None`, optional
+                The new domain axes spanned by the construct. If
+                `None` (the default) then the construct is removed
+                from the index.
+
+        :Returns:
+
+            `None`
+
+        """
+        axis_constructs = self._axis_constructs
+        for axis in self._construct_axes.get(key, ()):
+            keys = axis_constructs.get(axis)
+            if keys is not None:
+                keys.pop(key, None)
+                if not keys:
+                    del axis_constructs[axis]
+
+        if axes is not None:
+            for axis in axes:
+                axis_constructs.setdefault(axis, {})[key] = None
+
     def _view(self, ignore=()):
         """Returns a new container with a view of the same constructs.
 
@@ -483,15 +568,15 @@ class Constructs(abstract.Container):
         >>> x = c._del_construct('auxiliarycoordinate2')
 
         """
-        data_axes = self.data_axes()
-
         domain_axes = self._construct_dict("domain_axis")
 
         if key in domain_axes:
             # Fail if the domain axis construct is spanned by a data
             # array
-            for xid, axes in data_axes.items():
-                if key in axes:
+            ignore = self._ignore
+            construct_type = self._construct_type
+            for xid in self._axis_constructs.get(key, ()):
+                if construct_type.get(xid) not in ignore:
                     if default is None:
                         return default
 
@@ -662,6 +747,7 @@ class Constructs(abstract.Container):
 
         # Insert the construct
         self._constructs[construct_type][key] = construct
+        self._version[0] += 1
 
         # Return the identifier of the construct
         return key
@@ -750,7 +836,10 @@ class Constructs(abstract.Container):
         except AttributeError:
             pass
 
-        self._construct_axes[key] = tuple(axes)
+        axes = tuple(axes)
+        self._index_data_axes(key, axes)
+        self._construct_axes[key] = axes
+        self._version[0] += 1
 
     # ----------------------------------------------------------------
     # Private dictionary-like methods
@@ -766,8 +855,11 @@ class Constructs(abstract.Container):
         self._array_constructs.clear()
         self._non_array_constructs.clear()
         self._construct_axes.clear()
+        self._axis_constructs.clear()
+        self._key_counter.clear()
         self._construct_type.clear()
         self._constructs.clear()
+        self._version[0] += 1
 
     def _pop(self, k, *d):
         """Removes specified key and returns the corresponding value.
@@ -781,6 +873,7 @@ class Constructs(abstract.Container):
         if construct_type is not None:
             self._del_data_axes(k, None)
             del self._construct_type[k]
+            self._version[0] += 1
             return self._constructs[construct_type].pop(k)
 
         if d:
@@ -802,6 +895,15 @@ class Constructs(abstract.Container):
         self._construct_axes.update(other._construct_axes)
         self._construct_type.update(other._construct_type)
         self._constructs.update(other._constructs)
+        self._index_all_data_axes()
+
+        key_counter = self._key_counter
+        for construct_type, n in other._key_counter.items():
+            key_counter[construct_type] = max(
+                n, key_counter.get(construct_type, 0)
+            )
+
+        self._version[0] += 1
 
     # ----------------------------------------------------------------
     # Dictionary-like methods
@@ -1290,13 +1392,17 @@ class Constructs(abstract.Container):
 
         keys = self._constructs[construct_type]
 
-        n = len(keys)
+        # Start searching from the number of the last new key, if
+        # that is larger than the number of keys, so that the search
+        # is short even after constructs have been removed
+        n = max(self._key_counter.get(construct_type, 0), len(keys))
         key_base = self._key_base[construct_type]
         key = f"{key_base}{n}"
         while key in keys:
             n += 1
             key = f"{key_base}{n}"
 
+        self._key_counter[construct_type] = n
         return key
 
     def replace(self, key, construct, axes=None, copy=True):
@@ -1310,12 +1416,15 @@ class Constructs(abstract.Container):
             raise ValueError(f"Can't replace non-existent construct {key!r}")
 
         if axes is not None and construct_type in self._array_constructs:
-            self._construct_axes[key] = tuple(axes)
+            axes = tuple(axes)
+            self._index_data_axes(key, axes)
+            self._construct_axes[key] = axes
 
         if copy:
             construct = construct.copy()
 
         self._constructs[construct_type][key] = construct
+        self._version[0] += 1
 
     def shallow_copy(self, _ignore=None):
         """Return a shallow copy.
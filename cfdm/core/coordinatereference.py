@@ -333,6 +333,7 @@ class CoordinateReference(abstract.Container):
         coordinates = self._get_component("coordinates")
         if key in coordinates:
             coordinates.remove(key)
+            self._record_mutation()
             return key
 
         if default is None:
@@ -554,6 +555,7 @@ class CoordinateReference(abstract.Container):
         """
         c = self._get_component("coordinates")
         c.add(key)
+        self._record_mutation()
 
     def set_coordinates(self, coordinates):  # SB NOTE: flaky doctest set order
         """Set references to coordinate constructs.
@@ -599,6 +601,7 @@ class CoordinateReference(abstract.Container):
             coordinates = (coordinates,)
 
         self._get_component("coordinates").update(coordinates)
+        self._record_mutation()
 
     def set_coordinate_conversion(self, coordinate_conversion, copy=True):
         """Set the coordinate conversion component.
@@ -644,6 +647,7 @@ class CoordinateReference(abstract.Container):
         self._set_component(
             "coordinate_conversion", coordinate_conversion, copy=False
         )
+        self._record_mutation()
 
     def set_datum(self, datum, copy=True):
         """Set the datum component.
@@ -105,6 +105,7 @@ class DomainAxis(abstract.Container):
         None
 
         """
+        self._record_mutation()
         return self._del_component("size", default=default)
 
     def has_size(self):
@@ -216,3 +217,4 @@ class DomainAxis(abstract.Container):
 
         """
         self._set_component("size", size, copy=False)
+        self._record_mutation()
@@ -172,6 +172,7 @@ class DomainTopology(abstract.Topology):
         None
 
         """
+        self._record_mutation()
         return self._del_component("cell", default=default)
 
     def get_cell(self, default=ValueError()):
@@ -300,3 +301,4 @@ class DomainTopology(abstract.Topology):
             )
 
         self._set_component("cell", cell, copy=False)
+        self._record_mutation()
@@ -8,6 +8,11 @@ from .. import _docstring_substitutions
 
 base = compile("{{.*?}}")
 
+# The substitutions found in each docstring template, keyed by the
+# template. Templates are typically shared by many classes, so it is
+# faster to only search each one once.
+_template_substitutions = {}
+
 
 class DocstringRewriteMeta(type):
     """Modify docstrings at time of import.
@@ -202,20 +207,19 @@ class DocstringRewriteMeta(type):
         # ------------------------------------------------------------
         # Now loop round the parent classes, copying any methods that
         # they override and rewriting those docstrings.
+        #
+        # A method whose copy would have the same docstring as the
+        # inherited method is not copied, which saves time at import.
         # ------------------------------------------------------------
+        uncopied = {}
         for parent in parents:
             for attr_name in dir(parent):
-                if attr_name in attrs:
+                if attr_name in attrs or attr_name in uncopied:
                     # We already have this method from higher up in
                     # the method resolution order, so do not overwrite
                     # it and move on to to the next method.
                     continue
 
-                # ----------------------------------------------------
-                # Get the original method, copy it, update the
-                # docstring, and put the mosfied copy back into the
-                # parent class.
-                # ----------------------------------------------------
                 original_f = getattr(parent, attr_name)
 
                 # Skip special methods that aren't functions
@@ -227,92 +231,24 @@ class DocstringRewriteMeta(type):
                 if attr_name in method_exclusions:
                     continue
 
-                is_classmethod = False
-                is_staticmethod = False
-                is_wrapped = False
-
-                try:
-                    if hasattr(original_f, "fget"):
-                        # The original function is decorated with
-                        # @property
-                        attr = type(original_f)(
-                            original_f.fget, original_f.fset, original_f.fdel
-                        )
-                    else:
-                        if not inspect.isroutine(original_f):
-                            continue
-
-                        if inspect.ismethod(original_f):
-                            is_classmethod = True
-                        elif isinstance(
-                            parent.__dict__.get(attr_name), staticmethod
-                        ):
-                            is_staticmethod = True
-
-                        is_wrapped = hasattr(original_f, "__wrapped__")
-
-                        f = getattr(original_f, "__func__", original_f)
-
-                        # Copy the method
-                        attr = type(f)(
-                            f.__code__,
-                            f.__globals__,
-                            f.__name__,
-                            f.__defaults__,
-                            f.__closure__,
-                        )
-                        # Make sure that the keyword argument defaults
-                        # are set correctly. In general they will be,
-                        # but not if there is a variable number of
-                        # positional arguments, such as in: def
-                        # foo(self, *x, y=None)
-                        attr.__kwdefaults__ = f.__kwdefaults__
-
-                        if is_wrapped:
-                            attr.__doc__ = original_f.__doc__
-
-                    # Update the docstring
-                    DocstringRewriteMeta._docstring_update(
-                        package_name,
-                        class_name,
-                        class_name_lower,
-                        attr,
-                        attr_name,
-                        docstring_rewrite,
-                    )
-
-                    # Register a classmethod
-                    if is_classmethod:
-                        attr = classmethod(attr)
-
-                    # Register a classmethod
-                    if is_staticmethod:
-                        attr = staticmethod(attr)
-
-                    if is_wrapped:
-                        # Copy the wrapper and update its wrapped
-                        # function
-                        wrapper = type(original_f)(
-                            original_f.__code__,
-                            original_f.__globals__,
-                            original_f.__name__,
-                            original_f.__defaults__,
-                            original_f.__closure__,
-                        )
-
-                        wrapper.__wrapped__ = attr
-                        wrapper.__doc__ = attr.__doc__
-                        attr = wrapper
-
-                    # Put the modified method back into the parent
-                    # class
-                    attrs[attr_name] = attr
+                if DocstringRewriteMeta._docstring_unchanged(original_f):
+                    uncopied[attr_name] = (parent, original_f)
+                    continue
 
-                except Exception:
-                    pass
-        #                    raise RuntimeError(str(error) + ': ' +
-        #                                       '.'.join([parent.__name__,
-        #                                                 attr_name]))
+                # Get the original method, copy it, update the
+                # docstring, and put the modified copy into the new
+                # class.
+                attr = DocstringRewriteMeta._docstring_copy(
+                    parent,
+                    attr_name,
+                    original_f,
+                    package_name,
+                    class_name,
+                    class_name_lower,
+                    docstring_rewrite,
+                )
+                if attr is not None:
+                    attrs[attr_name] = attr
 
         # ------------------------------------------------------------
         # Rewrite the docstring of the class itself.
@@ -373,7 +309,33 @@ class DocstringRewriteMeta(type):
         # ------------------------------------------------------------
         # Create the class
         # ------------------------------------------------------------
-        return super().__new__(cls, class_name, parents, attrs)
+        new_class = super().__new__(cls, class_name, parents, attrs)
+
+        # ------------------------------------------------------------
+        # Copy any uncopied methods that the new class would not
+        # inherit from the parent class they were found in (as can
+        # happen with multiple inheritance).
+        # ------------------------------------------------------------
+        for attr_name, (parent, original_f) in uncopied.items():
+            inherited = getattr(new_class, attr_name, None)
+            if inherited is original_f or getattr(
+                inherited, "__func__", inherited
+            ) is getattr(original_f, "__func__", original_f):
+                continue
+
+            attr = DocstringRewriteMeta._docstring_copy(
+                parent,
+                attr_name,
+                original_f,
+                package_name,
+                class_name,
+                class_name_lower,
+                docstring_rewrite,
+            )
+            if attr is not None:
+                setattr(new_class, attr_name, attr)
+
+        return new_class
 
     @classmethod
     def _docstring_special_substitutions(cls):
@@ -569,6 +531,175 @@ class DocstringRewriteMeta(type):
 
         return set(out)
 
+    @staticmethod
+    def _docstring_unchanged(original_f):
+        """Whether a copied method would have the same docstring.
+
+        A copy of an inherited method made by `_docstring_copy` gets
+        its docstring from the template of the original method. If
+        the template has no substitutions and is the same as the
+        docstring of the inherited method then the copy is
+        unnecessary.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            original_f:
+                The inherited method.
+
+        :Returns:
+
+            `bool`
+                `True` if a copy of the method would have the same
+                docstring, otherwise `False`.
+
+        """
+        if hasattr(original_f, "fget"):
+            # @property
+            template = getattr(original_f.fget, "__doc__", None)
+        elif not inspect.isroutine(original_f):
+            return False
+        elif hasattr(original_f, "__wrapped__"):
+            template = original_f.__doc__
+        else:
+            # A copied function gets its docstring from its code
+            # object
+            f = getattr(original_f, "__func__", original_f)
+            try:
+                template = f.__code__.co_consts[0]
+            except (AttributeError, IndexError):
+                return False
+
+            if not isinstance(template, str):
+                template = None
+
+        if template is not None and "{{" in template:
+            return False
+
+        return template == original_f.__doc__
+
+    @staticmethod
+    def _docstring_copy(
+        parent,
+        attr_name,
+        original_f,
+        package_name,
+        class_name,
+        class_name_lower,
+        config,
+    ):
+        """Copy an inherited method and rewrite its docstring.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            parent: class
+                The parent class from which the method is inherited.
+
+            attr_name: `str`
+                The method name.
+
+            original_f:
+                The inherited method.
+
+            package_name: `str`
+                The name of the package containing the class.
+
+            class_name: `str`
+                The name of the class.
+
+            class_name_lower: `str`
+                The lower case name of the class.
+
+            config: `dict`
+                A dictionary containing the general docstring
+                substitutions.
+
+        :Returns:
+
+                The copied method, or `None` if the method could not
+                be copied.
+
+        """
+        is_classmethod = False
+        is_staticmethod = False
+        is_wrapped = False
+
+        try:
+            if hasattr(original_f, "fget"):
+                # The original function is decorated with @property
+                attr = type(original_f)(
+                    original_f.fget, original_f.fset, original_f.fdel
+                )
+            else:
+                if not inspect.isroutine(original_f):
+                    return
+
+                if inspect.ismethod(original_f):
+                    is_classmethod = True
+                elif isinstance(parent.__dict__.get(attr_name), staticmethod):
+                    is_staticmethod = True
+
+                is_wrapped = hasattr(original_f, "__wrapped__")
+
+                f = getattr(original_f, "__func__", original_f)
+
+                # Copy the method
+                attr = type(f)(
+                    f.__code__,
+                    f.__globals__,
+                    f.__name__,
+                    f.__defaults__,
+                    f.__closure__,
+                )
+                # Make sure that the keyword argument defaults are
+                # set correctly. In general they will be, but not if
+                # there is a variable number of positional arguments,
+                # such as in: def foo(self, *x, y=None)
+                attr.__kwdefaults__ = f.__kwdefaults__
+
+                if is_wrapped:
+                    attr.__doc__ = original_f.__doc__
+
+            # Update the docstring
+            DocstringRewriteMeta._docstring_update(
+                package_name,
+                class_name,
+                class_name_lower,
+                attr,
+                attr_name,
+                config,
+            )
+
+            # Register a classmethod
+            if is_classmethod:
+                attr = classmethod(attr)
+
+            # Register a staticmethod
+            if is_staticmethod:
+                attr = staticmethod(attr)
+
+            if is_wrapped:
+                # Copy the wrapper and update its wrapped function
+                wrapper = type(original_f)(
+                    original_f.__code__,
+                    original_f.__globals__,
+                    original_f.__name__,
+                    original_f.__defaults__,
+                    original_f.__closure__,
+                )
+
+                wrapper.__wrapped__ = attr
+                wrapper.__doc__ = attr.__doc__
+                attr = wrapper
+
+            return attr
+
+        except Exception:
+            return
+
     @classmethod
     def _docstring_update(
         cls,
@@ -632,13 +763,15 @@ class DocstringRewriteMeta(type):
         if doc is None:
             return
 
-        substitutions = base.findall(doc)
+        substitutions = _template_substitutions.get(doc)
+        if substitutions is None:
+            # Remove duplicates
+            substitutions = frozenset(base.findall(doc))
+            _template_substitutions[doc] = substitutions
+
         if substitutions:
             _docstring_substitutions[1] += 1
 
-            # Remove duplicates
-            substitutions = set(substitutions)
-
             # Special substitutions
             if "{{package}}" in substitutions:
                 # Insert the name of the package
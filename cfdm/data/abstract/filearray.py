@@ -1,4 +1,5 @@
 from copy import deepcopy
+from functools import partial
 from os import sep
 from os.path import join
 
@@ -14,6 +15,11 @@ class FileArray(Array):
 
     """
 
+    # Whether or not to share open datasets via the pool of open
+    # datasets. Subclasses that set this to True must release
+    # datasets in their `close` method with `_release`.
+    _pool_datasets = False
+
     def __init__(
         self,
         filename=None,
@@ -146,6 +152,25 @@ class FileArray(Array):
         # By default, close the netCDF file after data array access
         self._set_component("close", True, copy=False)
 
+    def __getstate__(self):
+        """Return the state of the instance for pickling.
+
+        The open dataset variable object, if there is one, is not
+        included, since it can not be pickled and will be re-created
+        from the file when required.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        """
+        state = self.__dict__.copy()
+        components = state.get("_components")
+        if components is not None and "variable" in components:
+            components = components.copy()
+            del components["variable"]
+            state["_components"] = components
+
+        return state
+
     def __getitem__(self, indices):
         """Return a subspace of the array.
 
@@ -251,6 +276,34 @@ class FileArray(Array):
             f"Must implement {self.__class__.__name__}.close"
         )  # pragma: no cover
 
+    def _release(self, dataset):
+        """Return a dataset to the pool of open datasets.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        .. seealso:: `close`, `open`
+
+        :Parameters:
+
+            dataset:
+                The dataset returned by `open`.
+
+        :Returns:
+
+            `bool`
+                True if the dataset is managed by the pool, in which
+                case it must not be closed. False if the dataset is
+                not managed by the pool, in which case it should be
+                closed.
+
+        """
+        if not self._pool_datasets:
+            return False
+
+        from ..datasetpool import dataset_pool
+
+        return dataset_pool.release(dataset)
+
     def get_address(self, default=AttributeError()):
         """The name of the file containing the array.
 
@@ -471,8 +524,16 @@ class FileArray(Array):
     def open(self, func, *args, **kwargs):
         """Return a dataset file object and address.
 
+        If the class attribute `_pool_datasets` is True then the
+        dataset is retrieved from, or added to, the pool of open
+        datasets, and so may have been opened by a previous call. In
+        this case the dataset must only be closed with the `close`
+        method, which returns it to the pool.
+
         .. versionadded:: (cfdm) 1.10.1.0
 
+        .. seealso:: `close`, `{{package}}.dataset_pool_size`
+
         :Parameters:
 
             func: callable
@@ -487,10 +548,57 @@ class FileArray(Array):
                 The file object for the dataset, and the address of
                 the data within the file.
 
+        """
+        filename = self.get_filename(normalise=True)
+
+        if not self._pool_datasets:
+            dataset = self._open(filename, func, *args, **kwargs)
+            return dataset, self.get_address()
+
+        from dask.base import tokenize
+
+        from ..datasetpool import dataset_pool
+
+        key = (
+            filename,
+            func,
+            args,
+            tokenize(kwargs, self._get_component("storage_options", None)),
+        )
+        dataset = dataset_pool.acquire(
+            key,
+            filename,
+            partial(self._open, filename, func, *args, **kwargs),
+        )
+
+        # Successfully opened a dataset, so return.
+        return dataset, self.get_address()
+
+    def _open(self, filename, func, *args, **kwargs):
+        """Open a dataset.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        .. seealso:: `open`
+
+        :Parameters:
+
+            filename: `str`
+                The normalised name of the dataset.
+
+            func: callable
+                Function that opens a file.
+
+            args, kwargs: optional
+                Optional arguments to *func*.
+
+        :Returns:
+
+                The file object for the dataset.
+
         """
         from urllib.parse import urlparse
 
-        filename = self.get_filename(normalise=True)
         url = urlparse(filename)
         if url.scheme == "file":
             # Convert a file URI into an absolute local path
@@ -506,15 +614,12 @@ class FileArray(Array):
             filename = fs.open(url.path[1:], "rb")
 
         try:
-            dataset = func(filename, *args, **kwargs)
+            return func(filename, *args, **kwargs)
         except FileNotFoundError:
             raise FileNotFoundError(f"No such file: {filename}")
         except RuntimeError as error:
             raise RuntimeError(f"{error}: {filename}")
 
-        # Successfully opened a dataset, so return.
-        return dataset, self.get_address()
-
     def replace_directory(self, old=None, new=None, normalise=False):
         """Replace the file directory.
 
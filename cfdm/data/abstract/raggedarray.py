@@ -1,6 +1,8 @@
 from itertools import accumulate
 from numbers import Number
 
+import numpy as np
+
 from ..subarray import RaggedSubarray
 from .compressedarray import CompressedArray
 
@@ -107,12 +109,143 @@ class RaggedArray(CompressedArray):
             except AttributeError:
                 count_variable = None
 
+            try:
+                offset_index = source._get_component("offset_index", None)
+            except AttributeError:
+                offset_index = None
+        else:
+            offset_index = None
+
+        if offset_index is None:
+            # Initialise the offset index, which is created when it is
+            # first needed, and is shared with all copies
+            offset_index = {}
+
+        self._set_component("offset_index", offset_index, copy=False)
+
         if index_variable is not None:
             self._set_component("index_variable", index_variable, copy=copy)
 
         if count_variable is not None:
             self._set_component("count_variable", count_variable, copy=copy)
 
+    def _ragged_features(self, index, features, batch_size):
+        """Iterate over features read from the compressed data.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        .. seealso:: `ragged_features`
+
+        :Parameters:
+
+            index: `dict`
+                The offset index, as returned by `offset_index`.
+
+            features: `numpy.ndarray`
+                The positions of the features to iterate over along
+                the uncompressed instance dimension.
+
+            batch_size: `int` or `None`
+                The number of features in each batch, or `None` to
+                iterate over individual features.
+
+        :Returns:
+
+            generator
+                The features, or lists of features if *batch_size* is
+                not `None`.
+
+        """
+
+        def _ranges(starts, sizes):
+            """Concatenate the ranges defined by starts and sizes."""
+            ends = np.cumsum(sizes)
+            return np.repeat(starts - ends + sizes, sizes) + np.arange(
+                ends[-1] if ends.size else 0
+            )
+
+        offsets = index["offsets"]
+        order = index["order"]
+        profile_offsets = index["profile_offsets"]
+
+        data = self.source()
+        try:
+            # Read directly from the array underlying compressed
+            # `Data`, if it still has one, to avoid computing a dask
+            # graph for each read
+            data = data.source(data)
+        except AttributeError:
+            pass
+
+        d1 = self.get_compressed_dimension()
+        shape = list(data.shape)
+
+        size = 1 if batch_size is None else batch_size
+        for i in range(0, features.size, size):
+            batch = features[i : i + size]
+
+            # Find the locations of the batch's elements in the
+            # sample dimension, in feature order
+            starts = offsets[batch]
+            n_units = offsets[batch + 1] - starts
+            units = _ranges(starts, n_units)
+            if order is not None:
+                units = order[units]
+
+            if profile_offsets is None:
+                sizes = n_units
+                positions = units
+            else:
+                # Each unit is a profile, whose elements are
+                # contiguous
+                starts = profile_offsets[units]
+                sizes = profile_offsets[units + 1] - starts
+                positions = _ranges(starts, sizes)
+
+            # Read the elements from the compressed data in a single
+            # operation, in the order in which they are stored
+            if positions.size:
+                (positions, inverse) = np.unique(
+                    positions, return_inverse=True
+                )
+                indices = [slice(None)] * len(shape)
+                if positions[-1] - positions[0] + 1 == positions.size:
+                    indices[d1] = slice(
+                        int(positions[0]), int(positions[-1]) + 1
+                    )
+                else:
+                    indices[d1] = positions
+
+                values = np.asanyarray(data[tuple(indices)])
+                if np.ma.isMA(values) and not np.ma.is_masked(values):
+                    values = np.array(values)
+
+                if (
+                    positions.size < inverse.size
+                    or (np.diff(inverse) < 0).any()
+                ):
+                    values = values.take(inverse, axis=d1)
+            else:
+                shape[d1] = 0
+                values = np.empty(shape, dtype=self.dtype)
+
+            # Split the elements into features (or profiles)
+            values = np.split(values, np.cumsum(sizes)[:-1], axis=d1)
+            if profile_offsets is not None:
+                # Group the profiles into features
+                values = [
+                    values[start:stop]
+                    for start, stop in zip(
+                        accumulate([0] + n_units[:-1].tolist()),
+                        accumulate(n_units.tolist()),
+                    )
+                ]
+
+            if batch_size is None:
+                yield values[0]
+            else:
+                yield values
+
     def _uncompressed_descriptors(self, u_dims, shapes):
         """Create descriptors of uncompressed subarrays.
 
@@ -167,6 +300,79 @@ class RaggedArray(CompressedArray):
         """Data-type of the uncompressed data."""
         return self.source().dtype
 
+    def feature_indices(self, feature):
+        """The compressed data indices of a feature.
+
+        The indices are found from the `offset_index`, without
+        reading the count or index variables more than once.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        .. seealso:: `offset_index`
+
+        :Parameters:
+
+            feature: `int`
+                The position of the feature along the uncompressed
+                instance dimension.
+
+        :Returns:
+
+            `slice` or `numpy.ndarray` or `list`
+                The indices of the feature's elements along the
+                sample dimension. A `slice` is returned if the
+                elements are contiguous. For an indexed contiguous
+                ragged array, a `list` of the slices for each of the
+                feature's profiles is returned.
+
+        **Examples**
+
+        An original 2-d array with shape (3, 5) comprising 3
+        timeSeries features has been compressed as a contiguous ragged
+        array. The features have counts of 2, 5, and 4 elements.
+
+        >>> x.feature_indices(1)
+        slice(2, 7, None)
+
+        An original 2-d array with shape (3, 5) comprising 3
+        timeSeries features has been compressed as an indexed ragged
+        array. The features have counts of 2, 5, and 4
+        elements, at compressed locations (5, 8), (1, 3, 4, 7, 10),
+        and (0, 2, 6, 9) respectively.
+
+        >>> x.feature_indices(1)
+        array([ 1,  3,  4,  7, 10])
+
+        """
+        index = self.offset_index()
+        offsets = index["offsets"]
+        start = int(offsets[feature])
+        stop = int(offsets[feature + 1])
+
+        order = index["order"]
+        profile_offsets = index["profile_offsets"]
+        if profile_offsets is not None:
+            if order is None:
+                positions = range(start, stop)
+            else:
+                positions = order[start:stop].tolist()
+
+            return [
+                slice(int(profile_offsets[i]), int(profile_offsets[i + 1]))
+                for i in positions
+            ]
+
+        if order is None:
+            return slice(start, stop)
+
+        positions = order[start:stop]
+        if positions.size and positions[-1] - positions[0] + 1 == (
+            positions.size
+        ):
+            return slice(int(positions[0]), int(positions[-1]) + 1)
+
+        return positions
+
     def get_count(self, default=ValueError()):
         """Return the count variable for the compressed array.
 
@@ -209,6 +415,201 @@ class RaggedArray(CompressedArray):
 
         return out
 
+    def offset_index(self):
+        """The offset index of the ragged features.
+
+        The offset index is a compressed sparse row (CSR)
+        representation of the locations of each feature's elements
+        in the sample dimension. It is created from the count and
+        index variables when it is first needed, and is then shared
+        by all copies of the array, so that the count and index
+        variables only need to be read once.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        .. seealso:: `feature_indices`
+
+        :Returns:
+
+            `dict`
+                The offset index, with keys:
+
+                * ``'offsets'``: The `numpy` array of the cumulative
+                  number of elements of each feature, starting with
+                  0. For an indexed contiguous ragged array these are
+                  the cumulative number of profiles of each feature.
+
+                * ``'order'``: `None` if each feature's elements (or
+                  profiles for an indexed contiguous ragged array)
+                  are in contiguous blocks. Otherwise the stable
+                  `numpy` argsort of the index variable, so that the
+                  elements (or profiles) of feature ``k`` are at
+                  positions ``order[offsets[k]:offsets[k+1]]``.
+
+                * ``'profile_offsets'``: For an indexed contiguous
+                  ragged array, the `numpy` array of the cumulative
+                  number of elements of each profile, starting with
+                  0. Otherwise `None`.
+
+                * ``'size'``: The number of elements in the sample
+                  dimension.
+
+        **Examples**
+
+        An original 2-d array with shape (3, 5) comprising 3
+        timeSeries features has been compressed as a contiguous ragged
+        array. The features have counts of 2, 5, and 4 elements.
+
+        >>> x.offset_index()
+        {'offsets': array([ 0,  2,  7, 11]),
+         'order': None,
+         'profile_offsets': None,
+         'size': 11}
+
+        An original 2-d array with shape (3, 5) comprising 3
+        timeSeries features has been compressed as an indexed ragged
+        array. The features have counts of 2, 5, and 4
+        elements, at compressed locations (5, 8), (1, 3, 4, 7, 10),
+        and (0, 2, 6, 9) respectively.
+
+        >>> x.offset_index()
+        {'offsets': array([ 0,  2,  7, 11]),
+         'order': array([ 5,  8,  1,  3,  4,  7, 10,  0,  2,  6,  9]),
+         'profile_offsets': None,
+         'size': 11}
+
+        """
+        offset_index = self._get_component("offset_index")
+
+        compression_type = self.get_compression_type()
+        index = offset_index.get(compression_type)
+        if index is not None:
+            return index
+
+        u_dims = self.get_compressed_axes()
+        n_features = self.shape[u_dims[0]]
+
+        if compression_type == "ragged contiguous":
+            count = np.asanyarray(self.get_count()).astype(int).ravel()
+            offsets = np.zeros(count.size + 1, dtype=int)
+            np.cumsum(count, out=offsets[1:])
+            order = None
+            profile_offsets = None
+            size = int(offsets[-1])
+        else:
+            feature = np.asanyarray(self.get_index()).astype(int).ravel()
+            offsets = np.zeros(n_features + 1, dtype=int)
+            np.cumsum(
+                np.bincount(feature, minlength=n_features)[:n_features],
+                out=offsets[1:],
+            )
+            order = np.argsort(feature, kind="stable")
+
+            if compression_type == "ragged indexed contiguous":
+                count = np.asanyarray(self.get_count()).astype(int).ravel()
+                profile_offsets = np.zeros(count.size + 1, dtype=int)
+                np.cumsum(count, out=profile_offsets[1:])
+                size = int(profile_offsets[-1])
+            else:
+                profile_offsets = None
+                size = feature.size
+
+            if np.array_equal(order, np.arange(order.size)):
+                # The index variable is sorted, so each feature's
+                # elements (or profiles) are contiguous
+                order = None
+
+        index = {
+            "offsets": offsets,
+            "order": order,
+            "profile_offsets": profile_offsets,
+            "size": size,
+        }
+        offset_index[compression_type] = index
+        return index
+
+    def ragged_features(self, features=None, batch_size=None):
+        """Iterate over features without uncompressing them.
+
+        Each feature is read directly from the compressed data and
+        contains only its own elements, rather than being padded with
+        missing values to the size of the largest feature, as happens
+        when the array is uncompressed. The compressed data is read
+        one feature, or one batch of features, at a time, so only one
+        feature or batch of features is in memory at any one time.
+
+        The locations of the features in the compressed data are
+        found from the `offset_index`.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        .. seealso:: `feature_indices`, `offset_index`
+
+        :Parameters:
+
+            features: (sequence of) `int`, or `slice`, optional
+                Select the features to iterate over, by their
+                positions along the uncompressed instance
+                dimension. By default all features are iterated over,
+                in order.
+
+            batch_size: `int`, optional
+                If set then iterate over lists of up to *batch_size*
+                features, rather than over individual features. The
+                compressed data for all of the features in a batch is
+                read at the same time. By default each feature is read
+                separately.
+
+        :Returns:
+
+            generator
+                The features, or lists of features if *batch_size* is
+                set. For contiguous and indexed ragged arrays, each
+                feature is a `numpy` array of its elements, in which
+                the sample dimension of the compressed data is
+                replaced by the number of elements in the feature. For
+                indexed contiguous ragged arrays, each feature is a
+                `list` of such arrays, one for each of its profiles.
+
+        **Examples**
+
+        An original 2-d array with shape (3, 5) comprising 3
+        timeSeries features has been compressed as a contiguous ragged
+        array. The features have counts of 2, 5, and 4 elements.
+
+        >>> for feature in x.ragged_features():
+        ...     print(feature)
+        ...
+        [0. 1.]
+        [2. 3. 4. 5. 6.]
+        [ 7.  8.  9. 10.]
+        >>> list(x.ragged_features(features=[2, 0]))
+        [array([ 7.,  8.,  9., 10.]), array([0., 1.])]
+        >>> for batch in x.ragged_features(batch_size=2):
+        ...     print(batch)
+        ...
+        [array([0., 1.]), array([2., 3., 4., 5., 6.])]
+        [array([ 7.,  8.,  9., 10.])]
+
+        """
+        index = self.offset_index()
+
+        n_features = index["offsets"].size - 1
+        if features is None:
+            features = slice(None)
+
+        features = np.atleast_1d(np.arange(n_features)[features])
+
+        if batch_size is not None:
+            batch_size = int(batch_size)
+            if batch_size < 1:
+                raise ValueError(
+                    "'batch_size' must be a positive integer. "
+                    f"Got: {batch_size!r}"
+                )
+
+        return self._ragged_features(index, features, batch_size)
+
     def subarray_shapes(self, shapes):
         """Create the subarray shapes along each uncompressed dimension.
 
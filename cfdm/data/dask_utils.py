@@ -31,6 +31,61 @@ def cfdm_to_memory(a):
     return a
 
 
+def cfdm_read_hyperslab(a, index, **kwargs):
+    """Read a hyperslab of a file array into memory.
+
+    .. versionadded:: (cfdm) NEXTVERSION
+
+    .. seealso:: `cfdm.data.utils.coalesce_reads`
+
+    :Parameters:
+
+        a: array_like
+            The array.
+
+        index: `tuple`
+            The index that defines the hyperslab.
+
+        kwargs: optional
+            Keyword arguments to `dask.array.core.getter`.
+
+    :Returns:
+
+        `numpy.ndarray`
+            The in-memory hyperslab.
+
+    """
+    from dask.array.core import getter
+
+    return cfdm_to_memory(getter(a, index, **kwargs))
+
+
+def cfdm_subspace_copy(a, index):
+    """Return a copy of a subspace of an array.
+
+    Unlike a view, the copy does not keep the rest of *a* in memory.
+
+    .. versionadded:: (cfdm) NEXTVERSION
+
+    .. seealso:: `cfdm.data.utils.coalesce_reads`
+
+    :Parameters:
+
+        a: `numpy.ndarray`
+            The array.
+
+        index: `tuple`
+            The index that defines the subspace.
+
+    :Returns:
+
+        `numpy.ndarray`
+            The copied subspace.
+
+    """
+    return a[index].copy()
+
+
 def cfdm_filled(a, fill_value=None):
     """Replace masked elements with a fill value.
 
@@ -238,3 +293,111 @@ def cfdm_where(array, condition, x, y, hardmask):
         array.harden_mask()
 
     return array
+
+
+def cfdm_ragged_gather(a, count):
+    """Gather the leading elements of each row of an array.
+
+    Used to create the compressed data of a DSG ragged array. The
+    first *count[i]* elements of row *i* of *a* are selected, and the
+    selected elements of all rows are concatenated, in order, along a
+    single new leading dimension.
+
+    .. versionadded:: (cfdm) NEXTVERSION
+
+    :Parameters:
+
+        a: `numpy.ndarray`
+            The array, with at least 2 dimensions. The first
+            dimension indexes each row and the second dimension
+            contains the elements of each row. Any trailing
+            dimensions are retained in the output.
+
+        count: `numpy.ndarray`
+            The number of elements to select from each row.
+
+    :Returns:
+
+        `numpy.ndarray`
+            The selected elements.
+
+    **Examples**
+
+    >>> a = np.arange(12).reshape(3, 4)
+    >>> cfdm_ragged_gather(a, np.array([1, 4, 2]))
+    array([0, 4, 5, 6, 7, 8, 9])
+
+    """
+    a = cfdm_to_memory(a)
+    return a[np.arange(a.shape[1]) < count[:, np.newaxis]]
+
+
+def cfdm_allclose(a, b, masked_equal=True, rtol=None, atol=None, mask=False):
+    """Whether two chunks are element-wise equal within a tolerance.
+
+    Numeric chunks are compared with `numpy.ma.allclose`, and
+    non-numeric chunks are tested for equality, ignoring missing
+    values.
+
+    .. versionadded:: (cfdm) NEXTVERSION
+
+    .. seealso:: `cfdm.data.utils.allclose`
+
+    :Parameters:
+
+        a: array_like
+            The chunk to compare with *b*.
+
+        b: array_like
+            The chunk to compare with *a*.
+
+        masked_equal: `bool`, optional
+            Whether masked values in *a* and *b* are considered equal
+            (True) or not (False). Ignored for non-numeric chunks.
+
+        {{rtol: number, optional}}
+
+        {{atol: number, optional}}
+
+        mask: `bool`, optional
+            If True then the chunks must also have identical masks.
+
+    :Returns:
+
+        `numpy.ndarray`
+            The Boolean result, with the same number of dimensions as
+            the chunks and each dimension of size 1.
+
+    **Examples**
+
+    >>> a = np.ma.array([1.0, 2.0], mask=[False, True])
+    >>> cfdm_allclose(a, np.array([1.0, 3.0]), rtol=1e-5, atol=1e-8)
+    array([ True])
+    >>> cfdm_allclose(
+    ...     a, np.array([1.0, 3.0]), rtol=1e-5, atol=1e-8, mask=True
+    ... )
+    array([False])
+
+    """
+    a = cfdm_to_memory(a)
+    b = cfdm_to_memory(b)
+
+    shape = (1,) * np.ndim(a)
+
+    if mask and not np.array_equal(
+        np.ma.getmaskarray(a), np.ma.getmaskarray(b)
+    ):
+        return np.full(shape, False)
+
+    if a.dtype.kind in "biufc" and b.dtype.kind in "biufc":
+        result = np.ma.allclose(
+            a, b, masked_equal=masked_equal, rtol=rtol, atol=atol
+        )
+    else:
+        # If the comparison is entirely masked then np.all returns
+        # np.ma.masked, which counts as equal
+        result = np.ma.all(a == b)
+        if result is np.ma.masked:
+            result = True
+
+    return np.full(shape, bool(result))
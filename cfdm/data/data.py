@@ -395,6 +395,17 @@ class Data(
             except AttributeError:
                 pass
 
+            # Cached sorted values
+            try:
+                sorted_values = source._get_component("sorted_values", None)
+            except AttributeError:
+                pass
+            else:
+                if sorted_values is not None:
+                    self._set_component(
+                        "sorted_values", sorted_values, copy=False
+                    )
+
             # Mask hardness
             self.hardmask = getattr(source, "hardmask", self._DEFAULT_HARDMASK)
 
@@ -1802,6 +1813,8 @@ class Data(
         if clear & self._CACHE:
             # Delete cached element values
             self._del_cached_elements()
+            # Delete cached sorted values
+            self._del_component("sorted_values", None)
 
         if clear & self._CFA:
             # Set the aggregation write status to False (under certain
@@ -2092,6 +2105,72 @@ class Data(
         """
         return self._get_component("cached_elements", {})
 
+    def _get_sorted_values(self):
+        """Return the sorted non-missing values of the flattened data.
+
+        The sorted values, and the positions that they came from, are
+        computed once and then cached, so that subsequent searches of
+        the data values (such as those carried out by
+        `{{package}}.Field.indices`) may use `numpy.searchsorted`
+        without re-computing the data. The cache is removed whenever
+        the data values are changed.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Returns:
+
+            2-`tuple` of `numpy.ndarray` and (`numpy.ndarray` or `None`)
+                The sorted non-missing values, and the positions in
+                the flattened data of each sorted value. The positions
+                are `None` when the data are already sorted in
+                non-decreasing order and have no missing values. Both
+                arrays are read-only.
+
+        **Examples**
+
+        >>> d = {{package}}.Data([3, 1, 2, 5])
+        >>> d._get_sorted_values()
+        (array([1, 2, 3, 5]), array([1, 2, 0, 3]))
+
+        >>> d = {{package}}.Data([1, 2, 3, 5])
+        >>> d._get_sorted_values()
+        (array([1, 2, 3, 5]), None)
+
+        """
+        sorted_values = self._get_component("sorted_values", None)
+        if sorted_values is not None:
+            return sorted_values
+
+        array = np.ma.ravel(self.array)
+        mask = np.ma.getmaskarray(array)
+        if mask.any():
+            positions = np.flatnonzero(~mask)
+            array = np.asarray(array.data[positions])
+        else:
+            positions = None
+            array = np.asarray(np.ma.getdata(array))
+
+        if array.size > 1 and not (array[1:] >= array[:-1]).all():
+            if (array[1:] <= array[:-1]).all():
+                # Monotonically decreasing
+                order = np.arange(array.size - 1, -1, -1)
+            else:
+                order = np.argsort(array, kind="stable")
+
+            array = array[order]
+            if positions is None:
+                positions = order
+            else:
+                positions = positions[order]
+
+        array.flags.writeable = False
+        if positions is not None:
+            positions.flags.writeable = False
+
+        sorted_values = (array, positions)
+        self._set_component("sorted_values", sorted_values, copy=False)
+        return sorted_values
+
     def _is_abstract_Array_subclass(self, array):
         """Whether or not an array is a type of Array.
 
@@ -4812,6 +4891,11 @@ class Data(
 
         {{equals tolerance}}
 
+        If both data arrays have the same deterministic name (see
+        `get_deterministic_name`) then their values are assumed to be
+        equal without being computed, in which case NaN and inf values
+        are considered equal.
+
         :Parameters:
 
             other:
@@ -4873,8 +4957,6 @@ class Data(
             )  # pragma: no cover
             return False
 
-        import dask.array as da
-
         self_dx = self.to_dask_array(_force_mask_hardness=False)
         other_dx = other.to_dask_array(_force_mask_hardness=False)
 
@@ -4923,6 +5005,19 @@ class Data(
         else:
             atol = float(atol)
 
+        # Return True if there are equal deterministic names, without
+        # computing the arrays. Equal deterministic names mean that
+        # the arrays were created from the same inputs by the same
+        # operations, and so have identical values.
+        if (
+            rtol >= 0
+            and atol >= 0
+            and self.has_deterministic_name()
+            and other.has_deterministic_name()
+            and self.get_deterministic_name() == other.get_deterministic_name()
+        ):
+            return True
+
         # Return False if there are different cached elements. This
         # provides a possible short circuit for that case that two
         # arrays are not equal (but not in the case that they are).
@@ -4948,33 +5043,13 @@ class Data(
 
                         return False
 
-        # Now check that corresponding elements are equal within a tolerance.
-        # We assume that all inputs are masked arrays. Note we compare the
-        # data first as this may return False due to different dtype without
-        # having to wait until the compute call.
-        if self_is_numeric and other_is_numeric:
-            data_comparison = allclose(
-                self_dx,
-                other_dx,
-                masked_equal=True,
-                rtol=rtol,
-                atol=atol,
-            )
-        elif not self_is_numeric and not other_is_numeric:
-            # If the array (say d) is fully masked, then the output of
-            # np.all(d == d) and therefore da.all(d == d) will be a
-            # np.ma.masked object which has dtype('float64'), and not
-            # a Boolean, causing issues later. To ensure data_comparison
-            # is Boolean, we must do an early compute to check if it is
-            # a masked object and if so, force the desired result (True).
-            #
-            # This early compute won't degrade performance because it
-            # would be performed towards result.compute() below anyway.
-            data_comparison = da.all(self_dx == other_dx).compute()
-            if data_comparison is np.ma.masked:
-                data_comparison = True
-
-        else:  # one is numeric and other isn't => not equal (incompat. dtype)
+        # Now check that corresponding elements are equal within a
+        # tolerance, and that the masks are identical. Each pair of
+        # corresponding chunks is compared in a single pass, and all
+        # of the chunks are compared in one compute.
+        if self_is_numeric != other_is_numeric:
+            # One is numeric and other isn't => not equal (incompat.
+            # dtype)
             if is_log_level_info(logger):
                 logger.info(
                     f"{self.__class__.__name__}: Different data types:"
@@ -4983,14 +5058,15 @@ class Data(
 
             return False
 
-        mask_comparison = da.all(
-            da.equal(da.ma.getmaskarray(self_dx), da.ma.getmaskarray(other_dx))
-        )
-
-        # Apply a (dask) logical 'and' to confirm if both the mask and the
-        # data are equal for the pair of masked arrays:
-        result = da.logical_and(data_comparison, mask_comparison)
-        if not result.compute():
+        if not allclose(
+            self_dx,
+            other_dx,
+            masked_equal=True,
+            rtol=rtol,
+            atol=atol,
+            mask=True,
+            compute=True,
+        ):
             if is_log_level_info(logger):
                 logger.info(
                     f"{self.__class__.__name__}: Different array values ("
@@ -4998,8 +5074,8 @@ class Data(
                 )
 
             return False
-        else:
-            return True
+
+        return True
 
     def file_directories(self, normalise=False):
         """The directories of files containing parts of the data.
@@ -6649,6 +6725,79 @@ class Data(
 
         return d
 
+    def ragged_features(self, features=None, batch_size=None):
+        """Iterate over the features of ragged array data.
+
+        For data that are compressed as a ragged array for discrete
+        sampling geometries (DSG), each feature is read directly from
+        the compressed data and contains only its own elements,
+        rather than being padded with missing values to the size of
+        the largest feature, as happens when the data are
+        uncompressed. The compressed data is read one feature, or one
+        batch of features, at a time, so the memory used is bounded
+        by the size of the largest feature or batch.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        .. seealso:: `get_compression_type`, `uncompress`
+
+        :Parameters:
+
+            features: (sequence of) `int`, or `slice`, optional
+                Select the features to iterate over, by their
+                positions along the uncompressed instance
+                dimension. By default all features are iterated over,
+                in order.
+
+            batch_size: `int`, optional
+                If set then iterate over lists of up to *batch_size*
+                features, rather than over individual features. The
+                compressed data for all of the features in a batch is
+                read at the same time. By default each feature is read
+                separately.
+
+        :Returns:
+
+            generator
+                The features, or lists of features if *batch_size* is
+                set. For contiguous and indexed ragged arrays, each
+                feature is a `numpy` array of its elements. For
+                indexed contiguous ragged arrays, each feature is a
+                `list` of `numpy` arrays, one for each of its
+                profiles.
+
+        **Examples**
+
+        >>> d.get_compression_type()
+        'ragged contiguous'
+        >>> print(d.array)
+        [[0.0 1.0 -- -- --]
+         [2.0 3.0 4.0 5.0 6.0]
+         [7.0 8.0 9.0 10.0 --]]
+        >>> for feature in d.ragged_features():
+        ...     print(feature)
+        ...
+        [0. 1.]
+        [2. 3. 4. 5. 6.]
+        [ 7.  8.  9. 10.]
+        >>> list(d.ragged_features(features=slice(1, None)))
+        [array([2., 3., 4., 5., 6.]), array([ 7.,  8.,  9., 10.])]
+        >>> for batch in d.ragged_features(batch_size=2):
+        ...     print(batch)
+        ...
+        [array([0., 1.]), array([2., 3., 4., 5., 6.])]
+        [array([ 7.,  8.,  9., 10.])]
+
+        """
+        ca = self._get_Array(None)
+        if ca is None or not ca.get_compression_type().startswith("ragged"):
+            raise ValueError(
+                f"Can't iterate over the features of {self!r}: Data are "
+                "not compressed as a ragged array"
+            )
+
+        return ca.ragged_features(features=features, batch_size=batch_size)
+
     @_inplace_enabled(default=False)
     def rechunk(
         self,
@@ -7276,7 +7425,12 @@ class Data(
         )
         return d
 
-    def to_dask_array(self, _force_mask_hardness=True, _force_to_memory=True):
+    def to_dask_array(
+        self,
+        _force_mask_hardness=True,
+        _force_to_memory=True,
+        coalesce_reads=False,
+    ):
         """Convert the data to a `dask` array.
 
         .. versionadded:: (cfdm) 1.11.2.0
@@ -7287,6 +7441,20 @@ class Data(
 
             {{_force_to_memory: `bool`, optional}}
 
+            coalesce_reads: `bool`, optional
+                If True then optimise the dask graph so that adjacent
+                chunks which are read from the same netCDF or Zarr
+                variable are read together in a single hyperslab,
+                which is split into the original chunks in
+                memory. Each merged read is no larger than
+                `{{package}}.chunksize`. This can greatly reduce the
+                overhead of computing data that has many small
+                chunks. The chunks, and the values, of the returned
+                dask array are unchanged. By default, chunks are read
+                independently.
+
+                .. versionadded:: (cfdm) NEXTVERSION
+
         :Returns:
 
             `dask.array.Array`
@@ -7314,6 +7482,11 @@ class Data(
         if dx is None:
             raise ValueError(f"{self.__class__.__name__} object has no data")
 
+        if coalesce_reads:
+            from .utils import coalesce_reads as coalesce
+
+            dx = coalesce(dx)
+
         if _force_mask_hardness:
             if self.hardmask:
                 dx = dx.map_blocks(cfdm_harden_mask, dtype=dx.dtype)
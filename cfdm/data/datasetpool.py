@@ -0,0 +1,367 @@
+import os
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+
+from ..functions import dataset_pool_size, dataset_pool_timeout
+
+
+class _PoolEntry:
+    """An open dataset stored in a `DatasetPool`.
+
+    .. versionadded:: (cfdm) NEXTVERSION
+
+    """
+
+    __slots__ = (
+        "key",
+        "dataset",
+        "filename",
+        "signature",
+        "users",
+        "last_used",
+    )
+
+    def __init__(self, key, dataset, filename, signature):
+        """**Initialisation**
+
+        :Parameters:
+
+            key: hashable
+                The key of the dataset in the pool.
+
+            dataset:
+                The open dataset object.
+
+            filename: `str`
+                The normalised name of the dataset.
+
+            signature: `tuple` or `None`
+                The file system signature of the dataset at the time
+                it was opened. See `DatasetPool._signature` for
+                details.
+
+        """
+        self.key = key
+        self.dataset = dataset
+        self.filename = filename
+        self.signature = signature
+        self.users = 0
+        self.last_used = monotonic()
+
+
+class DatasetPool:
+    """A bounded least-recently-used pool of open datasets.
+
+    Opening a dataset can be expensive (e.g. parsing the HDF5
+    superblock and metadata of a netCDF-4 file), so rather than
+    opening and closing a dataset for every data access, open
+    datasets may be shared via the pool.
+
+    An open dataset is retrieved with `acquire` and must be returned
+    with `release` when it is no longer needed. A dataset that is
+    not in use by any caller is closed when it is the least recently
+    used of more than `cfdm.dataset_pool_size` datasets, or when it
+    has not been used for more than `cfdm.dataset_pool_timeout`
+    seconds. Idle datasets are only checked for expiry during calls
+    to `acquire` and `release`, or explicitly with `clear`.
+
+    A pooled local dataset is re-opened if its file has been
+    modified since it was opened.
+
+    The pool is safe to use from multiple threads, and the pool in a
+    forked child process starts empty.
+
+    .. versionadded:: (cfdm) NEXTVERSION
+
+    .. seealso:: `cfdm.dataset_pool_size`, `cfdm.dataset_pool_timeout`
+
+    """
+
+    def __init__(self):
+        """**Initialisation**"""
+        self._reset()
+
+    def __len__(self):
+        """The number of open datasets in the pool.
+
+        x.__len__() <==> len(x)
+
+        """
+        return len(self._entries)
+
+    def __repr__(self):
+        """Called by the `repr` built-in function.
+
+        x.__repr__() <==> repr(x)
+
+        """
+        return f"<{self.__class__.__name__}: {len(self)} open datasets>"
+
+    def _reset(self):
+        """Forget all pooled datasets without closing them.
+
+        Used to give a forked child process a new, empty pool, since
+        a dataset opened by the parent process must not be used by
+        the child.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Returns:
+
+            `None`
+
+        """
+        self._lock = Lock()
+        self._entries = OrderedDict()
+        self._in_use = {}
+
+    @classmethod
+    def _signature(cls, filename):
+        """Return a file system signature of a local dataset.
+
+        The signature changes if the file is replaced or modified.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            filename: `str`
+                The normalised name of the dataset.
+
+        :Returns:
+
+            `tuple` or `None`
+                The inode number, size, and modification time of a
+                local file or directory, or `None` for a remote
+                dataset.
+
+        """
+        if filename.startswith("file://"):
+            filename = filename[7:]
+        elif "://" in filename:
+            return None
+
+        try:
+            s = os.stat(filename)
+        except OSError:
+            return None
+
+        return (s.st_ino, s.st_size, s.st_mtime_ns)
+
+    @classmethod
+    def _close(cls, entry):
+        """Close a pooled dataset.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            entry: `_PoolEntry`
+                The pool entry containing the dataset.
+
+        :Returns:
+
+            `None`
+
+        """
+        close = getattr(entry.dataset, "close", None)
+        if close is not None:
+            try:
+                close()
+            except Exception:
+                pass
+
+    def _discard(self, key):
+        """Remove a dataset from the pool.
+
+        The dataset is closed immediately if it is not in use,
+        otherwise it is closed when the last user releases it.
+
+        Must be called with the pool lock held.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            key: hashable
+                The key of the dataset in the pool.
+
+        :Returns:
+
+            `None`
+
+        """
+        entry = self._entries.pop(key)
+        if not entry.users:
+            self._close(entry)
+
+    def _expire(self, size, timeout):
+        """Close idle datasets that exceed the pool limits.
+
+        Must be called with the pool lock held.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            size: `int`
+                The maximum number of datasets in the pool.
+
+            timeout: number
+                The number of seconds after which an idle dataset is
+                closed.
+
+        :Returns:
+
+            `None`
+
+        """
+        entries = self._entries
+        now = monotonic()
+        excess = len(entries) - size
+        for key, entry in tuple(entries.items()):
+            if entry.users:
+                continue
+
+            if excess > 0 or now - entry.last_used >= timeout:
+                self._discard(key)
+                excess -= 1
+
+    def acquire(self, key, filename, opener):
+        """Return an open dataset from the pool.
+
+        If the dataset is not already in the pool then it is opened
+        and added to it. If pooling is disabled (i.e. if
+        `cfdm.dataset_pool_size` is zero) then the newly opened
+        dataset is not added to the pool.
+
+        Every call to `acquire` must be matched with a call to
+        `release`.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            key: hashable
+                The key that uniquely identifies the dataset, and the
+                way in which it was opened, in the pool.
+
+            filename: `str`
+                The normalised name of the dataset.
+
+            opener: callable
+                A function with no arguments that opens and returns
+                the dataset.
+
+        :Returns:
+
+                The open dataset.
+
+        """
+        size = dataset_pool_size().value
+        if not size:
+            return opener()
+
+        timeout = dataset_pool_timeout().value
+        signature = self._signature(filename)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry.signature == signature:
+                    entry.users += 1
+                    self._entries.move_to_end(key)
+                    self._in_use[id(entry.dataset)] = entry
+                    return entry.dataset
+
+                # The file has been modified since it was opened
+                self._discard(key)
+
+        # Open the dataset without holding the pool lock, so that
+        # access to other pooled datasets is not blocked
+        dataset = opener()
+
+        with self._lock:
+            if key in self._entries:
+                # Another thread pooled the same dataset whilst we
+                # were opening it, so don't pool this one.
+                return dataset
+
+            entry = _PoolEntry(key, dataset, filename, signature)
+            entry.users = 1
+            self._entries[key] = entry
+            self._in_use[id(dataset)] = entry
+            self._expire(size, timeout)
+
+        return dataset
+
+    def clear(self, filename=None):
+        """Close pooled datasets.
+
+        A dataset that is currently in use is removed from the pool
+        immediately, but not closed until its last user releases it.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            filename: `str` or `None`, optional
+                Only close pooled datasets with this normalised
+                name. By default all pooled datasets are closed.
+
+        :Returns:
+
+            `None`
+
+        """
+        with self._lock:
+            for key, entry in tuple(self._entries.items()):
+                if filename is None or entry.filename == filename:
+                    self._discard(key)
+
+    def release(self, dataset):
+        """Return a dataset to the pool.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            dataset:
+                A dataset returned by `acquire`.
+
+        :Returns:
+
+            `bool`
+                True if the dataset is managed by the pool, in which
+                case it must not be closed by the caller. False if the
+                dataset is not managed by the pool, in which case the
+                caller is responsible for closing it.
+
+        """
+        with self._lock:
+            entry = self._in_use.get(id(dataset))
+            if entry is None or entry.dataset is not dataset:
+                return False
+
+            entry.users -= 1
+            entry.last_used = monotonic()
+            if not entry.users:
+                del self._in_use[id(dataset)]
+                if self._entries.get(entry.key) is not entry:
+                    # The dataset has been discarded from the pool
+                    # whilst in use
+                    self._close(entry)
+
+            self._expire(
+                dataset_pool_size().value, dataset_pool_timeout().value
+            )
+
+        return True
+
+
+# The pool of open datasets shared by all file arrays
+dataset_pool = DatasetPool()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=dataset_pool._reset)
@@ -3,8 +3,11 @@ from numbers import Number
 
 import numpy as np
 
+from cfdm.core.utils import cached_property
+
 from .abstract import CompressedArray
 from .mixin import CompressedArrayMixin
+from .netcdfindexer import netcdf_indexer
 from .subarray import GatheredSubarray
 
 
@@ -49,6 +52,7 @@ class GatheredArray(CompressedArrayMixin, CompressedArray):
         compressed_dimension=None,
         compressed_dimensions=None,
         list_variable=None,
+        fill_value=None,
         source=None,
         copy=True,
     ):
@@ -73,6 +77,15 @@ class GatheredArray(CompressedArrayMixin, CompressedArray):
                 The "list variable" required to uncompress the data,
                 identical to the data of a CF-netCDF list variable.
 
+            fill_value: scalar, optional
+                If set then the uncompressed locations that have no
+                compressed data are set to this value, and non-masked
+                `numpy` arrays are returned when the data are
+                uncompressed. By default, or if `None`, these
+                locations are masked.
+
+                .. versionadded:: (cfdm) NEXTVERSION
+
             compressed_dimension: deprecated at version 1.10.0.0
                 Use the *compressed_dimensions* parameter instead.
 
@@ -117,9 +130,106 @@ class GatheredArray(CompressedArrayMixin, CompressedArray):
             except AttributeError:
                 list_variable = None
 
+            try:
+                fill_value = source.get_fill_value(None)
+            except AttributeError:
+                fill_value = None
+
         if list_variable is not None:
             self._set_component("list_variable", list_variable, copy=copy)
 
+        if fill_value is not None:
+            self._set_component("fill_value", fill_value, copy=False)
+
+    def __getitem__(self, indices):
+        """Return a subspace of the uncompressed data.
+
+        x.__getitem__(indices) <==> x[indices]
+
+        Returns a subspace of the uncompressed array as an independent
+        numpy array.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        """
+        # ------------------------------------------------------------
+        # Method: Uncompress the entire array and then subspace it
+        # ------------------------------------------------------------
+        # Initialise the un-sliced uncompressed array
+        fill_value = self.get_fill_value(None)
+        if fill_value is None:
+            u = np.ma.masked_all(self.shape, dtype=self.dtype)
+        else:
+            u = np.full(self.shape, fill_value, dtype=self.dtype)
+
+        Subarray = self.get_Subarray()
+        subarray_kwargs = {
+            "data": self.source().copy(),
+            **self.subarray_parameters(),
+        }
+
+        for (
+            u_indices,
+            u_shape,
+            c_indices,
+            uncompressed_indices,
+            compressed_positions,
+            _,
+        ) in zip(*self.subarrays()):
+            subarray = Subarray(
+                indices=c_indices,
+                shape=u_shape,
+                uncompressed_indices=uncompressed_indices,
+                compressed_positions=compressed_positions,
+                **subarray_kwargs,
+            )
+            u[u_indices] = subarray[...]
+
+        u = netcdf_indexer(
+            u,
+            mask=False,
+            unpack=False,
+            always_masked_array=False,
+            orthogonal_indexing=True,
+            copy=False,
+        )
+        return u[indices]
+
+    @cached_property
+    def _list_indices(self):
+        """The list variable indices of each gathered dimension.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        .. seealso:: `_uncompressed_indices`
+
+        :Returns:
+
+            `tuple` of `numpy.ndarray`
+                The list variable indices unravelled into the indices
+                of each uncompressed dimension that has been
+                compressed by gathering.
+
+        **Examples**
+
+        For an original 3-d array with shape (12, 4, 6) for which the
+        last two dimensions have been compressed by gathering with
+        list variable indices (1, 2, 5, 6, 13, 15, 16, 22) then:
+
+        >>> for i in x._list_indices:
+        ...     print(i)
+        ...
+        [0 0 0 1 2 2 2 3]
+        [1 2 5 0 1 3 4 4]
+
+        """
+        _, u_dims = self.compressed_dimensions().popitem()
+        list_variable = np.array(self.get_list())
+
+        return np.unravel_index(
+            list_variable, self.shape[u_dims[0] : u_dims[-1] + 1]
+        )
+
     def _uncompressed_indices(self):
         """Indices of the uncompressed subarray for the compressed data.
 
@@ -147,13 +257,9 @@ class GatheredArray(CompressedArrayMixin, CompressedArray):
 
         """
         _, u_dims = self.compressed_dimensions().popitem()
-        list_variable = np.array(self.get_list())
 
         u_indices = [slice(None)] * self.ndim
-
-        u_indices[u_dims[0] : u_dims[-1] + 1] = np.unravel_index(
-            list_variable, self.shape[u_dims[0] : u_dims[-1] + 1]
-        )
+        u_indices[u_dims[0] : u_dims[-1] + 1] = self._list_indices
 
         return tuple(u_indices)
 
@@ -183,6 +289,26 @@ class GatheredArray(CompressedArrayMixin, CompressedArray):
         out["uncompressed_indices"] = self._uncompressed_indices()
         return out
 
+    def get_fill_value(self, default=ValueError()):
+        """Return the value of uncompressed locations with no data.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            default: optional
+                Return the value of the *default* parameter if the
+                fill value has not been set.
+
+                {{default Exception}}
+
+        :Returns:
+
+                The fill value.
+
+        """
+        return self._get_component("fill_value", default=default)
+
     def get_list(self, default=ValueError()):
         """Return the list variable for a compressed array.
 
@@ -204,6 +330,22 @@ class GatheredArray(CompressedArrayMixin, CompressedArray):
         """
         return self._get_component("list_variable", default=default)
 
+    def subarray_parameters(self):
+        """Non-data parameters required by the `Subarray` class.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Returns:
+
+            `dict`
+                The parameters as a dictionary value, with keys
+                ``'compressed_dimensions'`` and ``'fill_value'``.
+
+        """
+        out = super().subarray_parameters()
+        out["fill_value"] = self.get_fill_value(None)
+        return out
+
     def subarray_shapes(self, shapes):
         """Create the subarray shapes along each uncompressed dimension.
 
@@ -229,19 +371,17 @@ class GatheredArray(CompressedArrayMixin, CompressedArray):
         >>> a.subarray_shapes(-1)
         [(2,), (3,), (4,)]
         >>> a.subarray_shapes("auto")
-        [(2,), (3,), "auto"]
+        ['auto', 'auto', 'auto']
         >>> a.subarray_shapes(2)
-        [(2,), (3,), 2]
+        [2, 2, 2]
         >>> a.subarray_shapes("60B")
-        [(2,), (3,), "60B"]
+        ['60B', '60B', '60B']
         >>> a.subarray_shapes((None, None, 2))
         [(2,), (3,), 2]
         >>> a.subarray_shapes((None, None, (1, 3)))
         [(2,), (3,), (1, 3)]
-        >>> a.subarray_shapes((None, None, "auto"))
-        [(2,), (3,), "auto"]
-        >>> a.subarray_shapes((None, None, "60B"))
-        [(2,), (3,), "60B"]
+        >>> a.subarray_shapes((None, (1, 2), "auto"))
+        [(2,), (1, 2), 'auto']
         >>> a.subarray_shapes({2: (1, 3)})
         [(2,), (3,), (1, 3)]
 
@@ -249,23 +389,18 @@ class GatheredArray(CompressedArrayMixin, CompressedArray):
         >>> da.core.normalize_chunks(
         ...   a.subarray_shapes("auto"), shape=a.shape, dtype=a.dtype
         ... )
-        [(2,), (3,), (4,)]
+        ((2,), (3,), (4,))
         >>> da.core.normalize_chunks(
-        ...   a.subarray_shapes(2, shape=a.shape, dtype=a.dtype
+        ...   a.subarray_shapes(2), shape=a.shape, dtype=a.dtype
         ... )
-        [(2,), (3,), (2, 2)]
+        ((2,), (2, 1), (2, 2))
 
         """
-        u_dims = self.get_compressed_axes()
-
         if shapes == -1:
             return [(size,) for size in self.shape]
 
         if isinstance(shapes, (str, Number)):
-            return [
-                (size,) if i in u_dims else shapes
-                for i, size in enumerate(self.shape)
-            ]
+            return [shapes] * self.ndim
 
         if isinstance(shapes, dict):
             shapes = [
@@ -279,7 +414,7 @@ class GatheredArray(CompressedArrayMixin, CompressedArray):
 
         # chunks is a sequence
         return [
-            (size,) if i in u_dims else c
+            (size,) if c is None else c
             for i, (size, c) in enumerate(zip(self.shape, shapes))
         ]
 
@@ -288,6 +423,13 @@ class GatheredArray(CompressedArrayMixin, CompressedArray):
 
         These descriptors are used during subarray decompression.
 
+        Subarrays may span any part of the dimensions that have been
+        compressed by gathering. The elements of the compressed data
+        that belong to each subarray are found from a mapping of the
+        list variable to the subarrays, so that only the part of the
+        compressed data spanning those elements needs to be read for
+        each subarray.
+
         .. versionadded:: (cfdm) 1.10.0.0
 
         :Parameters:
@@ -296,7 +438,7 @@ class GatheredArray(CompressedArrayMixin, CompressedArray):
 
         :Returns:
 
-             4-`tuple` of iterators
+             6-`tuple` of iterators
                 Each iterable iterates over a particular descriptor
                 from each subarray.
 
@@ -308,7 +450,14 @@ class GatheredArray(CompressedArrayMixin, CompressedArray):
                 3. The indices of the compressed array that correspond
                    to each subarray.
 
-                4. The location of each subarray on the uncompressed
+                4. The indices of each uncompressed subarray for its
+                   compressed data.
+
+                5. The positions of each subarray's elements in its
+                   compressed data, or `None` if all of the elements
+                   belong to the subarray.
+
+                6. The location of each subarray on the uncompressed
                    dimensions.
 
         **Examples**
@@ -317,7 +466,10 @@ class GatheredArray(CompressedArrayMixin, CompressedArray):
         compressed by gathering the dimensions with sizes 73 and 96
         respectively into a single dimension of size 3028.
 
-        >>> u_indices, u_shapes, c_indices, locations = x.subarrays()
+        >>> (
+        ...  u_indices, u_shapes, c_indices, uncompressed_indices,
+        ...  compressed_positions, locations
+        ... ) = x.subarrays()
         >>> for i in u_indices:
         ...    print(i)
         ...
@@ -330,112 +482,279 @@ class GatheredArray(CompressedArrayMixin, CompressedArray):
         ...    print(i)
         ...
         (slice(0, 4, None), slice(0, 3028, None))
+        >>> for i in compressed_positions:
+        ...    print(i)
+        ...
+        None
         >>> for i in locations:
         ...    print(i)
         ...
         (0, 0, 0)
 
+        An original 3-d array with shape (12, 4, 6) has been
+        compressed by gathering the last two dimensions with list
+        variable indices (1, 2, 5, 6, 13, 15, 16, 22), and is split
+        into subarrays along both of the gathered dimensions:
+
         >>> (
-        ...  u_indices, u_shapes, c_indices, locations
-        ... )= x.subarrays(shapes="most")
+        ...  u_indices, u_shapes, c_indices, uncompressed_indices,
+        ...  compressed_positions, locations
+        ... ) = y.subarrays(shapes=((12,), (2, 2), (3, 3)))
         >>> for i in u_indices:
         ...    print(i)
         ...
-        (slice(0, 1, None), slice(0, 73, None), slice(0, 96, None))
-        (slice(1, 2, None), slice(0, 73, None), slice(0, 96, None))
-        (slice(2, 3, None), slice(0, 73, None), slice(0, 96, None))
-        (slice(3, 4, None), slice(0, 73, None), slice(0, 96, None))
+        (slice(0, 12, None), slice(0, 2, None), slice(0, 3, None))
+        (slice(0, 12, None), slice(0, 2, None), slice(3, 6, None))
+        (slice(0, 12, None), slice(2, 4, None), slice(0, 3, None))
+        (slice(0, 12, None), slice(2, 4, None), slice(3, 6, None))
         >>> for i in u_shapes
         ...    print(i)
         ...
-        (1, 73, 96)
-        (1, 73, 96)
-        (1, 73, 96)
-        (1, 73, 96)
+        (12, 2, 3)
+        (12, 2, 3)
+        (12, 2, 3)
+        (12, 2, 3)
         >>> for i in c_indices:
         ...    print(i)
         ...
-        (slice(0, 1, None), slice(0, 3028, None))
-        (slice(1, 2, None), slice(0, 3028, None))
-        (slice(2, 3, None), slice(0, 3028, None))
-        (slice(3, 4, None), slice(0, 3028, None))
-        >>> for i in locations:
+        (slice(0, 12, None), slice(0, 4, None))
+        (slice(0, 12, None), slice(2, 3, None))
+        (slice(0, 12, None), slice(4, 5, None))
+        (slice(0, 12, None), slice(5, 8, None))
+        >>> for i in uncompressed_indices:
         ...    print(i)
         ...
-        (0, 0, 0)
-        (1, 0, 0)
-        (2, 0, 0)
-        (3, 0, 0)
-
-        >>> (
-        ...  u_indices, u_shapes, c_indices, locations
-        ... ) = x.subarrays(shapes=((3, 1), None, None))
-        >>> for i in u_indices:
+        (slice(None, None, None), array([0, 0, 1]), array([1, 2, 0]))
+        (slice(None, None, None), array([0]), array([2]))
+        (slice(None, None, None), array([0]), array([1]))
+        (slice(None, None, None), array([0, 0, 1]), array([0, 1, 1]))
+        >>> for i in compressed_positions:
         ...    print(i)
         ...
-        (slice(0, 3, None), slice(0, 73, None), slice(0, 96, None))
-        (slice(3, 4, None), slice(0, 73, None), slice(0, 96, None))
-        >>> for i in u_shapes
-        ...    print(i)
-        ...
-        (3, 73, 96)
-        (1, 73, 96)
-        >>> for i in c_indices:
-        ...    print(i)
-        ...
-        (slice(0, 3, None), slice(0, 3028, None))
-        (slice(3, 4, None), slice(0, 3028, None))
+        [0 1 3]
+        None
+        None
+        None
         >>> for i in locations:
         ...    print(i)
         ...
         (0, 0, 0)
-        (1, 0, 0)
+        (0, 0, 1)
+        (0, 1, 0)
+        (0, 1, 1)
 
         """
         d1, u_dims = self.compressed_dimensions().popitem()
 
         shapes = self.subarray_shapes(shapes)
 
-        # The indices of the uncompressed array that correspond to
-        # each subarray, the shape of each uncompressed subarray, and
-        # the location of each subarray
-        locations = []
-        u_shapes = []
-        u_indices = []
-        for d, (size, c) in enumerate(zip(self.shape, shapes)):
-            if d in u_dims:
-                locations.append((0,))
-                u_shapes.append((size,))
-                u_indices.append((slice(0, size),))
+        def _slices(c):
+            """Return the slices that span each chunk size."""
+            c = tuple(accumulate((0,) + tuple(c)))
+            return [slice(i, j) for i, j in zip(c[:-1], c[1:])]
+
+        # ------------------------------------------------------------
+        # Descriptors for the gathered dimensions, which together
+        # correspond to the compressed dimension
+        # ------------------------------------------------------------
+        list_indices = self._list_indices
+        g_shapes = [tuple(shapes[d]) for d in u_dims]
+        g_nchunks = [len(c) for c in g_shapes]
+
+        # Map each list variable element to the subarray that
+        # contains it
+        starts = [tuple(accumulate((0,) + c[:-1])) for c in g_shapes]
+        chunk_ids = np.ravel_multi_index(
+            [
+                np.searchsorted(start, i, side="right") - 1
+                for start, i in zip(starts, list_indices)
+            ],
+            g_nchunks,
+        )
+        order = np.argsort(chunk_ids, kind="stable")
+        offsets = np.cumsum(
+            np.bincount(chunk_ids, minlength=np.prod(g_nchunks))
+        )
+
+        gathered = []
+        begin = 0
+        for location, end in zip(product(*map(range, g_nchunks)), offsets):
+            u_index = tuple(start[i] for start, i in zip(starts, location))
+
+            # The positions of the subarray's elements in the
+            # compressed dimension, in ascending order
+            positions = order[begin:end]
+            begin = end
+
+            if positions.size:
+                start = int(positions[0])
+                stop = int(positions[-1]) + 1
+                if stop - start == positions.size:
+                    # The subarray's elements are contiguous in the
+                    # compressed dimension
+                    compressed_positions = None
+                else:
+                    compressed_positions = positions - start
             else:
-                locations.append([i for i in range(len(c))])
-                u_shapes.append(c)
+                start = 0
+                stop = 0
+                compressed_positions = None
+
+            gathered.append(
+                (
+                    tuple(
+                        slice(i, i + c[j])
+                        for i, c, j in zip(u_index, g_shapes, location)
+                    ),
+                    tuple(c[j] for c, j in zip(g_shapes, location)),
+                    slice(start, stop),
+                    tuple(
+                        index[positions] - i
+                        for index, i in zip(list_indices, u_index)
+                    ),
+                    compressed_positions,
+                    location,
+                )
+            )
 
-                c = tuple(accumulate((0,) + c))
-                u_indices.append([slice(i, j) for i, j in zip(c[:-1], c[1:])])
+        # ------------------------------------------------------------
+        # Combine the descriptors for the gathered dimensions with
+        # those of the other dimensions
+        # ------------------------------------------------------------
+        before = [
+            list(zip(_slices(c), c, range(len(c))))
+            for c in shapes[: u_dims[0]]
+        ]
+        after = [
+            list(zip(_slices(c), c, range(len(c))))
+            for c in shapes[u_dims[-1] + 1 :]
+        ]
+        n_before = len(before)
 
-        # The indices of the compressed array that correspond to each
-        # subarray
+        u_indices = []
+        u_shapes = []
         c_indices = []
-        for d, size in enumerate(self.source().shape):
-            if d == d1:
-                c_indices.append((slice(0, size),))
-            else:
-                if d < d1:
-                    c = shapes[d]
-                else:
-                    c = shapes[d + len(u_dims) - 1]
+        uncompressed_indices = []
+        compressed_positions = []
+        locations = []
+        for x in product(*before, gathered, *after):
+            b = x[:n_before]
+            g = x[n_before]
+            a = x[n_before + 1 :]
 
-                c = tuple(accumulate((0,) + c))
-                c_indices.append([slice(i, j) for i, j in zip(c[:-1], c[1:])])
+            u_indices.append(
+                tuple(i[0] for i in b) + g[0] + tuple(i[0] for i in a)
+            )
+            u_shapes.append(
+                tuple(i[1] for i in b) + g[1] + tuple(i[1] for i in a)
+            )
+            c_indices.append(
+                tuple(i[0] for i in b) + (g[2],) + tuple(i[0] for i in a)
+            )
+            uncompressed_indices.append(
+                (slice(None),) * n_before + g[3] + (slice(None),) * len(a)
+            )
+            compressed_positions.append(g[4])
+            locations.append(
+                tuple(i[2] for i in b) + g[5] + tuple(i[2] for i in a)
+            )
 
         return (
-            product(*u_indices),
-            product(*u_shapes),
-            product(*c_indices),
-            product(*locations),
+            u_indices,
+            u_shapes,
+            c_indices,
+            uncompressed_indices,
+            compressed_positions,
+            locations,
         )
 
+    def to_dask_array(self, chunks="auto"):
+        """Convert the data to a `dask` array.
+
+        Each dask chunk reads only the part of the compressed data
+        that spans the elements of the chunk.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            chunks: `int`, `tuple`, `dict` or `str`, optional
+                Specify the chunking of the returned dask array.
+
+                Any value accepted by the *chunks* parameter of the
+                `dask.array.from_array` function is allowed.
+
+        :Returns:
+
+            `dask.array.Array`
+                The `dask` array representation.
+
+        """
+        from functools import partial
+
+        import dask.array as da
+        from dask import config
+        from dask.base import tokenize
+
+        getter = da.core.getter
+
+        from .utils import normalize_chunks
+
+        name = (f"{self.__class__.__name__}-{tokenize(self)}",)
+
+        dtype = self.dtype
+
+        context = partial(config.set, scheduler="synchronous")
+
+        # If possible, convert the compressed data to a dask array
+        # that doesn't support concurrent reads. This prevents
+        # "compute called by compute" failures problems at compute
+        # time.
+        subarray_kwargs = {
+            "data": self._lock_file_read(self.source().copy()),
+            **self.subarray_parameters(),
+        }
+
+        # Get the (cfdm) subarray class
+        Subarray = self.get_Subarray()
+        subarray_name = Subarray().__class__.__name__
+
+        # Set the chunk sizes for the dask array
+        chunks = normalize_chunks(
+            self.subarray_shapes(chunks),
+            shape=self.shape,
+            dtype=dtype,
+        )
+
+        dsk = {}
+        for (
+            u_indices,
+            u_shape,
+            c_indices,
+            uncompressed_indices,
+            compressed_positions,
+            chunk_location,
+        ) in zip(*self.subarrays(chunks)):
+            subarray = Subarray(
+                indices=c_indices,
+                shape=u_shape,
+                uncompressed_indices=uncompressed_indices,
+                compressed_positions=compressed_positions,
+                context_manager=context,
+                **subarray_kwargs,
+            )
+
+            # Tokenise the subarray from its indices, rather than
+            # from its compressed data, which is shared by all
+            # subarrays and has already contributed to the token in
+            # 'name'
+            key = f"{subarray_name}-{tokenize(name, u_indices, c_indices)}"
+            dsk[key] = subarray
+            dsk[name + chunk_location] = (getter, key, Ellipsis, False, False)
+
+        # Return the dask array
+        return da.Array(dsk, name[0], chunks=chunks, dtype=dtype)
+
     def to_memory(self):
         """Bring data on disk into memory.
 
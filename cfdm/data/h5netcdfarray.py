@@ -1,7 +1,7 @@
 import logging
 
 from . import abstract
-from .locks import netcdf_lock
+from .locks import get_lock
 from .mixin import IndexMixin
 from .netcdfindexer import netcdf_indexer
 
@@ -18,18 +18,24 @@ class H5netcdfArray(IndexMixin, abstract.FileArray):
 
     """
 
+    # Share open datasets via the pool of open datasets
+    _pool_datasets = True
+
     @property
     def _lock(self):
         """Return the lock used for netCDF file access.
 
         Returns a lock object that prevents concurrent reads of netCDF
         files, which are not currently supported by `h5netcdf` with
-        the `h5py` backend.
+        the `h5py` backend. The lock is defined by the current
+        `{{package}}.lock_policy`.
 
         .. versionadded:: (cfdm) 1.11.2.0
 
         """
-        return netcdf_lock
+        return get_lock(
+            "h5netcdf", self.get_filename(normalise=True, default=None)
+        )
 
     def _attributes(self, var):
         """Get the netCDF variable attributes.
@@ -153,7 +159,7 @@ class H5netcdfArray(IndexMixin, abstract.FileArray):
             `None`
 
         """
-        if self._get_component("close"):
+        if not self._release(dataset) and self._get_component("close"):
             dataset.close()
 
     def get_groups(self, address):
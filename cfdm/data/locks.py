@@ -1,3 +1,111 @@
 from threading import Lock
 
+from ..functions import lock_policy
+
+# The global lock, shared by all datasets when the lock policy is
+# 'global'
 netcdf_lock = Lock()
+
+# The per-dataset locks, keyed by (backend, normalised dataset name),
+# used when the lock policy is 'file'
+_file_locks = {}
+
+# Protects the creation of new per-dataset locks
+_file_locks_lock = Lock()
+
+
+class NoLock:
+    """A lock that never blocks.
+
+    Used for dataset access when the lock policy is ``'none'``. It
+    supports the same interface as `threading.Lock`.
+
+    .. versionadded:: (cfdm) NEXTVERSION
+
+    """
+
+    def __enter__(self):
+        """Enter the runtime context."""
+        return True
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Exit the runtime context."""
+        pass
+
+    def __repr__(self):
+        """Called by the `repr` built-in function."""
+        return f"<{self.__class__.__name__}>"
+
+    def acquire(self, blocking=True, timeout=-1):
+        """Acquire the lock, which always succeeds immediately."""
+        return True
+
+    def locked(self):
+        """Return whether the lock is held, which is never."""
+        return False
+
+    def release(self):
+        """Release the lock."""
+        pass
+
+
+no_lock = NoLock()
+
+
+def get_lock(backend, filename=None):
+    """Return the lock that controls access to a dataset.
+
+    The lock returned depends on the current value of
+    `cfdm.lock_policy`:
+
+    * ``'global'``: The single process-wide lock, `netcdf_lock`, is
+      returned for all datasets.
+
+    * ``'file'``: A lock that is unique to the combination of
+      *backend* and *filename* is returned, so that different
+      datasets may be accessed concurrently. If *filename* is `None`
+      then the global lock is returned.
+
+    * ``'none'``: A lock that never blocks is returned.
+
+    .. versionadded:: (cfdm) NEXTVERSION
+
+    .. seealso:: `cfdm.lock_policy`
+
+    :Parameters:
+
+        backend: `str`
+            The name of the library used to access the dataset,
+            e.g. ``'netCDF4'`` or ``'h5netcdf'``.
+
+        filename: `str` or `None`, optional
+            The normalised name of the dataset.
+
+    :Returns:
+
+            The lock.
+
+    **Examples**
+
+    >>> get_lock('netCDF4', '/data/file.nc')
+    <unlocked _thread.lock object at 0x7f5d3c2b9c80>
+    >>> with cfdm.lock_policy('none'):
+    ...     print(get_lock('netCDF4', '/data/file.nc'))
+    ...
+    <NoLock>
+
+    """
+    policy = lock_policy().value
+    if policy == "global" or (policy == "file" and filename is None):
+        return netcdf_lock
+
+    if policy == "none":
+        return no_lock
+
+    key = (backend, filename)
+    lock = _file_locks.get(key)
+    if lock is None:
+        with _file_locks_lock:
+            lock = _file_locks.setdefault(key, Lock())
+
+    return lock
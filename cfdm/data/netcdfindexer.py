@@ -380,6 +380,57 @@ class netcdf_indexer:
 
         return safe, attvalue
 
+    @staticmethod
+    def _combine_mask(masks, ufunc, *args):
+        """Combine a masking condition with the total mask in-place.
+
+        The condition is evaluated into a Boolean work array that is
+        reused for every condition, and then combined with the total
+        mask in-place, so that at most two Boolean arrays are created
+        however many conditions there are.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        .. seealso:: `_mask`
+
+        :Parameter:
+
+            masks: `list`
+                The total Boolean mask and the Boolean work array,
+                either of which may be `None` if it has not yet been
+                created. Updated in-place.
+
+            ufunc: `numpy.ufunc`
+                The function that evaluates the condition, e.g.
+                `numpy.equal` or `numpy.isnan`.
+
+            args:
+                The inputs to *ufunc*.
+
+        :Returns:
+
+            `bool`
+                Whether or not any elements satisfy the condition.
+
+        """
+        totalmask, work = masks
+        if totalmask is None:
+            # Must use `np.asanyarray` here, to ensure that the mask
+            # is never a `bool`, which would make it immutable.
+            masks[0] = np.asanyarray(ufunc(*args))
+            return bool(masks[0].any())
+
+        if work is None:
+            work = np.empty(totalmask.shape, dtype=bool)
+            masks[1] = work
+
+        ufunc(*args, out=work)
+        if not work.any():
+            return False
+
+        np.logical_or(totalmask, work, out=totalmask)
+        return True
+
     def _default_FillValue(self, dtype):
         """Return the default ``_FillValue`` for the given data type.
 
@@ -565,11 +616,17 @@ class netcdf_indexer:
                 The masked data.
 
         """
-        # The Boolean mask accounting for all methods of specification
-        totalmask = None
+        # The Boolean mask accounting for all methods of
+        # specification, and a reusable Boolean work array. Both are
+        # created when first needed, and are then updated in-place.
+        masks = [None, None]
         # The fill value for the returned numpy array
         fill_value = None
 
+        # Apply the mask conditions to the raw data values. Any
+        # existing mask is retained when the masked array is created.
+        raw = np.ma.getdata(data)
+
         safe_missval, missing_value = self._check_safecast(
             "missing_value", dtype, attributes
         )
@@ -584,6 +641,7 @@ class netcdf_indexer:
             if not mval.ndim:
                 mval = (mval,)
 
+            found = False
             for m in mval:
                 try:
                     mvalisnan = np.isnan(m)
@@ -592,17 +650,11 @@ class netcdf_indexer:
                     mvalisnan = False
 
                 if mvalisnan:
-                    mask = np.isnan(data)
+                    found |= self._combine_mask(masks, np.isnan, raw)
                 else:
-                    mask = data == m
-
-                if mask.any():
-                    if totalmask is None:
-                        totalmask = mask
-                    else:
-                        totalmask += mask
+                    found |= self._combine_mask(masks, np.equal, raw, m)
 
-            if totalmask is not None:
+            if found:
                 fill_value = mval[0]
 
         # Set mask=True for data == fill value
@@ -632,21 +684,12 @@ class netcdf_indexer:
                 fvalisnan = False
 
             if fvalisnan:
-                mask = np.isnan(data)
+                found = self._combine_mask(masks, np.isnan, raw)
             else:
-                # Must use `np.asanyarray` here, to ensure that
-                # 'mask' is a never a `bool`, which would make the
-                # following 'mask.any' call fail.
-                mask = np.asanyarray(data == fval)
+                found = self._combine_mask(masks, np.equal, raw, fval)
 
-            if mask.any():
-                if fill_value is None:
-                    fill_value = fval
-
-                if totalmask is None:
-                    totalmask = mask
-                else:
-                    totalmask += mask
+            if found and fill_value is None:
+                fill_value = fval
 
         # Set mask=True for data outside [valid_min, valid_max]
         #
@@ -696,22 +739,16 @@ class netcdf_indexer:
                     # valid min must be a scalar
                     validmin = validmin[0]
 
-                mask = data < validmin
-                if totalmask is None:
-                    totalmask = mask
-                else:
-                    totalmask += mask
+                self._combine_mask(masks, np.less, raw, validmin)
 
             if validmax is not None:
                 if validmax.ndim == 1:
                     # valid max must be a scalar
                     validmax = validmax[0]
 
-                mask = data > validmax
-                if totalmask is None:
-                    totalmask = mask
-                else:
-                    totalmask += mask
+                self._combine_mask(masks, np.greater, raw, validmax)
+
+        totalmask = masks[0]
 
         # ------------------------------------------------------------
         # Mask the data
@@ -794,27 +831,86 @@ class netcdf_indexer:
             if add_offset is not None:
                 # scale_factor and add_offset
                 if add_offset != 0.0 or scale_factor != 1.0:
-                    data = data * scale_factor + add_offset
-                    self._copy = False
+                    data = self._scale_and_offset(
+                        data, scale_factor, add_offset
+                    )
                 else:
                     data = data.astype(np.array(scale_factor).dtype)
             else:
                 # scale_factor with no add_offset
                 if scale_factor != 1.0:
-                    data = data * scale_factor
-                    self._copy = False
+                    data = self._scale_and_offset(data, scale_factor, None)
                 else:
                     data = data.astype(scale_factor.dtype)
         elif add_offset is not None:
             # add_offset with no scale_factor
             if add_offset != 0.0:
-                data = data + add_offset
-                self._copy = False
+                data = self._scale_and_offset(data, None, add_offset)
             else:
                 data = data.astype(np.array(add_offset).dtype)
 
         return data
 
+    def _scale_and_offset(self, data, scale_factor, add_offset):
+        """Apply a scale factor and offset to the data.
+
+        The result is written into a single new array, without
+        creating any intermediate arrays, and is the same as
+        ``data * scale_factor + add_offset`` (omitting either of the
+        operations for which the corresponding parameter is `None`).
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        .. seealso:: `_unpack`
+
+        :Parameter:
+
+            data: `numpy.ndarray`
+                The masked and packed data.
+
+            scale_factor: number or `None`
+                The scale factor.
+
+            add_offset: number or `None`
+                The offset.
+
+        :Returns:
+
+            `numpy.ndarray`
+                The unpacked data.
+
+        """
+        raw = np.ma.getdata(data)
+        dtype = np.result_type(
+            *[x for x in (raw, scale_factor, add_offset) if x is not None]
+        )
+        out = np.empty(raw.shape, dtype=dtype)
+
+        if scale_factor is not None:
+            np.multiply(raw, scale_factor, out=out)
+            if add_offset is not None:
+                np.add(out, add_offset, out=out)
+        else:
+            np.add(raw, add_offset, out=out)
+
+        if np.ma.isMA(data):
+            # As for numpy masked array arithmetic, retain the
+            # original values underneath the mask, and the fill value
+            mask = np.ma.getmask(data)
+            if mask is not np.ma.nomask:
+                np.copyto(out, raw, casting="unsafe", where=mask)
+
+            out = np.ma.masked_array(
+                out, mask=mask, fill_value=data._fill_value, copy=False
+            )
+
+        if not out.ndim:
+            # Return a scalar, as for numpy arithmetic
+            out = out[()]
+
+        self._copy = False
+        return out
+
     def _size_1_axis(self):
         """Find the position of a unique size 1 index.
 
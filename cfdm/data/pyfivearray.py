@@ -16,6 +16,9 @@ class PyfiveArray(IndexMixin, FileArray):
 
     """
 
+    # Share open datasets via the pool of open datasets
+    _pool_datasets = True
+
     def _attributes(self, var):
         """Get the netCDF variable attributes.
 
@@ -67,7 +70,6 @@ class PyfiveArray(IndexMixin, FileArray):
         # Get the variable for subspacing
         variable = self.get_variable(None)
 
-        dataset = None
         if variable is None:
             # The variable has not been provided, so get it.
             dataset, address = self.open()
@@ -97,9 +99,6 @@ class PyfiveArray(IndexMixin, FileArray):
         )
         array = array[index]
 
-        if dataset is not None:
-            self.close(dataset0)
-
         return array
 
     def _group(self, dataset, groups):
@@ -144,7 +143,7 @@ class PyfiveArray(IndexMixin, FileArray):
             `None`
 
         """
-        if self._get_component("close"):
+        if not self._release(dataset) and self._get_component("close"):
             dataset.close()
 
     def get_groups(self, address):
@@ -210,7 +209,7 @@ class PyfiveArray(IndexMixin, FileArray):
             h5netcdf.File,
             mode="r",
             decode_vlen_strings=True,
-            netcdf_backend="pyfive",
+            backend="pyfive",
             phony_dims="sort",
             **kwargs
         )
@@ -1,7 +1,5 @@
 from itertools import accumulate, product
 
-import numpy as np
-
 from .abstract import RaggedArray
 from .mixin import CompressedArrayMixin
 
@@ -155,8 +153,7 @@ class RaggedContiguousArray(CompressedArrayMixin, RaggedArray):
         c_indices = []
         for d, size in enumerate(self.source().shape):
             if d == d1:
-                count = np.array(self.get_count()).tolist()
-                c = tuple(accumulate([0] + count))
+                c = self.offset_index()["offsets"].tolist()
             else:
                 if d < d1:
                     c = shapes[d]
@@ -1,7 +1,5 @@
 from itertools import accumulate, product
 
-import numpy as np
-
 from .abstract import RaggedArray
 from .mixin import CompressedArrayMixin
 
@@ -158,9 +156,12 @@ class RaggedIndexedArray(CompressedArrayMixin, RaggedArray):
         c_indices = []
         for d, size in enumerate(self.source().shape):
             if d == d1:
-                index = np.array(self.get_index())
-                unique = np.unique(index).tolist()
-                c_indices.append([np.where(index == i)[0] for i in unique])
+                c_indices.append(
+                    [
+                        self.feature_indices(i)
+                        for i in range(self.shape[u_dims[0]])
+                    ]
+                )
             else:
                 if d < d1:
                     c = shapes[d]
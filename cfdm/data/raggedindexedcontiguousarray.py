@@ -1,7 +1,5 @@
 from itertools import accumulate, product
 
-import numpy as np
-
 from .abstract import RaggedArray
 from .mixin import CompressedArrayMixin
 
@@ -181,33 +179,19 @@ class RaggedIndexedContiguousArray(CompressedArrayMixin, RaggedArray):
         c_indices = []
         for d, size in enumerate(self.source().shape):
             if d == d1:
-                index = np.array(self.get_index())
-                unique = np.unique(index).tolist()
-                count_partial_sums = np.cumsum(
-                    np.array(self.get_count())
-                ).tolist()
-
                 max_n_profiles = self.shape[u_dims[1]]
 
                 ind = []
-                for i in unique:
-                    # find the locations in the count array for the profiles
-                    # in this feature.
-                    profile_locations = np.where(index == i)[0]
-
-                    for j in profile_locations:
-                        if not j:
-                            start = 0
-                        else:
-                            start = count_partial_sums[j - 1]
-
-                        ind.append(slice(start, count_partial_sums[j]))
+                for i in range(self.shape[u_dims[0]]):
+                    # The locations of the elements of each profile in
+                    # this feature
+                    profiles = self.feature_indices(i)
+                    ind.extend(profiles)
 
                     # Add zero-sized slices for this feature's "missing"
                     # profiles
                     ind.extend(
-                        (slice(0, 0),)
-                        * (max_n_profiles - profile_locations.size)
+                        (slice(0, 0),) * (max_n_profiles - len(profiles))
                     )
 
                 c_indices.append(ind)
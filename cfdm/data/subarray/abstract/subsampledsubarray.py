@@ -2,6 +2,7 @@ import numpy as np
 
 from cfdm.core.utils import cached_property
 
+from ...tiepointcache import tie_point_cache
 from .subarray import Subarray
 
 
@@ -16,10 +17,24 @@ class SubsampledSubarray(Subarray):
     See CF section 8.3 "Lossy Compression by Coordinate Subsampling"
     and appendix J "Coordinate Interpolation Methods".
 
+    A subarray may instead span a batch of consecutive interpolation
+    subareas along each subsampled dimension, in which case all of
+    the interpolation subareas in the batch are interpolated together
+    with vectorised operations.
+
     .. versionadded:: (cfdm) 1.10.0.0
 
     """
 
+    # Whether or not the interpolation method may be applied to a
+    # batch of interpolation subareas. This is only possible when
+    # the interpolation method is computed with element-wise
+    # operations that broadcast the tie points and interpolation
+    # parameters to the interpolation coefficients.
+    #
+    # .. versionadded:: (cfdm) NEXTVERSION
+    _batchable = False
+
     def __init__(
         self,
         data=None,
@@ -28,9 +43,11 @@ class SubsampledSubarray(Subarray):
         compressed_dimensions=None,
         subarea_indices=None,
         first=None,
+        subarea_sizes=None,
         parameters=None,
         dependent_tie_points=None,
         interpolation_description=None,
+        tie_point_keys=None,
         source=None,
         copy=True,
         context_manager=None,
@@ -45,7 +62,11 @@ class SubsampledSubarray(Subarray):
                 are defined by the *indices*.
 
             indices: `tuple`
-                The indices of *data* that define this subarray.
+                The indices of *data* that define this subarray. For
+                a batch of interpolation subareas (see
+                *subarea_sizes*), the index for each batched
+                dimension is a `list` of the indices of each
+                interpolation subarea.
 
             shape: `tuple` of `int`
                 The shape of the uncompressed subarray.
@@ -61,13 +82,37 @@ class SubsampledSubarray(Subarray):
             first: `tuple` of `bool`
                 For each dimension of the tie points array, True if
                 the interpolation subarea is the first along that
-                dimension of the continuous area, otherwise False.
+                dimension of the continuous area, otherwise False. For
+                a batch of interpolation subareas, the flag for each
+                batched dimension is a `list` of the flags of each
+                interpolation subarea.
 
             subarea_indices: `tuple` of `slice`
                 For each dimension of the tie points array, the index
                 that defines the location of the interpolation subarea
                 in interpolation-subarea-space. An index corresponding
                 to a non-interpolated dimension must be `slice(None)`.
+                For a batch of interpolation subareas, the index for
+                each batched dimension is a `list` of the indices of
+                each interpolation subarea.
+
+            subarea_sizes: `dict`, optional
+                Define a batch of consecutive interpolation subareas
+                along one or more subsampled dimensions. Each key is
+                a subsampled dimension position in the tie points
+                array, with a value of a `list` of the sizes of the
+                uncompressed interpolation subareas along that
+                dimension, excluding any tie point locations that are
+                defined by previous interpolation subareas. The sizes
+                must add up to the subarray size along that
+                dimension. By default there is no batching, and the
+                subarray corresponds to a single interpolation
+                subarea.
+
+                *Parameter example:*
+                  ``{1: [16, 15, 15, 15]}``
+
+                .. versionadded:: (cfdm) NEXTVERSION
 
             parameters: `dict`, optional
                 If the interpolation method requires interpolation
@@ -103,6 +148,21 @@ class SubsampledSubarray(Subarray):
                 A complete description of the non-standardised
                 interpolation method.
 
+            tie_point_keys: `dict`, optional
+                The keys that identify the tie points, interpolation
+                parameter and dependent tie point arrays in the tie
+                point cache that is shared with other subarrays in
+                the same process, so that each of these arrays need
+                only be read once. Each key is a 2-tuple of the token
+                of an array and the names of the files that contain
+                it, and the dictionary is keyed by the array's name,
+                i.e. ``'data'``, ``('parameters', term)``, or
+                ``('dependent_tie_points', identity)``. By default the
+                cache is not used, and each subarray reads the values
+                that it needs.
+
+                .. versionadded:: (cfdm) NEXTVERSION
+
             {{init source: optional}}
 
             {{init copy: `bool`, optional}}
@@ -136,6 +196,11 @@ class SubsampledSubarray(Subarray):
             except AttributeError:
                 first = None
 
+            try:
+                subarea_sizes = source._get_component("subarea_sizes", {})
+            except AttributeError:
+                subarea_sizes = {}
+
             try:
                 parameters = source._get_component("parameters", {})
             except AttributeError:
@@ -155,12 +220,22 @@ class SubsampledSubarray(Subarray):
             except AttributeError:
                 interpolation_description = None
 
+            try:
+                tie_point_keys = source._get_component("tie_point_keys", None)
+            except AttributeError:
+                tie_point_keys = None
+
         if subarea_indices is not None:
             self._set_component("subarea_indices", subarea_indices, copy=copy)
 
         if first is not None:
             self._set_component("first", first, copy=False)
 
+        if subarea_sizes is None:
+            subarea_sizes = {}
+
+        self._set_component("subarea_sizes", subarea_sizes.copy(), copy=False)
+
         if parameters is not None:
             self._set_component("parameters", parameters.copy(), copy=False)
 
@@ -176,6 +251,59 @@ class SubsampledSubarray(Subarray):
                 copy=False,
             )
 
+        self._set_component("tie_point_keys", tie_point_keys, copy=False)
+
+    def _asanyarray(self, data, indices=None, check_mask=True):
+        """Convert data to a `numpy` array.
+
+        If the tie point cache is being used, and *data* is the tie
+        points array, an interpolation parameter array, or a
+        dependent tie points array, then *data* is first replaced
+        with its cached in-memory copy.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        .. seealso:: `tie_point_keys`
+
+        :Parameters:
+
+            data: array_like
+                The data to be converted.
+
+            check_mask: `bool`, optional
+                Check for masked elements, and if there are none
+                convert the output to a non-masked `numpy` array.
+
+        :Returns:
+
+            `numpy.ndarray`
+                The converted data.
+
+        """
+        keys = self.tie_point_keys
+        if keys:
+            key = keys.get(self._cache_key(data))
+            if key is not None:
+                cached = tie_point_cache.get(
+                    key, data, self._get_component("context_manager")
+                )
+                if cached is not None:
+                    if indices is not None:
+                        cached = cached[indices]
+
+                    if (
+                        check_mask
+                        and np.ma.isMA(cached)
+                        and not np.ma.is_masked(cached)
+                    ):
+                        cached = np.array(cached)
+
+                    return cached
+
+        return super()._asanyarray(
+            data, indices=indices, check_mask=check_mask
+        )
+
     def _broadcast_bounds(self, u):
         """Broadcast the raw uncompressed data to bounds locations.
 
@@ -214,37 +342,67 @@ class SubsampledSubarray(Subarray):
         subsampled_dimensions = sorted(self.compressed_dimensions())
         n = len(subsampled_dimensions)
 
-        indices = [slice(None)] * u.ndim
+        # The indices of the lower and upper bound locations along
+        # each subsampled dimension
+        batch = self._batch
+        lower = {}
+        upper = {}
+        for d in subsampled_dimensions:
+            if d in batch:
+                lower[d] = batch[d]["lower"]
+                upper[d] = batch[d]["upper"]
+            else:
+                lower[d] = slice(0, -1)
+                upper[d] = slice(1, None)
 
         if n == 1:
             (d1,) = subsampled_dimensions
 
-            indices[d1] = slice(0, -1)
-            bounds[..., 0] = u[tuple(indices)]
-
-            indices[d1] = slice(1, None)
-            bounds[..., 1] = u[tuple(indices)]
+            bounds[..., 0] = self._subspace(u, {d1: lower[d1]})
+            bounds[..., 1] = self._subspace(u, {d1: upper[d1]})
         elif n == 2:
-            (d1, d2) = subsampled_dimensions
+            d1, d2 = subsampled_dimensions
 
-            indices[d1] = slice(0, -1)
-            indices[d2] = slice(0, -1)
-            bounds[..., 0] = u[tuple(indices)]
-
-            indices[d2] = slice(1, None)
-            bounds[..., 1] = u[tuple(indices)]
-
-            indices[d1] = slice(1, None)
-            bounds[..., 2] = u[tuple(indices)]
-
-            indices[d2] = slice(1, None)
-            indices[d2] = slice(0, -1)
-            bounds[..., 3] = u[tuple(indices)]
+            bounds[..., 0] = self._subspace(u, {d1: lower[d1], d2: lower[d2]})
+            bounds[..., 1] = self._subspace(u, {d1: lower[d1], d2: upper[d2]})
+            bounds[..., 2] = self._subspace(u, {d1: upper[d1], d2: upper[d2]})
+            bounds[..., 3] = self._subspace(u, {d1: upper[d1], d2: lower[d2]})
         else:
             raise ValueError("Can only deal with 1 or 2 subsampled dimensions")
 
         return bounds
 
+    def _cache_key(self, array):
+        """The name of an array in the tie point cache keys.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        .. seealso:: `tie_point_keys`
+
+        :Parameters:
+
+            array: array_like
+                The array.
+
+        :Returns:
+
+            `str` or `tuple` or `None`
+                The name, or `None` if *array* is not the tie points
+                array, an interpolation parameter array, or a
+                dependent tie points array.
+
+        """
+        if array is self.data:
+            return "data"
+
+        for term, parameter in self.parameters.items():
+            if array is parameter:
+                return ("parameters", term)
+
+        for identity, tie_points in self.dependent_tie_points.items():
+            if array is tie_points:
+                return ("dependent_tie_points", identity)
+
     def _codependent_tie_points(self, *identities):
         """Get all codependent tie points.
 
@@ -390,21 +548,131 @@ class SubsampledSubarray(Subarray):
             s.resize((1,) * ndim)
             return s
 
-        size = self.shape[d]
-        if self.bounds or not self.first[d]:
-            size = size + 1
+        batch = self._batch.get(d)
+        if batch is not None:
+            # Interpolation coefficients for every interpolation
+            # subarea in the batch
+            s = batch["s"]
+            size = s.size
+        else:
+            size = self.shape[d]
+            if self.bounds or not self.first[d]:
+                size = size + 1
 
-        s = np.linspace(0, 1, size, dtype=self.dtype)
+            s = np.linspace(0, 1, size, dtype=self.dtype)
 
         # Add extra size 1 dimensions so that s and 1-s are guaranteed
         # to be broadcastable to the tie points.
         if ndim > 1:
             new_shape = [1] * ndim
             new_shape[d] = size
-            s.resize(new_shape)
+            s = s.reshape(new_shape)
 
         return s
 
+    def _select_batch_parameter(self, parameter):
+        """Select interpolation parameter values for a batch.
+
+        Selects the interpolation parameter values for a batch of
+        interpolation subareas.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        .. seealso:: `_select_parameter`
+
+        :Parameters:
+
+            parameter: array_like
+                The interpolation parameter array.
+
+        :Returns:
+
+            `numpy.ndarray`
+                The values of the interpolation parameter array for
+                the batch. Along each batched dimension that the
+                parameter shares with the tie points, the values at
+                tie point position 0 are followed by those at tie
+                point position 1 (see `_select_location`). Along each
+                batched interpolation subarea dimension, the values
+                are broadcast to every uncompressed location of the
+                batch.
+
+        """
+        batch = self._batch
+
+        indices = []
+        take = {}
+        for dim, (m, n) in enumerate(zip(parameter.shape, self.data.shape)):
+            b = batch.get(dim)
+            if m == 1 and n != 1:
+                # Size 1 dimensions are broadcast
+                index = slice(None)
+            elif b is None:
+                if m == n:
+                    index = self.indices[dim]
+                else:
+                    index = self.subarea_indices[dim]
+            elif m == n:
+                index = b["tie_points"]
+                take[dim] = b["ab"]
+            else:
+                index = b["subareas"]
+                take[dim] = b["j"]
+
+            indices.append(index)
+
+        parameter = self._asanyarray(parameter, tuple(indices))
+        for dim, index in take.items():
+            parameter = np.take(parameter, index, axis=dim)
+
+        return parameter
+
+    def _select_data(self, data=None, check_mask=True):
+        """Select compressed elements that correspond to this subarray.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            data: array_like or `None`
+                A full compressed array spanning all subarrays, from
+                which the elements for this subarray will be
+                returned. By default, or if `None` then the `data`
+                array is used.
+
+            check_mask: `bool`, optional
+                Check for masked elements in the selected data, and if
+                there are none convert the output to a non-masked
+                `numpy` array.
+
+        :Returns:
+
+            `numpy.ndarray`
+                Values of the compressed array that correspond to this
+                subarray. For a batch of interpolation subareas, the
+                values along each batched dimension are those at tie
+                point position 0 followed by those at tie point
+                position 1, each broadcast to every uncompressed
+                location of the batch (see `_select_location`).
+
+        """
+        batch = self._batch
+        if not batch:
+            return super()._select_data(data=data, check_mask=check_mask)
+
+        if data is None:
+            data = self.data
+
+        indices = tuple(
+            batch[dim]["tie_points"] if dim in batch else index
+            for dim, index in enumerate(self.indices)
+        )
+        data = self._asanyarray(data, indices=indices, check_mask=check_mask)
+        for dim, b in batch.items():
+            data = np.take(data, b["ab"], axis=dim)
+
+        return data
+
     def _select_location(self, array, location=None):
         """Select interpolation parameter points interpolation subarea.
 
@@ -431,6 +699,12 @@ class SubsampledSubarray(Subarray):
                 default, or if location is an empty dictionary, then
                 all values for the interpolation subarea are returned.
 
+                For a batch of interpolation subareas, the values
+                for each batched dimension are those at the given
+                tie point position of every interpolation subarea,
+                broadcast to every uncompressed location of the
+                batch.
+
         :Returns:
 
             `numpy.ndarray` or `None`
@@ -441,9 +715,20 @@ class SubsampledSubarray(Subarray):
             return
 
         if location:
+            batch = self._batch
             indices = [slice(None)] * array.ndim
             for subsampled_dimension, loc in location.items():
-                indices[subsampled_dimension] = slice(loc, loc + 1)
+                b = batch.get(subsampled_dimension)
+                if b is None:
+                    indices[subsampled_dimension] = slice(loc, loc + 1)
+                elif array.shape[subsampled_dimension] == 2 * b["size"]:
+                    # The values at tie point position 0 are followed
+                    # by those at tie point position 1 (see
+                    # `_select_data`)
+                    size = b["size"]
+                    indices[subsampled_dimension] = slice(
+                        loc * size, (loc + 1) * size
+                    )
 
             array = array[tuple(indices)]
 
@@ -479,6 +764,10 @@ class SubsampledSubarray(Subarray):
         if parameter is None:
             return
 
+        batch = self._batch
+        if batch:
+            return self._select_batch_parameter(parameter)
+
         # Find the parameter array dimensions which are subsampled
         # dimensions
         subsampled_dimensions = [
@@ -499,6 +788,37 @@ class SubsampledSubarray(Subarray):
 
         return self._asanyarray(parameter, indices)
 
+    @staticmethod
+    def _subspace(u, indices):
+        """Subspace an array independently along given dimensions.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        .. seealso:: `_broadcast_bounds`, `_trim`
+
+        :Parameters:
+
+            u: `numpy.ndarray`
+                The array to be subspaced.
+
+            indices: `dict`
+                Each key is a dimension position, with a value of a
+                `slice` or a sequence of integers that subspaces that
+                dimension. The dimensions are subspaced
+                independently of each other.
+
+        :Returns:
+
+            `numpy.ndarray`
+
+        """
+        for dim, index in indices.items():
+            i = [slice(None)] * u.ndim
+            i[dim] = index
+            u = u[tuple(i)]
+
+        return u
+
     def _trim(self, u):
         """Trim the raw uncompressed data.
 
@@ -535,21 +855,147 @@ class SubsampledSubarray(Subarray):
             return u
 
         first = self.first
+        batch = self._batch
 
-        take_slice = False
-        indices = [slice(None)] * u.ndim
+        indices = {}
         for dim in self.compressed_dimensions():
-            if first[dim]:
-                continue
-
-            take_slice = True
-            indices[dim] = slice(1, None)
+            if dim in batch:
+                keep = batch[dim]["keep"]
+                if keep is not None:
+                    indices[dim] = keep
+            elif not first[dim]:
+                indices[dim] = slice(1, None)
 
-        if take_slice:
-            u = u[tuple(indices)]
+        if indices:
+            u = self._subspace(u, indices)
 
         return u
 
+    @cached_property
+    def _batch(self):
+        """The layout of a batch of interpolation subareas.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        .. seealso:: `subarea_sizes`
+
+        :Returns:
+
+            `dict`
+                For each batched dimension, a dictionary describing
+                the batch along that dimension. The dictionary is
+                empty if the subarray is not a batch of interpolation
+                subareas. The description has the following keys,
+                where the "raw" locations are the uncompressed
+                locations of every interpolation subarea in the
+                batch, including all of its tie point locations:
+
+                ==============  ======================================
+                Key             Value
+                ==============  ======================================
+                ``tie_points``  The index of the tie points array for
+                                the whole batch.
+
+                ``subareas``    The index of the interpolation
+                                subareas for the whole batch.
+
+                ``ab``          For each raw location, the index of
+                                its tie point at position 0, followed
+                                by the same for position 1.
+
+                ``j``           For each raw location, the index of
+                                its interpolation subarea.
+
+                ``s``           For each raw location, its
+                                interpolation coefficient.
+
+                ``size``        The number of raw locations.
+
+                ``keep``        The raw locations that are not
+                                defined by previous interpolation
+                                subareas, or `None` if that is all of
+                                them.
+
+                ``lower``,      For bounds tie points, the raw
+                ``upper``       locations of the lower and upper
+                                bounds of each cell.
+                ==============  ======================================
+
+        """
+        out = {}
+
+        subarea_sizes = self.subarea_sizes
+        if not subarea_sizes:
+            return out
+
+        bounds = self.bounds
+        dtype = self.dtype
+
+        for dim, sizes in subarea_sizes.items():
+            indices = self.indices[dim]
+            subarea_indices = self.subarea_indices[dim]
+            first = self.first[dim]
+
+            tie_point_start = indices[0].start
+            subarea_start = subarea_indices[0].start
+
+            # The number of raw locations in each interpolation
+            # subarea
+            first = np.array(first, dtype=bool)
+            n = np.array(sizes)
+            if bounds:
+                n += 1
+            else:
+                n += ~first
+
+            start = np.cumsum(n) - n
+            size = int(n.sum())
+
+            a = np.repeat(
+                [index.start - tie_point_start for index in indices], n
+            )
+            j = np.repeat(
+                [index.start - subarea_start for index in subarea_indices], n
+            )
+
+            linspace = {}
+            s = []
+            for m in n.tolist():
+                x = linspace.get(m)
+                if x is None:
+                    x = np.linspace(0, 1, m, dtype=dtype)
+                    linspace[m] = x
+
+                s.append(x)
+
+            b = {
+                "tie_points": slice(tie_point_start, indices[-1].stop),
+                "subareas": slice(subarea_start, subarea_indices[-1].stop),
+                "ab": np.concatenate((a, a + 1)),
+                "j": j,
+                "s": np.concatenate(s),
+                "size": size,
+                "keep": None,
+            }
+
+            raw = np.arange(size)
+            if bounds:
+                # Cells do not span adjacent interpolation subareas
+                upper = np.ones(size, dtype=bool)
+                upper[start] = False
+                b["upper"] = raw[upper]
+                b["lower"] = b["upper"] - 1
+            elif not first.all():
+                # Omit the first location of each interpolation
+                # subarea that continues a continuous area
+                keep = np.ones(size, dtype=bool)
+                keep[start[~first]] = False
+                b["keep"] = raw[keep]
+
+            out[dim] = b
+
+        return out
+
     @cached_property
     def bounds(self):
         """True if the tie points array represents bounds tie points.
@@ -604,6 +1050,24 @@ class SubsampledSubarray(Subarray):
         """
         return self._get_component("subarea_indices")
 
+    @property
+    def subarea_sizes(self):
+        """The sizes of a batch of interpolation subareas.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        """
+        return self._get_component("subarea_sizes")
+
+    @property
+    def tie_point_keys(self):
+        """The keys of arrays in the shared tie point cache.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        """
+        return self._get_component("tie_point_keys")
+
     def get_filename(self, normalise=True, default=AttributeError()):
         """Return the name of the file containing the data.
 
@@ -15,6 +15,10 @@ class BiLinearSubarray(BiLinearInterpolation, SubsampledSubarray):
 
     """
 
+    # This interpolation method may be applied to a batch of
+    # interpolation subareas
+    _batchable = True
+
     def __getitem__(self, indices):
         """Return a subspace of the uncompressed data.
 
@@ -26,7 +30,7 @@ class BiLinearSubarray(BiLinearInterpolation, SubsampledSubarray):
         .. versionadded:: (cfdm) 1.10.0.0
 
         """
-        (d2, d1) = sorted(self.compressed_dimensions())
+        d2, d1 = sorted(self.compressed_dimensions())
 
         u_abcd = self._select_data()
 
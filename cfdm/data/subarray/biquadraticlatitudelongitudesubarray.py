@@ -18,6 +18,10 @@ class BiQuadraticLatitudeLongitudeSubarray(
 
     """
 
+    # This interpolation method may be applied to a batch of
+    # interpolation subareas
+    _batchable = True
+
     def __getitem__(self, indices):
         """Return a subspace of the uncompressed data.
 
@@ -29,7 +33,7 @@ class BiQuadraticLatitudeLongitudeSubarray(
         .. versionadded:: (cfdm) 1.10.0.0
 
         """
-        (d2, d1) = sorted(self.compressed_dimensions())
+        d2, d1 = sorted(self.compressed_dimensions())
 
         lat, lon = self._codependent_tie_points("latitude", "longitude")
 
@@ -21,6 +21,8 @@ class GatheredSubarray(Subarray):
         shape=None,
         compressed_dimensions=None,
         uncompressed_indices=None,
+        compressed_positions=None,
+        fill_value=None,
         source=None,
         copy=True,
         context_manager=None,
@@ -62,6 +64,24 @@ class GatheredSubarray(Subarray):
                 Indices of the uncompressed subarray for the
                 compressed data.
 
+            compressed_positions: `numpy.ndarray`, optional
+                The positions along the compressed dimension, relative
+                to the start of the compressed elements defined by
+                *indices*, of the elements that belong to the
+                subarray. By default, or if `None`, all of the
+                elements defined by *indices* belong to the subarray.
+
+                .. versionadded:: (cfdm) NEXTVERSION
+
+            fill_value: scalar, optional
+                If set then uncompressed locations which have no
+                compressed data are set to this value, and a
+                non-masked `numpy` array is returned. By default, or
+                if `None`, a masked array is returned with these
+                locations masked.
+
+                .. versionadded:: (cfdm) NEXTVERSION
+
             {{init source: optional}}
 
             {{init copy: `bool`, optional}}
@@ -89,11 +109,28 @@ class GatheredSubarray(Subarray):
             except AttributeError:
                 uncompressed_indices = None
 
+            try:
+                compressed_positions = source._get_component(
+                    "compressed_positions", None
+                )
+            except AttributeError:
+                compressed_positions = None
+
+            try:
+                fill_value = source._get_component("fill_value", None)
+            except AttributeError:
+                fill_value = None
+
         if uncompressed_indices is not None:
             self._set_component(
                 "uncompressed_indices", uncompressed_indices, copy=False
             )
 
+        self._set_component(
+            "compressed_positions", compressed_positions, copy=False
+        )
+        self._set_component("fill_value", fill_value, copy=False)
+
     def __getitem__(self, indices):
         """Return a subspace of the uncompressed data.
 
@@ -105,15 +142,42 @@ class GatheredSubarray(Subarray):
         .. versionadded:: (cfdm) 1.10.0.0
 
         """
-        u = np.ma.masked_all(self.shape, dtype=self.dtype)
+        fill_value = self.fill_value
+        if fill_value is None:
+            u = np.ma.masked_all(self.shape, dtype=self.dtype)
+        else:
+            u = np.full(self.shape, fill_value, dtype=self.dtype)
 
-        u[self.uncompressed_indices] = self._select_data(check_mask=False)
+        # Only read the compressed data if the subarray contains any
+        # of it
+        (d1,) = self.compressed_dimensions()
+        index = self.indices[d1]
+        if index.stop > index.start:
+            data = self._select_data(check_mask=False)
+
+            compressed_positions = self.compressed_positions
+            if compressed_positions is not None:
+                data = np.take(data, compressed_positions, axis=d1)
+
+            if fill_value is not None:
+                data = np.ma.filled(data, fill_value)
+
+            u[self.uncompressed_indices] = data
 
         if indices is Ellipsis:
             return u
 
         return u[indices]
 
+    @property
+    def compressed_positions(self):
+        """Positions of the subarray elements in the compressed data.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        """
+        return self._get_component("compressed_positions")
+
     @property
     def dtype(self):
         """The data-type of the uncompressed data.
@@ -123,6 +187,15 @@ class GatheredSubarray(Subarray):
         """
         return self.data.dtype
 
+    @property
+    def fill_value(self):
+        """The value of uncompressed locations with no compressed data.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        """
+        return self._get_component("fill_value")
+
     @property
     def uncompressed_indices(self):
         """Indices of the uncompressed subarray for the compressed data.
@@ -15,6 +15,10 @@ class LinearSubarray(LinearInterpolation, SubsampledSubarray):
 
     """
 
+    # This interpolation method may be applied to a batch of
+    # interpolation subareas
+    _batchable = True
+
     def __getitem__(self, indices):
         """Return a subspace of the uncompressed data.
 
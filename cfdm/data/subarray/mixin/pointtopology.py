@@ -4,7 +4,8 @@ import numpy as np
 class PointTopology:
     """Mixin class for point topology array compressed by UGRID.
 
-    Subclasses must also inherit from `MeshSubarray`.
+    Subclasses must also inherit from `MeshSubarray`, and must define
+    a `_linked_nodes` method.
 
     .. versionadded:: (cfdm) 1.11.0.0
 
@@ -20,8 +21,6 @@ class PointTopology:
         """
         from math import isnan
 
-        from scipy.sparse import csr_array
-
         from cfdm.functions import integer_dtype
 
         start_index = self.start_index
@@ -31,40 +30,57 @@ class PointTopology:
 
         largest_node_id = node_connectivity.max()
         if not start_index:
-            # Add 1 to remove all zeros (0 is the fill value in the
-            # sparse array), first making sure that the datatpe can
-            # handle it.
+            # Add 1 to remove all zeros (0 is used to pad the rows of
+            # the point topology array), first making sure that the
+            # datatpe can handle it.
             if largest_node_id == np.iinfo(node_connectivity.dtype).max:
                 node_connectivity = node_connectivity.astype(int, copy=False)
 
             node_connectivity = node_connectivity + 1
             largest_node_id = largest_node_id + 1
 
-        p = 0
-        pointers = [0]
-        cols = []
-        u = []
-
-        pointers_append = pointers.append
-        cols_extend = cols.extend
-        u_extend = u.extend
-
-        # WARNING (TODO): This loop is a potential performance bottleneck.
-        for node in np.unique(node_connectivity).tolist():
-            # Find the collection of all nodes that are joined to this
-            # node via links in the mesh, including this node itself
-            # (which will be at the start of the list).
-            nodes = self._connected_nodes(node, node_connectivity, masked)
-
-            n_nodes = len(nodes)
-            p += n_nodes
-            pointers_append(p)
-            cols_extend(range(n_nodes))
-            u_extend(nodes)
-
-        u = np.array(u, dtype=integer_dtype(largest_node_id))
-        u = csr_array((u, cols, pointers))
-        u = u.toarray()
+        # Find every pair of nodes that are joined by a link in the
+        # mesh
+        nodes, links = self._linked_nodes(node_connectivity, masked)
+
+        # Sort the pairs by node, and then by linked node, and remove
+        # duplicates. Each pair is encoded as a single integer (node
+        # identifiers index the UGRID node dimension, so this can't
+        # overflow for any realistic mesh).
+        base = int(largest_node_id) + 1
+        pairs = nodes.astype("int64") * base + links
+        pairs.sort()
+        if pairs.size:
+            keep = np.empty(pairs.shape, dtype=bool)
+            keep[0] = True
+            np.not_equal(pairs[1:], pairs[:-1], out=keep[1:])
+            pairs = pairs[keep]
+
+        nodes, links = np.divmod(pairs, base)
+
+        # Find the nodes that are in the mesh, and the row of the
+        # point topology array for each one
+        if masked:
+            node_connectivity = node_connectivity.compressed()
+
+        in_mesh = np.zeros((base,), dtype=bool)
+        in_mesh[node_connectivity] = True
+        unique_nodes = np.flatnonzero(in_mesh)
+        rows = np.cumsum(in_mesh)[nodes] - 1
+
+        # Each row of the point topology array contains a node,
+        # followed by all of the nodes that are linked to it
+        n_links = np.bincount(rows, minlength=unique_nodes.size)
+        cols = (
+            np.arange(1, rows.size + 1) - (np.cumsum(n_links) - n_links)[rows]
+        )
+
+        u = np.zeros(
+            (unique_nodes.size, int(n_links.max(initial=0)) + 1),
+            dtype=integer_dtype(largest_node_id),
+        )
+        u[:, 0] = unique_nodes
+        u[rows, cols] = links
 
         if any(map(isnan, self.shape)):
             # Store the shape, now that is it known.
@@ -73,11 +89,13 @@ class PointTopology:
         if indices is not Ellipsis:
             u = u[indices]
 
-        # Mask all zeros
-        u = np.ma.where(u == 0, np.ma.masked, u)
+        # Mask all zeros (i.e. the padding)
+        mask = u == 0
 
         if not start_index:
             # Subtract 1 to get back to zero-based node identities
             u -= 1
 
+        u = np.ma.masked_where(mask, u, copy=False)
+
         return u
@@ -13,19 +13,13 @@ class PointTopologyFromEdgesSubarray(PointTopology, MeshSubarray):
 
     """
 
-    def _connected_nodes(self, node, node_connectivity, masked):
-        """Return the nodes that are joined to *node* by edges.
+    def _linked_nodes(self, node_connectivity, masked):
+        """Return all pairs of nodes that are joined by edges.
 
-        The input *node* is included at the start of the returned
-        list.
-
-        .. versionadded:: (cfdm) 1.11.0.0
+        .. versionadded:: (cfdm) NEXTVERSION
 
         :Parameters:
 
-            node: `int`
-                A node identifier.
-
             node_connectivity: `numpy.ndarray`
                 A UGRID "edge_node_connectivity" array.
 
@@ -35,21 +29,20 @@ class PointTopologyFromEdgesSubarray(PointTopology, MeshSubarray):
 
         :Returns:
 
-            `list`
-                All nodes that are joined to *node*, including *node*
-                itself at the start.
+            2-`tuple` of `numpy.ndarray`
+                The nodes, and the nodes that are linked to each of
+                them. A pair may appear more than once.
 
         """
-        nodes = sorted(
-            set(
-                node_connectivity[np.where(node_connectivity == node)[0]]
-                .flatten()
-                .tolist()
-            )
-        )
-
-        # Move 'node' to the front of the list
-        nodes.remove(node)
-        nodes.insert(0, node)
-
-        return nodes
+        if masked:
+            node_connectivity = np.ma.compress_rows(node_connectivity)
+
+        a = node_connectivity[:, 0]
+        b = node_connectivity[:, 1]
+
+        # Links are in both directions, and a node is not linked to
+        # itself
+        nodes = np.concatenate((a, b))
+        links = np.concatenate((b, a))
+        linked = nodes != links
+        return nodes[linked], links[linked]
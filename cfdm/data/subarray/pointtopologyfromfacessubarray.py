@@ -13,19 +13,16 @@ class PointTopologyFromFacesSubarray(PointTopology, MeshSubarray):
 
     """
 
-    def _connected_nodes(self, node, node_connectivity, masked):
-        """Return nodes that are joined to *node* by face edges.
+    def _linked_nodes(self, node_connectivity, masked):
+        """Return all pairs of nodes that are joined by face edges.
 
-        The input *node* is included at the start of the returned
-        list.
+        A node is linked to each node that immediately precedes it
+        around the boundary of any face.
 
-        .. versionadded:: (cfdm) 1.11.0.0
+        .. versionadded:: (cfdm) NEXTVERSION
 
         :Parameters:
 
-            node: `int`
-                A node identifier.
-
             node_connectivity: `numpy.ndarray`
                 A UGRID "face_node_connectivity" array.
 
@@ -35,41 +32,25 @@ class PointTopologyFromFacesSubarray(PointTopology, MeshSubarray):
 
         :Returns:
 
-            `list`
-                All nodes that are joined to *node*, including *node*
-                itself at the start.
+            2-`tuple` of `numpy.ndarray`
+                The nodes, and the nodes that are linked to each of
+                them. A pair may appear more than once.
 
         """
         if masked:
-            where = np.ma.where
+            mask = np.ma.getmaskarray(node_connectivity)
+            node_connectivity = np.ma.getdata(node_connectivity)
         else:
-            where = np.where
-
-        # Find the faces that contain this node:
-        faces = where(node_connectivity == node)[0]
-
-        nodes = []
-        nodes_extend = nodes.extend
-
-        # For each face, find which two of its nodes are neighbours to
-        # 'node'.
-        for face_nodes in node_connectivity[faces]:
-            if masked:
-                face_nodes = face_nodes.compressed()
-
-            face_nodes = face_nodes.tolist()
-            face_nodes.append(face_nodes[0])
-            nodes_extend(
-                [
-                    m
-                    for m, n in zip(face_nodes[:-1], face_nodes[1:])
-                    if n == node
-                ]
-            )
-
-        nodes = list(set(nodes))
-
-        # Insert 'node' at the front of the list
-        nodes.insert(0, node)
-
-        return nodes
+            mask = np.zeros(node_connectivity.shape, dtype=bool)
+
+        # The node that precedes each node around its face, where the
+        # first node of a face is preceded by the last unmasked node
+        # of that face
+        previous = np.roll(node_connectivity, 1, axis=1)
+        n_nodes = node_connectivity.shape[1] - mask.sum(axis=1)
+        previous[:, 0] = node_connectivity[
+            np.arange(node_connectivity.shape[0]), np.maximum(n_nodes - 1, 0)
+        ]
+
+        valid = ~mask
+        return node_connectivity[valid], previous[valid]
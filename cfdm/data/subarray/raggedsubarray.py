@@ -28,9 +28,20 @@ class RaggedSubarray(Subarray):
         d1, u_dims = self.compressed_dimensions().popitem()
         uncompressed_shape = self.shape
 
-        data = self._select_data(check_mask=False)
+        index = self.indices[d1]
+        if isinstance(index, slice):
+            empty = index.stop <= index.start
+        else:
+            empty = not len(index)
+
+        if empty:
+            # Don't read the compressed data when the subarray
+            # contains none of it
+            data = None
+        else:
+            data = self._select_data(check_mask=False)
 
-        if data.size:
+        if data is not None and data.size:
             shape = list(data.shape)
             u_indices0 = [slice(None)] * data.ndim
 
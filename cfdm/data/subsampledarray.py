@@ -1,3 +1,4 @@
+from collections.abc import Sequence
 from functools import partial
 from itertools import accumulate, product
 from numbers import Number
@@ -6,6 +7,7 @@ import numpy as np
 
 from cfdm.core.utils import cached_property
 
+from ..functions import tie_point_cache_size
 from .abstract import CompressedArray
 from .mixin import CompressedArrayMixin
 from .netcdfindexer import netcdf_indexer
@@ -387,15 +389,25 @@ class SubsampledArray(CompressedArrayMixin, CompressedArray):
         u = np.ma.masked_all(self.shape, dtype=self.dtype)
 
         Subarray = self.get_Subarray()
+        conformed_data = self.conformed_data()
+        subarrays = list(zip(*self.subarrays()))
         subarray_kwargs = {
-            **self.conformed_data(),
+            **conformed_data,
             **self.subarray_parameters(),
+            "tie_point_keys": self._tie_point_keys(
+                len(subarrays), **conformed_data
+            ),
         }
 
         # Interpolate the tie points for each interpolation subarea
-        for u_indices, u_shape, c_indices, subarea_indices, first, _ in zip(
-            *self.subarrays()
-        ):
+        for (
+            u_indices,
+            u_shape,
+            c_indices,
+            subarea_indices,
+            first,
+            _,
+        ) in subarrays:
             subarray = Subarray(
                 indices=c_indices,
                 shape=u_shape,
@@ -578,6 +590,81 @@ class SubsampledArray(CompressedArrayMixin, CompressedArray):
 
         return parameters
 
+    def _tie_point_keys(
+        self, n_subarrays, data, parameters, dependent_tie_points
+    ):
+        """Return the tie point cache keys for the subarrays.
+
+        The tie points, interpolation parameters and dependent tie
+        points are cached in memory by the subarrays that use them
+        (see `cfdm.tie_point_cache_size`), so that each array is only
+        read once per process. An array is identified in the cache by
+        its token and the file system signatures (see
+        `DatasetPool._signature`) of the files that contain it, so
+        that a cached array is not used after its file has been
+        modified. There is no caching when there is only one
+        subarray, in which case the subarray reads only the parts of
+        each array that it needs.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        .. seealso:: `conformed_data`
+
+        :Parameters:
+
+            n_subarrays: `int`
+                The number of subarrays that will share the arrays.
+
+            data: array_like
+                The conformed tie points.
+
+            parameters: `dict`
+                The conformed interpolation parameters.
+
+            dependent_tie_points: `dict`
+                The conformed dependent tie points.
+
+        :Returns:
+
+            `dict` or `None`
+                The cache key of each array, keyed by the array's
+                name within a subarray. Each cache key is a 2-tuple
+                of the array's token and the `frozenset` of the
+                normalised names of the files that contain it. `None`
+                is returned if there is no caching.
+
+        """
+        if n_subarrays <= 1 or not tie_point_cache_size().value:
+            return
+
+        from dask.base import tokenize
+
+        from .datasetpool import DatasetPool
+
+        def cache_key(array):
+            get_filenames = getattr(array, "get_filenames", None)
+            if get_filenames is None:
+                filenames = frozenset()
+            else:
+                filenames = frozenset(get_filenames(normalise=True))
+
+            signatures = [
+                (filename, DatasetPool._signature(filename))
+                for filename in sorted(filenames)
+            ]
+            return (f"tie-points-{tokenize(array, signatures)}", filenames)
+
+        keys = {"data": cache_key(data)}
+        keys.update(
+            (("parameters", term), cache_key(value))
+            for term, value in parameters.items()
+        )
+        keys.update(
+            (("dependent_tie_points", identity), cache_key(value))
+            for identity, value in dependent_tie_points.items()
+        )
+        return keys
+
     @cached_property
     def bounds(self):
         """True if the compressed array represents bounds tie points.
@@ -1011,7 +1098,7 @@ class SubsampledArray(CompressedArrayMixin, CompressedArray):
         # chunks is a sequence
         return [None if i in u_dims else c for i, c in enumerate(shapes)]
 
-    def subarrays(self, shapes=-1):
+    def subarrays(self, shapes=-1, batch=False):
         """Return descriptors for every subarray.
 
         These descriptors are used during subarray decompression.
@@ -1022,6 +1109,27 @@ class SubsampledArray(CompressedArrayMixin, CompressedArray):
 
             {{subarrays chunks: ``-1`` or sequence, optional}}
 
+            batch: `bool`, optional
+                If True then each subarray spans a batch of
+                consecutive interpolation subareas along each
+                interpolated dimension, rather than a single
+                interpolation subarea. Interpolation subareas are
+                added to a batch for as long as its uncompressed size
+                does not exceed the largest size given for that
+                dimension by *chunks*, but a batch always contains at
+                least one interpolation subarea. If *chunks* is
+                ``-1`` then each interpolated dimension has a single
+                batch.
+
+                For each interpolated dimension, the descriptors 2.
+                to 5. of a batch are `list` of the descriptors of
+                each of its interpolation subareas; and the indices
+                of the tie point array that correspond to each
+                non-interpolated dimension are the same as those of
+                the uncompressed array.
+
+                .. versionadded:: (cfdm) NEXTVERSION
+
         :Returns:
 
             6-`tuple` of iterators
@@ -1137,6 +1245,21 @@ class SubsampledArray(CompressedArrayMixin, CompressedArray):
         tie_point_indices = self.get_tie_point_indices()
         u_dims = tuple(tie_point_indices)
 
+        if batch:
+            # The maximum uncompressed size of a batch along each
+            # interpolated dimension
+            if shapes == -1:
+                batch_sizes = dict.fromkeys(u_dims, self.size)
+            else:
+                batch_sizes = {
+                    d: (
+                        max(shapes[d])
+                        if isinstance(shapes[d], Sequence)
+                        else shapes[d]
+                    )
+                    for d in u_dims
+                }
+
         shapes = self.subarray_shapes(shapes)
 
         # The indices of the uncompressed array that correspond to
@@ -1168,6 +1291,12 @@ class SubsampledArray(CompressedArrayMixin, CompressedArray):
         # interpolation subarea.
         #        c_indices = [(slice(None),)] * tp_ndim
         c_indices = [(slice(0, size),) for size in tie_points.shape]
+        if batch:
+            # A batch only needs the tie points for its own part of
+            # each non-interpolated dimension
+            for d in range(tie_points.ndim):
+                if d not in u_dims:
+                    c_indices[d] = u_indices[d]
 
         # The location of each subarray
         # subarray_locations = [(0,)] * self.ndim
@@ -1237,6 +1366,35 @@ class SubsampledArray(CompressedArrayMixin, CompressedArray):
 
                 first = False
 
+            if batch:
+                # Group consecutive interpolation subareas into
+                # batches
+                batches = []
+                batch_size = batch_sizes[d]
+                total = 0
+                for k, size in enumerate(u_shape):
+                    if batches and total + size <= batch_size:
+                        batches[-1].append(k)
+                        total += size
+                    else:
+                        batches.append([k])
+                        total = size
+
+                u_index = [
+                    slice(u_index[b[0]].start, u_index[b[-1]].stop)
+                    for b in batches
+                ]
+                u_shape = [[u_shape[k] for k in b] for b in batches]
+                c_index = [[c_index[k] for k in b] for b in batches]
+                continuous_area = [
+                    [continuous_area[k] for k in b] for b in batches
+                ]
+                interpolation_subarea_index = [
+                    [interpolation_subarea_index[k] for k in b]
+                    for b in batches
+                ]
+                location = list(range(len(batches)))
+
             u_indices[d] = u_index
             u_shapes[d] = u_shape
             c_indices[d] = c_index
@@ -1313,18 +1471,32 @@ class SubsampledArray(CompressedArrayMixin, CompressedArray):
         Subarray = self.get_Subarray()
         subarray_name = Subarray().__class__.__name__
 
+        # If possible, interpolate a batch of interpolation subareas
+        # in each dask chunk, rather than creating a dask chunk for
+        # every interpolation subarea.
+        batch = getattr(Subarray, "_batchable", False)
+
         # Set the chunk sizes for the dask array
         #
         # Note: The chunks created here are incorrect for the
         #       compressed dimensions, since these chunk sizes are a
         #       function of the tie point indices which haven't yet
         #       been accessed. Therefore, the chunks for the
-        #       compressed dimensions need to be redefined later.
-        chunks = normalize_chunks(
-            self.subarray_shapes(chunks),
-            shape=self.shape,
-            dtype=dtype,
-        )
+        #       compressed dimensions need to be redefined later. When
+        #       batching, they define the maximum batch sizes.
+        if batch:
+            chunks = normalize_chunks(chunks, shape=self.shape, dtype=dtype)
+            if self.bounds:
+                # The trailing bounds dimension can't be chunked
+                chunks = chunks[:-1] + ((self.shape[-1],),)
+        else:
+            chunks = normalize_chunks(
+                self.subarray_shapes(chunks),
+                shape=self.shape,
+                dtype=dtype,
+            )
+
+        shapes = chunks
 
         # Re-initialise the chunks
         u_dims = list(compressed_dimensions)
@@ -1337,6 +1509,16 @@ class SubsampledArray(CompressedArrayMixin, CompressedArray):
         # number.
         previous_chunk_location = [-1] * len(chunks)
 
+        subarrays = list(zip(*self.subarrays(shapes=shapes, batch=batch)))
+
+        # Share in-memory copies of the compressed data, parameters
+        # and dependent tie points between all of the subarrays, so
+        # that each one is only read once per process. Note that the
+        # cache keys are found from the conformed data, rather than
+        # from the dask arrays, so that they can include the
+        # signatures of the files that contain the data.
+        tie_point_keys = self._tie_point_keys(len(subarrays), **conformed_data)
+
         dsk = {}
         for (
             u_indices,
@@ -1345,7 +1527,17 @@ class SubsampledArray(CompressedArrayMixin, CompressedArray):
             subarea_indices,
             first,
             chunk_location,
-        ) in zip(*self.subarrays(shapes=chunks)):
+        ) in subarrays:
+            if batch:
+                subarea_sizes = {d: u_shape[d] for d in compressed_dimensions}
+                u_shape = tuple(
+                    sum(size) if isinstance(size, list) else size
+                    for size in u_shape
+                )
+                kwargs = {"subarea_sizes": subarea_sizes}
+            else:
+                kwargs = {}
+
             subarray = Subarray(
                 data=compressed_data,
                 indices=c_indices,
@@ -1355,7 +1547,9 @@ class SubsampledArray(CompressedArrayMixin, CompressedArray):
                 subarea_indices=subarea_indices,
                 parameters=parameters,
                 dependent_tie_points=dependent_tie_points,
+                tie_point_keys=tie_point_keys,
                 context_manager=context,
+                **kwargs,
             )
 
             key = f"{subarray_name}-{tokenize(subarray)}"
@@ -0,0 +1,172 @@
+from collections import OrderedDict
+from threading import Lock
+
+import numpy as np
+
+from ..functions import tie_point_cache_size
+
+
+class TiePointCache:
+    """A least recently used cache of in-memory tie point arrays.
+
+    The subarrays of subsampled data share a cache of the tie points,
+    interpolation parameters and dependent tie points, so that each
+    of these arrays is read from its dataset just once, rather than
+    by every subarray. Each array is identified in the cache by a
+    key, which is stored on the subarrays in place of the cache
+    itself, so that subarrays that are sent to other processes use
+    the cache of the process in which they are computed. A key
+    comprises a token that includes the file system signatures of
+    the files that contain the array, so that a cached array is not
+    used after its file has been modified, and the names of those
+    files, so that the arrays from a file can be removed from the
+    cache when the file is written to.
+
+    The least recently used arrays are removed whenever the total
+    size of the cached arrays would exceed `cfdm.tie_point_cache_size`
+    bytes. An array that is larger than `cfdm.tie_point_cache_size`
+    is never cached.
+
+    The cache is safe to use from multiple threads.
+
+    .. versionadded:: (cfdm) NEXTVERSION
+
+    .. seealso:: `cfdm.tie_point_cache_size`
+
+    """
+
+    def __init__(self):
+        """**Initialisation**"""
+        self._lock = Lock()
+        self._read_locks = {}
+        self._arrays = OrderedDict()
+        self._nbytes = 0
+
+    def __len__(self):
+        """The number of cached arrays.
+
+        x.__len__() <==> len(x)
+
+        """
+        return len(self._arrays)
+
+    def __repr__(self):
+        """Called by the `repr` built-in function.
+
+        x.__repr__() <==> repr(x)
+
+        """
+        return (
+            f"<{self.__class__.__name__}: {len(self)} arrays, "
+            f"{self._nbytes} bytes>"
+        )
+
+    def clear(self, filename=None):
+        """Remove arrays from the cache.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            filename: `str` or `None`, optional
+                Only remove the arrays that are contained in the file
+                with this normalised name. By default all arrays are
+                removed.
+
+        :Returns:
+
+            `None`
+
+        """
+        with self._lock:
+            arrays = self._arrays
+            if filename is None:
+                arrays.clear()
+                self._nbytes = 0
+                return
+
+            for key in tuple(arrays):
+                if filename in key[1]:
+                    self._nbytes -= arrays.pop(key).nbytes
+
+    def get(self, key, array, context_manager=None):
+        """Return an array in memory, from the cache if possible.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            key: `tuple`
+                The key that identifies the array in the cache, as
+                a 2-tuple of the array's token and the `frozenset` of
+                the normalised names of the files that contain it.
+
+            array: array_like
+                The array. If it is not already in the cache then it
+                is read into memory and cached, provided that it is
+                not too large.
+
+            context_manager: function, optional
+                A context manager that provides a runtime context for
+                the conversion of *array* to a `numpy` array.
+
+        :Returns:
+
+            `numpy.ndarray` or `None`
+                The read-only in-memory array, or `None` if the array
+                is too large to be cached.
+
+        """
+        max_size = tie_point_cache_size().value
+        with self._lock:
+            data = self._arrays.get(key)
+            if data is not None:
+                self._arrays.move_to_end(key)
+                return data
+
+            nbytes = int(np.prod(array.shape)) * np.dtype(array.dtype).itemsize
+            if nbytes > max_size:
+                return
+
+            read_lock = self._read_locks.setdefault(key, Lock())
+
+        # Only allow one thread to read each array, without stopping
+        # other threads from reading other arrays
+        with read_lock:
+            try:
+                with self._lock:
+                    data = self._arrays.get(key)
+
+                if data is None:
+                    if context_manager:
+                        with context_manager():
+                            data = np.asanyarray(array)
+                    else:
+                        data = np.asanyarray(array)
+
+                    # Prevent the cached array from being changed
+                    # in-place
+                    data.setflags(write=False)
+
+                    with self._lock:
+                        arrays = self._arrays
+                        arrays[key] = data
+                        self._nbytes += data.nbytes
+
+                        # Remove the least recently used arrays
+                        while self._nbytes > max_size and len(arrays) > 1:
+                            self._nbytes -= arrays.pop(
+                                next(iter(arrays))
+                            ).nbytes
+            finally:
+                # Don't leave the read lock behind, even if the read
+                # failed
+                with self._lock:
+                    self._read_locks.pop(key, None)
+
+        return data
+
+
+# The cache shared by all of the subsampled subarrays computed in
+# this process
+tie_point_cache = TiePointCache()
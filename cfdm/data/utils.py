@@ -10,7 +10,9 @@ from cfdm.units import Units
 _default_calendar = "standard"
 
 
-def allclose(x, y, masked_equal=True, rtol=None, atol=None):
+def allclose(
+    x, y, masked_equal=True, rtol=None, atol=None, mask=False, compute=False
+):
     """An effective dask.array.ma.allclose method.
 
     True if two dask arrays are element-wise equal within a tolerance.
@@ -26,6 +28,11 @@ def allclose(x, y, masked_equal=True, rtol=None, atol=None):
     the corresponding NumPy method (see the `numpy.ma.allclose` API
     reference).
 
+    Each pair of corresponding chunks is compared in a separate task,
+    checking the masks (if requested) and the values in a single
+    pass, and the per-chunk results are combined with a tree
+    reduction.
+
     .. versionadded:: (cfdm) 1.11.2.0
 
     :Parameters:
@@ -43,60 +50,62 @@ def allclose(x, y, masked_equal=True, rtol=None, atol=None):
 
         {{atol: number, optional}}
 
+        mask: `bool`, optional
+            If True then the two arrays must also have identical
+            masks.
+
+            .. versionadded:: (cfdm) NEXTVERSION
+
+        compute: `bool`, optional
+            If True then compute and return the result. All of the
+            chunks are compared in a single compute, so that any
+            tasks shared by the inputs are only computed once. By
+            default the result is returned as a lazy dask array.
+
+            .. versionadded:: (cfdm) NEXTVERSION
+
     :Returns:
 
-        `bool`
+        `dask.array.Array` or `bool`
             A Boolean value indicating whether or not the two dask
             arrays are element-wise equal to the given *rtol* and
-            *atol* tolerance.
+            *atol* tolerance. A 0-d dask array is returned unless
+            *compute* is True.
 
     """
     import dask.array as da
 
+    from .dask_utils import cfdm_allclose
+
     if rtol is None or atol is None:
         raise ValueError(
             "Must provide numeric values for the rtol and atol keywords"
         )
 
-    # Must pass rtol=rtol, atol=atol in as kwargs to allclose, rather than it
-    # using those in local scope from the outer function arguments, because
-    # Dask's internal algorithms require these to be set as parameters.
-    def allclose(a_blocks, b_blocks, rtol=rtol, atol=atol):
-        """Run `ma.allclose` across multiple blocks over two arrays."""
-        from dask.core import flatten
-
-        result = True
-        # Handle scalars, including 0-d arrays, for which a_blocks and
-        # b_blocks will have the corresponding type and hence not be iterable.
-        # With this approach, we avoid inspecting sizes or lengths, and for
-        # the 0-d array blocks the following iteration can be used unchanged
-        # and will only execute once with block sizes as desired of:
-        # (np.array(<int size>),)[0] = array(<int size>). Note
-        # can't check against more general case of collections.abc.Iterable
-        # because a 0-d array is also iterable, but in practice always a list.
-        if not isinstance(a_blocks, list):
-            a_blocks = (a_blocks,)
-        if not isinstance(b_blocks, list):
-            b_blocks = (b_blocks,)
-
-        # Note: If a_blocks or b_blocks has more than one chunk in
-        #       more than one dimension they will comprise a nested
-        #       sequence of sequences, that needs to be flattened so
-        #       that we can safely iterate through the actual numpy
-        #       array elements.
-
-        for a, b in zip(flatten(a_blocks), flatten(b_blocks)):
-            result &= np.ma.allclose(
-                a, b, masked_equal=masked_equal, rtol=rtol, atol=atol
-            )
-
-        return result
-
+    # One Boolean element for each pair of corresponding chunks
     axes = tuple(range(x.ndim))
-    return da.blockwise(
-        allclose, "", x, axes, y, axes, dtype=bool, rtol=rtol, atol=atol
+    dx = da.blockwise(
+        cfdm_allclose,
+        axes,
+        x,
+        axes,
+        y,
+        axes,
+        adjust_chunks={i: 1 for i in axes},
+        dtype=bool,
+        meta=np.array((), dtype=bool),
+        masked_equal=masked_equal,
+        rtol=rtol,
+        atol=atol,
+        mask=mask,
     )
 
+    dx = dx.all()
+    if compute:
+        return bool(dx.compute())
+
+    return dx
+
 
 def collapse(
     func,
@@ -711,6 +720,205 @@ def chunk_locations(chunks):
     return product(*locations)
 
 
+def coalesce_reads(dx, limit=None):
+    """Merge the reads of adjacent chunks from the same file variable.
+
+    Each chunk of a dask array that was created directly from a
+    `FileArray` is, by default, computed with its own call to the
+    file array, each of which opens the dataset and sets up the
+    masking and unpacking independently. This function rewrites the
+    dask graph so that adjacent chunks of the same variable are
+    read into memory together as one hyperslab, which is then split
+    into the original chunks.
+
+    Chunks are combined into a batch preferentially along the
+    trailing dimensions (i.e. the contiguous direction in C order),
+    and each batch is never larger than *limit* bytes. Tasks that
+    do not contribute to the result are culled from the graph before
+    the batches are determined, so that data which is not needed is
+    not read.
+
+    The rewritten dask array has the same name, chunks and values as
+    the original. Each chunk is a copy of its part of the merged
+    read, so that the merged read may be released from memory as
+    soon as all of its chunks have been computed.
+
+    The dask graph is rewritten with dask's low-level task
+    specification. If this is not available in the installed version
+    of dask then the dask array is returned unchanged.
+
+    .. versionadded:: (cfdm) NEXTVERSION
+
+    .. seealso:: `cfdm.Data.to_dask_array`
+
+    :Parameters:
+
+        dx: `dask.array.Array`
+            The dask array.
+
+        limit: `int`, optional
+            The maximum size, in bytes, of a merged read. By default
+            the value of `cfdm.chunksize` is used.
+
+    :Returns:
+
+        `dask.array.Array`
+            The dask array with coalesced reads.
+
+    **Examples**
+
+    >>> f = cfdm.read('file.nc', dask_chunks=2)[0]
+    >>> dx = f.data.to_dask_array(_force_mask_hardness=False)
+    >>> dx.npartitions
+    12
+    >>> dx = cfdm.data.utils.coalesce_reads(dx)
+    >>> len([k for k in dx.dask if k[0].startswith('coalesce-')])
+    1
+
+    """
+    try:
+        from dask._task_spec import DataNode, Task, TaskRef
+    except ImportError:  # pragma: no cover
+        # The low-level task specification is private to dask, so
+        # leave the graph alone if it is not available
+        return dx
+
+    from math import prod
+
+    import dask.array as da
+    from dask.array.core import getter
+    from dask.base import tokenize
+    from dask.optimization import cull
+
+    from .abstract import FileArray
+    from .dask_utils import cfdm_read_hyperslab, cfdm_subspace_copy
+
+    if limit is None:
+        from ..functions import chunksize
+
+        limit = chunksize().value
+
+    dsk, _ = cull(dx.dask, dx.__dask_keys__())
+
+    # Find the tasks that read a chunk from a file array, grouped by
+    # the file array and the dask array to which they belong
+    reads = {}
+    for key, task in dsk.items():
+        if not (
+            isinstance(task, Task)
+            and task.func is getter
+            and len(task.args) == 2
+            and isinstance(key, tuple)
+        ):
+            continue
+
+        ref, index = task.args
+        if not (isinstance(ref, TaskRef) and isinstance(index, DataNode)):
+            continue
+
+        array = dsk.get(ref.key)
+        if isinstance(array, DataNode):
+            array = array.value
+
+        if not isinstance(array, FileArray):
+            continue
+
+        index = index.value
+        if not (
+            isinstance(index, tuple)
+            and len(index) == len(key) - 1
+            and all(
+                isinstance(i, slice) and i.step in (None, 1) for i in index
+            )
+        ):
+            continue
+
+        reads.setdefault((ref.key, key[0], tokenize(task.kwargs)), []).append(
+            (key, index, task.kwargs)
+        )
+
+    for (array_key, name, kwargs_token), chunks in reads.items():
+        if len(chunks) < 2:
+            continue
+
+        ndim = len(chunks[0][1])
+        array = dsk[array_key]
+        if isinstance(array, DataNode):
+            array = array.value
+
+        # Find how many chunks to combine along each dimension,
+        # starting with the trailing dimension. 'nbytes' is the size
+        # of the merged hyperslab, which spans one chunk along each
+        # dimension that has not yet been merged.
+        sizes = [
+            max(
+                max(index[n].stop - index[n].start, 1)
+                for _, index, _ in chunks
+            )
+            for n in range(ndim)
+        ]
+        nchunks = [
+            max(key[n + 1] for key, _, _ in chunks) + 1 for n in range(ndim)
+        ]
+        factors = [1] * ndim
+        nbytes = array.dtype.itemsize * prod(sizes)
+        for n in range(ndim - 1, -1, -1):
+            factor = max(1, min(nchunks[n], limit // nbytes))
+            factors[n] = factor
+            nbytes *= factor
+            if factor < nchunks[n]:
+                break
+
+        batches = {}
+        for key, index, kwargs in chunks:
+            position = tuple(i // f for i, f in zip(key[1:], factors))
+            batches.setdefault(position, []).append((key, index, kwargs))
+
+        batch_name = (
+            f"coalesce-{tokenize(name, array_key, kwargs_token, factors)}"
+        )
+        for position, batch in batches.items():
+            if len(batch) < 2:
+                continue
+
+            # The hyperslab that contains every chunk in the batch
+            start = [
+                min(index[n].start for _, index, _ in batch)
+                for n in range(ndim)
+            ]
+            stop = [
+                max(index[n].stop for _, index, _ in batch)
+                for n in range(ndim)
+            ]
+            batch_index = tuple(slice(i, j) for i, j in zip(start, stop))
+
+            batch_key = (batch_name,) + position
+            dsk[batch_key] = Task(
+                batch_key,
+                cfdm_read_hyperslab,
+                TaskRef(array_key),
+                DataNode(None, batch_index),
+                **batch[0][2],
+            )
+
+            # Replace each chunk read with a subspace of the batch
+            for key, index, _ in batch:
+                index = tuple(
+                    slice(i.start - s, i.stop - s)
+                    for i, s in zip(index, start)
+                )
+                dsk[key] = Task(
+                    key,
+                    cfdm_subspace_copy,
+                    TaskRef(batch_key),
+                    DataNode(None, index),
+                )
+
+    return da.Array(
+        dsk, name=dx.name, chunks=dx.chunks, dtype=dx.dtype, meta=dx._meta
+    )
+
+
 def normalize_chunks(chunks, shape=None, dtype=None):
     """Normalize chunks to tuple of tuples.
 
@@ -12,6 +12,9 @@ class ZarrArray(IndexMixin, abstract.FileArray):
 
     """
 
+    # Share open datasets via the pool of open datasets
+    _pool_datasets = True
+
     def _get_array(self, index=None):
         """Returns a subspace of the dataset variable.
 
@@ -98,8 +101,9 @@ class ZarrArray(IndexMixin, abstract.FileArray):
             `None`
 
         """
-        # `zarr.Group` objects don't need closing
-        pass
+        # `zarr.Group` objects don't need closing, but may need to
+        # be returned to the pool of open datasets
+        self._release(dataset)
 
     def open(self, **kwargs):
         """Return a dataset object and address.
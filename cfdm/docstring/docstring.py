@@ -831,6 +831,75 @@ _docstring_substitution_definitions = {
                       named in a manner that is inconsistent with CF
                       rules defined by the CF conventions (section 2.7
                       Groups).""",
+    # read parallel
+    "{{read parallel: `bool` or `str`, optional}}": """parallel: `bool` or `str`, optional
+            Whether or not to read multiple datasets concurrently. The
+            returned constructs are the same, and in the same order,
+            as when the datasets are read one after another. The
+            *parallel* parameter must be one of:
+
+            * `False`
+
+              This is the default. Datasets are read one after
+              another.
+
+            * `True` or ``'threads'``
+
+              Datasets are read concurrently by a pool of threads.
+              The netCDF-C library is not thread-safe, so the
+              ``'netCDF4'`` backend is never used. If *netcdf_backend*
+              is `None` then the default backends are tried in their
+              usual order, omitting ``'netCDF4'``, and it is an error
+              for *netcdf_backend* to include ``'netCDF4'``.
+
+            * ``'processes'``
+
+              Datasets are read concurrently by a pool of processes,
+              which avoids contention for the Python global
+              interpreter lock at the expense of transferring the
+              constructs from the worker processes. CDL datasets may
+              not be read in this way, because the temporary netCDF
+              file that is created from CDL is deleted when its worker
+              process exits.
+
+            When reading concurrently, all datasets are read even if
+            some of them can not be, after which a single exception is
+            raised that reports the error for each failed
+            dataset.""",
+    # read metadata_cache
+    "{{read metadata_cache: `bool` or `str`, optional}}": """metadata_cache: `bool` or `str`, optional
+            Whether or not to use a persistent on-disk cache of the
+            constructs read from each dataset. If a valid cache entry
+            exists for a dataset then its constructs are returned from
+            the cache, without parsing the dataset's metadata at
+            all. Otherwise the dataset is read as usual and its
+            constructs are added to the cache. Only the metadata and
+            lazy data definitions are cached, unless data are read
+            into memory with the *to_memory* parameter.
+
+            A cache entry is only valid for a dataset with the same
+            absolute path, size and modification time (as well as the
+            same for any external datasets), when read with the same
+            keyword parameters by the same version of the
+            library. When a dataset is re-cached after it has been
+            modified, its stale cache entry is removed, so that the
+            cache holds at most one entry per dataset and set of
+            keyword parameters. Datasets that are not on local disk,
+            and CDL strings, are never cached.
+
+            If `False` (the default) then the cache is not used. If
+            `True` then the cache is stored in the ``cfdm/read``
+            sub-directory of the directory given by the
+            ``XDG_CACHE_HOME`` environment variable, or of
+            ``~/.cache`` if that is not set. Otherwise the cache is
+            stored in the given directory, which is created if it
+            does not exist.
+
+            .. warning:: Cache entries are stored as Python pickles,
+                         and loading a pickle can execute arbitrary
+                         code. The cache directory must therefore be
+                         trusted, i.e. it must only be writable by
+                         trusted users.""",
     # persist
     "{{persist description}}": """Persisting turns an underlying lazy dask array into an
         equivalent chunked dask array, but now with the results fully
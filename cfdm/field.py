@@ -322,6 +322,88 @@ class Field(
 
         return new
 
+    @staticmethod
+    def _indices_1d(construct, value):
+        """Create an index of the positions of values in 1-d data.
+
+        The positions are found with `numpy.searchsorted` from the
+        sorted values of the construct's data, which are computed
+        once and then cached on the `Data` object (see
+        `Data._get_sorted_values`), rather than by comparing every
+        data value with every given value.
+
+        Matching positions that are evenly spaced are returned as a
+        `slice`, so that subspacing with the index results in
+        contiguous reads of the data.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        .. seealso:: `indices`
+
+        :Parameters:
+
+            construct:
+                The 1-d metadata construct.
+
+            value: array_like
+                The value or values to find. May be a `Data` object or
+                a lazy `dask` array, in which case it is computed.
+
+        :Returns:
+
+            `slice`, `numpy.ndarray`, or `None`
+                The index of every position whose value equals any of
+                the given values, or `None` if there are no such
+                positions. The index is a `slice` if the positions are
+                evenly spaced, otherwise it is a Boolean array.
+
+        **Examples**
+
+        >>> f = {{package}}.example_field(0)
+        >>> lon = f.dimension_coordinate('longitude')
+        >>> print(lon.array)
+        [ 22.5  67.5 112.5 157.5 202.5 247.5 292.5 337.5]
+        >>> f._indices_1d(lon, [67.5, 157.5, 247.5])
+        slice(1, 6, 2)
+        >>> f._indices_1d(lon, [67.5, 112.5, 337.5])
+        array([False,  True,  True, False, False, False, False,  True])
+        >>> print(f._indices_1d(lon, -999))
+        None
+
+        """
+        # Note: 'np.asanyarray' computes 'Data' and lazy dask values
+        value = np.asanyarray(value).astype(construct.dtype)
+        value = np.unique(np.ma.compressed(value))
+        if value.dtype.kind in "fc":
+            # NaNs never match
+            value = value[~np.isnan(value)]
+
+        sorted_values, positions = construct.data._get_sorted_values()
+
+        # Find the range of sorted values that equal each given value
+        start = np.searchsorted(sorted_values, value, side="left")
+        counts = np.searchsorted(sorted_values, value, side="right") - start
+        n = int(counts.sum())
+        if not n:
+            return
+
+        offsets = np.cumsum(counts) - counts
+        index = np.repeat(start - offsets, counts) + np.arange(n)
+        if positions is not None:
+            index = np.sort(positions[index])
+
+        start = int(index[0])
+        if n == 1:
+            return slice(start, start + 1, 1)
+
+        step = int(index[1] - index[0])
+        if (np.diff(index) == step).all():
+            return slice(start, int(index[-1]) + 1, step)
+
+        mask = np.zeros(construct.size, dtype=bool)
+        mask[index] = True
+        return mask
+
     def _one_line_description(self, axis_names_sizes=None):
         """Returns a one-line description of the field."""
         if axis_names_sizes is None:
@@ -994,10 +1076,60 @@ class Field(
 
         """
 
-        def _empty_compressed_data(data, shape):
-            return data.empty(
-                shape=shape,
-                dtype=data.dtype,
+        def _compressed_data(data, count, ndim):
+            """Gather the ragged elements of data.
+
+            :Parameters:
+
+                data: `Data`
+
+                count: `numpy.ndarray`
+                    The number of leading elements to keep from each
+                    row.
+
+                ndim: `int`
+                    The number of dimensions that define the rows and
+                    their elements. All but the last of these are
+                    flattened to form the rows.
+
+            :Returns:
+
+                `Data`
+
+            """
+            import dask.array as da
+
+            from .data.dask_utils import cfdm_ragged_gather
+
+            d = data.flatten(range(ndim - 1))
+            dx = d.to_dask_array(
+                _force_mask_hardness=False, _force_to_memory=False
+            )
+            dx = dx.rechunk({1: -1})
+
+            # The number of ragged elements in each chunk
+            locations = np.cumsum((0,) + dx.chunks[0])
+            chunks = tuple(
+                int(count[i:j].sum())
+                for i, j in zip(locations[:-1], locations[1:])
+            )
+
+            trailing = tuple(range(2, dx.ndim))
+            dx = da.blockwise(
+                cfdm_ragged_gather,
+                (0,) + trailing,
+                dx,
+                (0, 1) + trailing,
+                da.from_array(count, chunks=(dx.chunks[0],)),
+                (0,),
+                adjust_chunks={0: chunks},
+                concatenate=True,
+                dtype=dx.dtype,
+                meta=dx._meta,
+            )
+
+            return self._Data(
+                dx,
                 units=data.get_units(None),
                 calendar=data.get_calendar(None),
             )
@@ -1028,19 +1160,16 @@ class Field(
                 index_variable=index_variable,
             )
 
-        def _compress_metadata(
-            f, method, count, N, axes, Array_func, **kwargs
-        ):
+        def _compress_metadata(f, count, axes, Array_func, **kwargs):
             """Compresses constructs for a field by a chosen method.
 
             :Parameters:
 
                 f: `Field`
 
-                count: sequence of `int`
-
-                N: `int`
-                    The number of elements in the compressed array.
+                count: `numpy.ndarray`
+                    The number of leading elements to keep from each
+                    row.
 
                 axes: sequence of `str`
 
@@ -1053,9 +1182,6 @@ class Field(
                 `None`
 
             """
-            if method == "indexed_contiguous":
-                shape1 = f.data.shape[1]
-
             for key, c in f.constructs.filter_by_axis(
                 *axes, axis_mode="or", todict=True
             ).items():
@@ -1065,38 +1191,11 @@ class Field(
                     # exactly the same axes in the same order
                     continue
 
-                # Initialise the compressed data for the metadata
+                # Create the compressed data for the metadata
                 # construct
                 data = c.get_data(None)
                 if data is not None:
-                    compressed_data = _empty_compressed_data(data, (N,))
-
-                    # Populate the compressed data for the metadata
-                    # construct
-                    start = 0
-                    if method == "indexed_contiguous" and c.data.ndim == 2:
-                        c_start = 0
-                        for i, d in enumerate(
-                            data.flatten(range(data.ndim - 1))
-                        ):
-                            c_start = shape1 * i
-                            c_end = c_start + shape1
-
-                            last = sum(n > 0 for n in count[c_start:c_end])
-
-                            end = start + last
-                            compressed_data[start:end] = d[:last]
-                            start += last
-                    else:
-                        for last, d in zip(
-                            count, data.flatten(range(data.ndim - 1))
-                        ):
-                            if not last:
-                                continue
-
-                            end = start + last
-                            compressed_data[start:end] = d[:last]
-                            start += last
+                    compressed_data = _compressed_data(data, count, data.ndim)
 
                 # Insert the compressed data into the metadata
                 # construct
@@ -1108,37 +1207,10 @@ class Field(
                     if data is None:
                         continue
 
-                    b_shape = data.shape[c.data.ndim :]
-                    compressed_data = _empty_compressed_data(
-                        data, (N,) + b_shape
+                    compressed_data = _compressed_data(
+                        data, count, c.data.ndim
                     )
 
-                    # Populate the compressed data for the metadata
-                    # construct
-                    start = 0
-                    if method == "indexed_contiguous" and c.data.ndim == 2:
-                        c_start = 0
-                        for i, d in enumerate(
-                            data.flatten(range(c.data.ndim - 1))
-                        ):
-                            c_start = shape1 * i
-                            c_end = c_start + shape1
-                            last = sum(n > 0 for n in count[c_start:c_end])
-
-                            end = start + last
-                            compressed_data[start:end] = d[:last]
-                            start += last
-                    else:
-                        for last, d in zip(
-                            count, data.flatten(range(c.data.ndim - 1))
-                        ):
-                            if not last:
-                                continue
-
-                            end = start + last
-                            compressed_data[start:end] = d[:last]
-                            start += last
-
                     # Insert the compressed data into the metadata
                     # construct
                     y = Array_func(f, compressed_data, data=data, **kwargs)
@@ -1147,33 +1219,31 @@ class Field(
         def _derive_count(flattened_data):
             """Derive the DSG count for each feature.
 
+            The count for a feature is one more than the position of
+            its last non-missing element.
+
             :Parameters:
 
-                flattened_data: array_like
+                flattened_data: `Data`
                     The 2-d flattened array from which to derive the
                     counts. The leading dimension is the number of
                     features.
 
             :Returns:
 
-                `list`
+                `numpy.ndarray`
                     The count for each feature.
 
             """
-            count = []
-            masked = np.ma.masked
-            for d in flattened_data:
-                d = d.array
-                last = d.size
-                for i in d[::-1]:
-                    if i is not masked:
-                        break
-
-                    last -= 1
+            import dask.array as da
 
-                count.append(last)
-
-            return count
+            dx = flattened_data.to_dask_array(
+                _force_mask_hardness=False, _force_to_memory=False
+            )
+            not_masked = ~da.ma.getmaskarray(dx)
+            last = dx.shape[-1] - da.argmax(not_masked[:, ::-1], axis=1)
+            count = da.where(not_masked.any(axis=1), last, 0)
+            return np.asanyarray(count.compute(), dtype=int)
 
         f = _inplace_enabled_define_and_cleanup(self)
 
@@ -1246,17 +1316,7 @@ class Field(
                 # data.
                 count = _derive_count(flattened_data)
 
-            N = sum(count)
-            compressed_field_data = _empty_compressed_data(data, (N,))
-
-            start = 0
-            for last, d in zip(count, flattened_data):
-                if not last:
-                    continue
-
-                end = start + last
-                compressed_field_data[start:end] = d[:last]
-                start += last
+            compressed_field_data = _compressed_data(data, count, data.ndim)
 
         if method == "contiguous":
             # --------------------------------------------------------
@@ -1264,7 +1324,7 @@ class Field(
             # --------------------------------------------------------
             count_variable = self._Count(
                 properties=count_properties,
-                data=self._Data([n for n in count if n]),
+                data=self._Data(count[count > 0]),
             )
 
             x = _RaggedContiguousArray(
@@ -1276,9 +1336,7 @@ class Field(
 
             _compress_metadata(
                 f,
-                method,
                 count,
-                N,
                 f.get_data_axes(),
                 _RaggedContiguousArray,
                 count_variable=count_variable,
@@ -1290,27 +1348,16 @@ class Field(
             # --------------------------------------------------------
             index_variable = self._Index(
                 properties=index_properties,
-                data=self._Data.empty(shape=(N,), dtype=int),
+                data=self._Data(np.repeat(np.arange(count.size), count)),
             )
 
-            start = 0
-            for i, (last, d) in enumerate(zip(count, flattened_data)):
-                if not last:
-                    continue
-
-                end = start + last
-                index_variable.data[start:end] = i
-                start += last
-
             x = _RaggedIndexedArray(
                 self, compressed_field_data, data, index_variable
             )
 
             _compress_metadata(
                 f,
-                method,
                 count,
-                N,
                 f.get_data_axes(),
                 _RaggedIndexedArray,
                 index_variable=index_variable,
@@ -1320,19 +1367,18 @@ class Field(
             # --------------------------------------------------------
             # Ragged indexed contiguous
             # --------------------------------------------------------
-            index = []
-            shape1 = f.data.shape[1]
-            for i in range(f.data.shape[0]):
-                start = shape1 * i
-                end = start + shape1
-                index.extend([i] * sum(n > 0 for n in count[start:end]))
+            # The number of non-empty timeseries or trajectories in
+            # each feature
+            shape0, shape1 = f.data.shape[:2]
+            n_profiles = (count.reshape(shape0, shape1) > 0).sum(axis=1)
 
             count_variable = self._Count(
                 properties=count_properties,
-                data=self._Data([n for n in count if n]),
+                data=self._Data(count[count > 0]),
             )
             index_variable = self._Index(
-                properties=index_properties, data=self._Data(index)
+                properties=index_properties,
+                data=self._Data(np.repeat(np.arange(shape0), n_profiles)),
             )
 
             x = _RaggedIndexedContiguousArray(
@@ -1345,9 +1391,7 @@ class Field(
 
             _compress_metadata(
                 f,
-                method,
                 count,
-                N,
                 f.get_data_axes(),
                 _RaggedIndexedContiguousArray,
                 count_variable=count_variable,
@@ -1358,9 +1402,7 @@ class Field(
             # but not the count axis.
             _compress_metadata(
                 f,
-                method,
-                count,
-                len(index),
+                n_profiles,
                 f.get_data_axes()[:-1],
                 _RaggedIndexedArray,
                 index_variable=index_variable,
@@ -2107,6 +2149,11 @@ class Field(
         * Subspace criteria may be provided for size 1 domain axes that
           are not spanned by the field construct's data.
 
+        * The positions of the values are found by binary searches of
+          the sorted construct data, which are cached for re-use by
+          subsequent calls. Evenly spaced positions are returned as a
+          `slice`, otherwise a Boolean array is returned.
+
         .. versionadded:: (cfdm) 1.10.0.0
 
         .. seealso:: `__getitem__`, `__setitem__`
@@ -2138,8 +2185,7 @@ class Field(
 
         >>> indices = f.indices(longitude=112.5)
         >>> indices
-        (slice(None, None, None),
-         array([False, False,  True, False, False, False, False, False]))
+        (slice(None, None, None), slice(2, 3, 1))
         >>> print(f[indices])
         Field: specific_humidity (ncvar%q)
         ----------------------------------
@@ -2151,8 +2197,7 @@ class Field(
 
         >>> indices = f.indices(longitude=112.5, latitude=[-45, 75])
         >>> indices
-        (array([False,  True, False, False,  True]),
-         array([False, False,  True, False, False, False, False, False]))
+        (slice(1, 5, 3), slice(2, 3, 1))
         >>> print(f[indices])
         Field: specific_humidity (ncvar%q)
         ----------------------------------
@@ -2261,11 +2306,8 @@ class Field(
                     f"to create indices. Got: {identities[0]!r}"
                 )
 
-            index = np.isin(item, np.asanyarray(value).astype(item.dtype))
-            if np.ma.is_masked(index):
-                index = index.filled(False)
-
-            if not index.any():
+            index = self._indices_1d(item, value)
+            if index is None:
                 raise ValueError(
                     f"{value!r} does not match any {item!r} data values"
                 )
@@ -42,6 +42,10 @@ def configuration(
     chunksize=None,
     display_data=None,
     persist_data=None,
+    lock_policy=None,
+    dataset_pool_size=None,
+    dataset_pool_timeout=None,
+    tie_point_cache_size=None,
 ):
     """Views and sets constants in the project-wide configuration.
 
@@ -54,6 +58,10 @@ def configuration(
     * `chunksize`
     * `display_data`
     * `persist_data`
+    * `lock_policy`
+    * `dataset_pool_size`
+    * `dataset_pool_timeout`
+    * `tie_point_cache_size`
 
     These are all constants that apply throughout `cfdm`, except for
     in specific functions only if overridden by the corresponding
@@ -71,7 +79,9 @@ def configuration(
     .. versionadded:: (cfdm) 1.8.6
 
     .. seealso:: `atol`, `rtol`, `log_level`, `chunksize`,
-                 `display_data`, `persist_data`
+                 `display_data`, `persist_data`, `lock_policy`,
+                 `dataset_pool_size`, `dataset_pool_timeout`,
+                 `tie_point_cache_size`
 
     :Parameters:
 
@@ -113,6 +123,33 @@ def configuration(
 
             .. versionadded:: (cfdm) NEXTVERSION
 
+        lock_policy: `str` or `Constant`, optional
+            The new dataset lock policy. The default is to not change
+            the current behaviour.
+
+            .. versionadded:: (cfdm) NEXTVERSION
+
+        dataset_pool_size: `int` or `Constant`, optional
+            The new maximum number of pooled open datasets. The
+            default is to not change the current behaviour.
+
+            .. versionadded:: (cfdm) NEXTVERSION
+
+        dataset_pool_timeout: number or `Constant`, optional
+            The new idle timeout, in seconds, of pooled open
+            datasets. The default is to not change the current
+            behaviour.
+
+            .. versionadded:: (cfdm) NEXTVERSION
+
+        tie_point_cache_size: `int` or `str` or `Constant`, optional
+            The new maximum size in bytes of the cache of tie points
+            and interpolation parameters that is shared by the
+            subarrays of subsampled data. The default is to not
+            change the current behaviour.
+
+            .. versionadded:: (cfdm) NEXTVERSION
+
     :Returns:
 
         `Configuration`
@@ -130,14 +167,22 @@ def configuration(
                      'log_level': 'WARNING',
                      'chunksize': 134217728,
                      'display_data': True,
-                     'persist_data': False}>
+                     'persist_data': False,
+                     'lock_policy': 'global',
+                     'dataset_pool_size': 64,
+                     'dataset_pool_timeout': 60.0,
+                     'tie_point_cache_size': 134217728}>
     >>> print(cfdm.configuration())
     {'atol': 2.220446049250313e-16,
      'rtol': 2.220446049250313e-16,
      'log_level': 'WARNING',
      'chunksize': 134217728,
      'display_data': True,
-     'persist_data': False}
+     'persist_data': False,
+     'lock_policy': 'global',
+     'dataset_pool_size': 64,
+     'dataset_pool_timeout': 60.0,
+     'tie_point_cache_size': 134217728}
 
     Make a change to one constant and see that it is reflected in the
     configuration:
@@ -150,7 +195,11 @@ def configuration(
      'log_level': 'DEBUG',
      'chunksize': 134217728,
      'display_data': True,
-     'persist_data': False}
+     'persist_data': False,
+     'lock_policy': 'global',
+     'dataset_pool_size': 64,
+     'dataset_pool_timeout': 60.0,
+     'tie_point_cache_size': 134217728}
 
     Access specific values by key querying, noting the equivalency to
     using its bespoke function:
@@ -168,14 +217,22 @@ def configuration(
      'log_level': 'DEBUG',
      'chunksize': 134217728,
      'display_data': True,
-     'persist_data': False}
+     'persist_data': False,
+     'lock_policy': 'global',
+     'dataset_pool_size': 64,
+     'dataset_pool_timeout': 60.0,
+     'tie_point_cache_size': 134217728}
     >>> print(cfdm.configuration())
     {'atol': 5e-14,
      'rtol': 2.220446049250313e-16,
      'log_level': 'INFO',
      'chunksize': 134217728,
      'display_data': True,
-     'persist_data': False}
+     'persist_data': False,
+     'lock_policy': 'global',
+     'dataset_pool_size': 64,
+     'dataset_pool_timeout': 60.0,
+     'tie_point_cache_size': 134217728}
 
     Set a single constant without using its bespoke function:
 
@@ -185,14 +242,22 @@ def configuration(
      'log_level': 'INFO',
      'chunksize': 134217728,
      'display_data': True,
-     'persist_data': False}
+     'persist_data': False,
+     'lock_policy': 'global',
+     'dataset_pool_size': 64,
+     'dataset_pool_timeout': 60.0,
+     'tie_point_cache_size': 134217728}
     >>> cfdm.configuration()
     {'atol': 5e-14,
      'rtol': 1e-17,
      'log_level': 'INFO',
      'chunksize': 134217728,
      'display_data': True,
-     'persist_data': False}
+     'persist_data': False,
+     'lock_policy': 'global',
+     'dataset_pool_size': 64,
+     'dataset_pool_timeout': 60.0,
+     'tie_point_cache_size': 134217728}
 
     Use as a context manager:
 
@@ -202,7 +267,11 @@ def configuration(
      'log_level': 'WARNING',
      'chunksize': 134217728,
      'display_data': True,
-     'persist_data': False}
+     'persist_data': False,
+     'lock_policy': 'global',
+     'dataset_pool_size': 64,
+     'dataset_pool_timeout': 60.0,
+     'tie_point_cache_size': 134217728}
     >>> with cfdm.configuration(atol=9, rtol=10):
     ...     print(cfdm.configuration())
     ...
@@ -213,7 +282,11 @@ def configuration(
      'log_level': 'WARNING',
      'chunksize': 134217728,
      'display_data': True,
-     'persist_data': False}
+     'persist_data': False,
+     'lock_policy': 'global',
+     'dataset_pool_size': 64,
+     'dataset_pool_timeout': 60.0,
+     'tie_point_cache_size': 134217728}
 
     """
     return _configuration(
@@ -224,6 +297,10 @@ def configuration(
         new_chunksize=chunksize,
         new_display_data=display_data,
         new_persist_data=persist_data,
+        new_lock_policy=lock_policy,
+        new_dataset_pool_size=dataset_pool_size,
+        new_dataset_pool_timeout=dataset_pool_timeout,
+        new_tie_point_cache_size=tie_point_cache_size,
     )
 
 
@@ -264,6 +341,10 @@ def _configuration(_Configuration, **kwargs):
         "new_chunksize": chunksize,
         "new_display_data": display_data,
         "new_persist_data": persist_data,
+        "new_lock_policy": lock_policy,
+        "new_dataset_pool_size": dataset_pool_size,
+        "new_dataset_pool_timeout": dataset_pool_timeout,
+        "new_tie_point_cache_size": tie_point_cache_size,
     }
 
     # Make sure that the constants dictionary is fully populated
@@ -432,7 +513,7 @@ def environment(display=True, paths=True):
             the descriptions is returned in a `list`.
 
     """
-    import ctypes
+    import ctypes.util
 
     import netCDF4
 
@@ -879,6 +960,13 @@ def unique_constructs(constructs, ignore_properties=None, copy=True):
     # Initialise the list of unique constructs
     out = [construct0]
 
+    # Unique constructs, bucketed by their signatures. Constructs with
+    # different signatures can not be equal, so each construct need
+    # only be compared with the unique constructs in its own bucket.
+    buckets = {
+        _construct_signature(construct0, ignore_properties): [construct0]
+    }
+
     # ----------------------------------------------------------------
     # Loop round the iterator, adding any new unique constructs to the
     # list
@@ -886,7 +974,10 @@ def unique_constructs(constructs, ignore_properties=None, copy=True):
     for construct in constructs:
         equal = False
 
-        for c in out:
+        bucket = buckets.setdefault(
+            _construct_signature(construct, ignore_properties), []
+        )
+        for c in bucket:
             if construct.equals(
                 c, ignore_properties=ignore_properties, verbose="DISABLE"
             ):
@@ -905,6 +996,7 @@ def unique_constructs(constructs, ignore_properties=None, copy=True):
                 construct = construct.copy()
 
             out.append(construct)
+            bucket.append(construct)
 
     if generator_out:
         return (c for c in out)
@@ -912,6 +1004,134 @@ def unique_constructs(constructs, ignore_properties=None, copy=True):
     return out_type(out)
 
 
+def _construct_signature(construct, ignore_properties=None):
+    """Return a hashable signature of a construct.
+
+    Constructs that are equal, as tested by their `!equals` methods,
+    always have the same signature, so constructs with different
+    signatures can not be equal.
+
+    The signature comprises only those components that are compared
+    exactly by equality: the names of the properties, the values of
+    string-valued properties other than units and calendar, the
+    shapes and numerical data types of any data and bounds, and the
+    sizes of the domain axes and the number of metadata constructs of
+    each type of a field or domain construct. Numerical values, and
+    the values of the units and calendar properties, are not
+    included, because they may be compared with tolerances or by
+    meaning. The type of the construct is not included, because
+    equality may be tested with *ignore_type*.
+
+    .. versionadded:: (cfdm) NEXTVERSION
+
+    .. seealso:: `unique_constructs`
+
+    :Parameters:
+
+        construct:
+            The construct.
+
+        ignore_properties: sequence of `str`, optional
+            The names of properties to be excluded from the signature.
+
+    :Returns:
+
+        `tuple`
+            The signature.
+
+    **Examples**
+
+    >>> cfdm.functions._construct_signature(coord)
+    ((('standard_name', 'latitude'), ('units', None)),
+     ((5,), ('f', 8)),
+     ((5, 2), ('f', 8)),
+     None)
+
+    """
+    try:
+        if construct.nc_get_external():
+            # External variables are equal if they have the same
+            # netCDF variable name
+            return ("external", construct.nc_get_variable(None))
+    except AttributeError:
+        pass
+
+    if ignore_properties is None:
+        ignore_properties = ()
+
+    try:
+        properties = construct.properties()
+    except AttributeError:
+        properties = {}
+
+    properties = tuple(
+        sorted(
+            (
+                prop,
+                (
+                    value
+                    if isinstance(value, str)
+                    and prop not in ("units", "calendar")
+                    else None
+                ),
+            )
+            for prop, value in properties.items()
+            if prop not in ignore_properties and prop != "Conventions"
+        )
+    )
+
+    signature = [properties]
+
+    # The shapes and numerical data types of the data and bounds
+    for x in (construct, getattr(construct, "get_bounds", None)):
+        if callable(x):
+            x = x(None)
+
+        if x is None or isinstance(x, str):
+            signature.append(None)
+            continue
+
+        try:
+            shape = x.shape
+            dtype = x.dtype
+        except (AttributeError, ValueError):
+            signature.append(None)
+            continue
+
+        if dtype.kind in "biufc":
+            # Numeric data types must match, modulo endianness
+            dtype = (dtype.kind, dtype.itemsize)
+        else:
+            dtype = None
+
+        signature.append((shape, dtype))
+
+    # The domain of a field or domain construct
+    try:
+        constructs = construct.constructs
+    except AttributeError:
+        signature.append(None)
+    else:
+        sizes = [
+            axis.get_size(None)
+            for axis in constructs.filter_by_type(
+                "domain_axis", todict=True
+            ).values()
+        ]
+        types = {}
+        for construct_type in constructs.construct_types().values():
+            types[construct_type] = types.get(construct_type, 0) + 1
+
+        signature.append(
+            (
+                tuple(sorted(sizes, key=lambda x: (x is None, x))),
+                tuple(sorted(types.items())),
+            )
+        )
+
+    return tuple(signature)
+
+
 @total_ordering
 class Constant(metaclass=DocstringRewriteMeta):
     """A container for a constant with context manager support.
@@ -2138,6 +2358,396 @@ class persist_data(ConstantAccess):
         return bool(arg)
 
 
+class lock_policy(ConstantAccess):
+    """Control the locking of datasets during data access.
+
+    Reading data from, and writing data to, datasets with some
+    libraries (such as `netCDF4` and `h5netcdf`) may not be safe when
+    done concurrently from multiple threads, so such access is
+    serialised with a lock. The lock policy determines which lock is
+    used:
+
+    * ``'global'``: A single process-wide lock is used for all
+      datasets, so that no two datasets are ever accessed at the same
+      time. This is the default, and is always safe.
+
+    * ``'file'``: A separate lock is used for each dataset, so that
+      different datasets may be accessed concurrently, but any one
+      dataset is only ever accessed by one thread at a time. This is
+      only safe if the underlying library (e.g. the netCDF-C or HDF5
+      library) was built to be thread-safe.
+
+    * ``'none'``: No locking is done. This is only safe for
+      thread-safe libraries.
+
+    Data access with the thread-safe `pyfive`, `zarr` and
+    `scipy.io.netcdf_file` libraries is never locked, regardless of
+    the lock policy.
+
+    .. versionadded:: (cfdm) NEXTVERSION
+
+    .. seealso:: `configuration`
+
+    :Parameters:
+
+        arg: `str` or `Constant`, optional
+            The new lock policy, one of ``'global'``, ``'file'``, or
+            ``'none'``. The default is to not change the current
+            value.
+
+    :Returns:
+
+        `Constant`
+            The value prior to the change, or the current value if no
+            new value was specified.
+
+    **Examples**
+
+    >>> {{package}}.lock_policy()
+    <{{repr}}Constant: 'global'>
+    >>> print({{package}}.lock_policy())
+    global
+    >>> {{package}}.lock_policy().value
+    'global'
+
+    >>> old = {{package}}.lock_policy('file')
+    >>> {{package}}.lock_policy()
+    <{{repr}}Constant: 'file'>
+    >>> {{package}}.lock_policy(old)
+    <{{repr}}Constant: 'file'>
+    >>> {{package}}.lock_policy()
+    <{{repr}}Constant: 'global'>
+
+    Use as a context manager:
+
+    >>> print({{package}}.lock_policy())
+    global
+    >>> with {{package}}.lock_policy('none'):
+    ...     print({{package}}.lock_policy())
+    ...
+    none
+    >>> print({{package}}.lock_policy())
+    global
+
+    """
+
+    _name = "lock_policy"
+    _default = "global"
+
+    # The valid lock policies
+    _valid = ("global", "file", "none")
+
+    def _parse(cls, arg):
+        """Parse a new constant value.
+
+        .. versionaddedd:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            cls:
+                This class.
+
+            arg:
+                The given new constant value.
+
+        :Returns:
+
+                A version of the new constant value suitable for
+                insertion into the `_constants` dictionary.
+
+        """
+        if arg not in cls._valid:
+            raise ValueError(
+                f"Invalid lock policy: {arg!r}. Must be one of "
+                f"{', '.join(map(repr, cls._valid))}"
+            )
+
+        return arg
+
+
+class dataset_pool_size(ConstantAccess):
+    """The maximum number of idle open datasets kept for data access.
+
+    Rather than opening and closing a dataset every time that its
+    data are accessed, open datasets are kept in a pool that is
+    shared by all data arrays, so that subsequent reads from the same
+    dataset do not need to re-open it. This can greatly reduce the
+    time taken to compute data that are split into many chunks.
+
+    When the pool contains more than this number of datasets, the
+    least recently used datasets that are not currently in use are
+    closed. A value of zero disables pooling, so that a dataset is
+    closed immediately after each data access.
+
+    .. versionadded:: (cfdm) NEXTVERSION
+
+    .. seealso:: `configuration`, `dataset_pool_timeout`
+
+    :Parameters:
+
+        arg: `int` or `Constant`, optional
+            The new maximum pool size. The default is to not change
+            the current value.
+
+    :Returns:
+
+        `Constant`
+            The value prior to the change, or the current value if no
+            new value was specified.
+
+    **Examples**
+
+    >>> {{package}}.dataset_pool_size()
+    <{{repr}}Constant: 64>
+    >>> print({{package}}.dataset_pool_size())
+    64
+    >>> {{package}}.dataset_pool_size().value
+    64
+
+    >>> old = {{package}}.dataset_pool_size(0)
+    >>> {{package}}.dataset_pool_size()
+    <{{repr}}Constant: 0>
+    >>> {{package}}.dataset_pool_size(old)
+    <{{repr}}Constant: 0>
+    >>> {{package}}.dataset_pool_size()
+    <{{repr}}Constant: 64>
+
+    Use as a context manager:
+
+    >>> print({{package}}.dataset_pool_size())
+    64
+    >>> with {{package}}.dataset_pool_size(0):
+    ...     print({{package}}.dataset_pool_size())
+    ...
+    0
+    >>> print({{package}}.dataset_pool_size())
+    64
+
+    """
+
+    _name = "dataset_pool_size"
+    _default = 64
+
+    def _parse(cls, arg):
+        """Parse a new constant value.
+
+        .. versionaddedd:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            cls:
+                This class.
+
+            arg:
+                The given new constant value.
+
+        :Returns:
+
+                A version of the new constant value suitable for
+                insertion into the `_constants` dictionary.
+
+        """
+        arg = int(arg)
+        if arg < 0:
+            raise ValueError(
+                f"Invalid dataset pool size: {arg!r}. Must be a "
+                "non-negative integer"
+            )
+
+        if not arg:
+            from .data.datasetpool import dataset_pool
+            from .data.tiepointcache import tie_point_cache
+
+            dataset_pool.clear()
+            tie_point_cache.clear()
+
+        return arg
+
+
+class dataset_pool_timeout(ConstantAccess):
+    """The time after which an idle pooled open dataset is closed.
+
+    An open dataset in the pool (see `dataset_pool_size`) that has
+    not been used for more than this number of seconds is closed.
+    Idle datasets are checked for expiry whenever the pool is
+    accessed.
+
+    .. versionadded:: (cfdm) NEXTVERSION
+
+    .. seealso:: `configuration`, `dataset_pool_size`
+
+    :Parameters:
+
+        arg: number or `Constant`, optional
+            The new timeout, in seconds. The default is to not change
+            the current value.
+
+    :Returns:
+
+        `Constant`
+            The value prior to the change, or the current value if no
+            new value was specified.
+
+    **Examples**
+
+    >>> {{package}}.dataset_pool_timeout()
+    <{{repr}}Constant: 60.0>
+    >>> print({{package}}.dataset_pool_timeout())
+    60.0
+    >>> {{package}}.dataset_pool_timeout().value
+    60.0
+
+    >>> old = {{package}}.dataset_pool_timeout(3600)
+    >>> {{package}}.dataset_pool_timeout()
+    <{{repr}}Constant: 3600.0>
+    >>> {{package}}.dataset_pool_timeout(old)
+    <{{repr}}Constant: 3600.0>
+    >>> {{package}}.dataset_pool_timeout()
+    <{{repr}}Constant: 60.0>
+
+    Use as a context manager:
+
+    >>> print({{package}}.dataset_pool_timeout())
+    60.0
+    >>> with {{package}}.dataset_pool_timeout(10):
+    ...     print({{package}}.dataset_pool_timeout())
+    ...
+    10.0
+    >>> print({{package}}.dataset_pool_timeout())
+    60.0
+
+    """
+
+    _name = "dataset_pool_timeout"
+    _default = 60.0
+
+    def _parse(cls, arg):
+        """Parse a new constant value.
+
+        .. versionaddedd:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            cls:
+                This class.
+
+            arg:
+                The given new constant value.
+
+        :Returns:
+
+                A version of the new constant value suitable for
+                insertion into the `_constants` dictionary.
+
+        """
+        arg = float(arg)
+        if arg < 0:
+            raise ValueError(
+                f"Invalid dataset pool timeout: {arg!r}. Must be a "
+                "non-negative number"
+            )
+
+        return arg
+
+
+class tie_point_cache_size(ConstantAccess):
+    """The maximum size of the cache of subsampled tie points.
+
+    When the data of coordinates that have been compressed by
+    subsampling are computed, the tie points, and any interpolation
+    parameters and dependent tie points, are read into memory once
+    and shared by all of the interpolation subareas, rather than each
+    interpolation subarea reading its own tie points from the
+    dataset. All computations in a process share one cache, from
+    which the least recently used arrays are removed whenever it
+    would otherwise become larger than this number of bytes. An array
+    that is larger than this size is never cached. A cached array is
+    not used after the file that contains it has been modified, and
+    is removed from the cache when the file is written to by
+    `cfdm.write`. A value of zero disables the cache.
+
+    .. versionadded:: (cfdm) NEXTVERSION
+
+    .. seealso:: `configuration`
+
+    :Parameters:
+
+        arg: number or `str` or `Constant`, optional
+            The new maximum cache size in bytes. Any size accepted by
+            `dask.utils.parse_bytes` is accepted, for instance
+            ``100``, ``'100 MB'``, and ``'1 GiB'``. The default is to
+            not change the current value.
+
+    :Returns:
+
+        `Constant`
+            The value prior to the change, or the current value if no
+            new value was specified.
+
+    **Examples**
+
+    >>> {{package}}.tie_point_cache_size()
+    <{{repr}}Constant: 134217728>
+    >>> print({{package}}.tie_point_cache_size())
+    134217728
+    >>> {{package}}.tie_point_cache_size().value
+    134217728
+
+    >>> old = {{package}}.tie_point_cache_size('1 MiB')
+    >>> {{package}}.tie_point_cache_size()
+    <{{repr}}Constant: 1048576>
+    >>> {{package}}.tie_point_cache_size(old)
+    <{{repr}}Constant: 1048576>
+    >>> {{package}}.tie_point_cache_size()
+    <{{repr}}Constant: 134217728>
+
+    Use as a context manager:
+
+    >>> print({{package}}.tie_point_cache_size())
+    134217728
+    >>> with {{package}}.tie_point_cache_size(0):
+    ...     print({{package}}.tie_point_cache_size())
+    ...
+    0
+    >>> print({{package}}.tie_point_cache_size())
+    134217728
+
+    """
+
+    _name = "tie_point_cache_size"
+    _default = 134217728  # 134217728 = 128 MiB
+
+    def _parse(cls, arg):
+        """Parse a new constant value.
+
+        .. versionaddedd:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            cls:
+                This class.
+
+            arg:
+                The given new constant value.
+
+        :Returns:
+
+                A version of the new constant value suitable for
+                insertion into the `_constants` dictionary.
+
+        """
+        from dask.utils import parse_bytes
+
+        arg = parse_bytes(arg)
+        if arg < 0:
+            raise ValueError(
+                f"Invalid tie point cache size: {arg!r}. Must be a "
+                "non-negative number of bytes"
+            )
+
+        return arg
+
+
 def ATOL(*new_atol):
     """Alias for `cfdm.atol`."""
     return atol(*new_atol)
@@ -115,6 +115,7 @@ class NetCDFMixin:
         None
 
         """
+        self._record_mutation()
         try:
             return self._get_netcdf().pop(entity)
         except KeyError:
@@ -313,6 +314,7 @@ class NetCDFMixin:
         """
         netcdf = self._get_netcdf()
         netcdf[key] = value
+        self._record_mutation()
 
 
 class NetCDFGroupsMixin:
@@ -1082,6 +1082,67 @@ class PropertiesData(Properties):
 
         return v
 
+    def ragged_features(self, features=None, batch_size=None):
+        """Iterate over the features of ragged array data.
+
+        For data that are compressed as a ragged array for discrete
+        sampling geometries (DSG), each feature is read directly from
+        the compressed data and contains only its own elements,
+        rather than being padded with missing values to the size of
+        the largest feature, as happens when the data are
+        uncompressed. The compressed data is read one feature, or one
+        batch of features, at a time, so the memory used is bounded
+        by the size of the largest feature or batch.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        .. seealso:: `uncompress`, `{{package}}.Data.ragged_features`
+
+        :Parameters:
+
+            features: (sequence of) `int`, or `slice`, optional
+                Select the features to iterate over, by their
+                positions along the uncompressed instance
+                dimension. By default all features are iterated over,
+                in order.
+
+            batch_size: `int`, optional
+                If set then iterate over lists of up to *batch_size*
+                features, rather than over individual features. The
+                compressed data for all of the features in a batch is
+                read at the same time. By default each feature is read
+                separately.
+
+        :Returns:
+
+            generator
+                The features, or lists of features if *batch_size* is
+                set. For contiguous and indexed ragged arrays, each
+                feature is a `numpy` array of its elements. For
+                indexed contiguous ragged arrays, each feature is a
+                `list` of `numpy` arrays, one for each of its
+                profiles.
+
+        **Examples**
+
+        >>> f.data.get_compression_type()
+        'ragged contiguous'
+        >>> for feature in f.ragged_features(batch_size=2):
+        ...     print([x.size for x in feature])
+        ...
+        [3, 7]
+        [5, 9]
+
+        """
+        data = self.get_data(None, _units=False, _fill_value=False)
+        if data is None:
+            raise ValueError(
+                f"Can't iterate over the features of {self!r}: "
+                "There are no data"
+            )
+
+        return data.ragged_features(features=features, batch_size=batch_size)
+
     def replace_directory(
         self,
         old=None,
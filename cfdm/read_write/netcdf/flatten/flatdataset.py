@@ -0,0 +1,416 @@
+"""A virtual flattened view of a grouped dataset.
+
+.. versionadded:: (cfdm) NEXTVERSION
+
+"""
+
+
+class FlatDataset:
+    """A virtual flattened view of a grouped dataset.
+
+    A `FlatDataset` is created by `dataset_flatten` and has the same
+    API as a `netCDF4.Dataset` opened for reading, but without any
+    groups. Its dimensions and variables are thin wrappers of those
+    in the original grouped dataset, that just give them their
+    flattened names and (for variables) their flattened attributes. No
+    data or variable metadata are copied, and the original grouped
+    dataset may be a `netCDF4.Dataset`, `h5netcdf.File`, or
+    `zarr.Group`.
+
+    .. versionadded:: (cfdm) NEXTVERSION
+
+    """
+
+    # The data model of a flattened dataset
+    data_model = "NETCDF4"
+
+    def __init__(self, dataset_name=None):
+        """**Initialisation**
+
+        :Parameters:
+
+            dataset_name: `str`, optional
+                The name of the original grouped dataset.
+
+        """
+        self._dataset_name = dataset_name
+
+        # The global attributes, keyed by their flattened names
+        self._attributes = {}
+
+        # The dimensions, keyed by their flattened names
+        self.dimensions = {}
+
+        # The variables, keyed by their flattened names
+        self.variables = {}
+
+        # A flattened dataset has no groups
+        self.groups = {}
+
+    def __repr__(self):
+        """Called by the `repr` built-in function.
+
+        x.__repr__() <==> repr(x)
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        """
+        return (
+            f"<{self.__class__.__name__}: {self._dataset_name!r}, "
+            f"{len(self.variables)} variables>"
+        )
+
+    def close(self):
+        """Close the dataset.
+
+        There is nothing to close, since the original grouped dataset
+        is not owned by the flattened view.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Returns:
+
+            `None`
+
+        """
+        pass
+
+    def filepath(self):
+        """Return the name of the original grouped dataset.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Returns:
+
+            `str` or `None`
+
+        """
+        return self._dataset_name
+
+    def getncattr(self, attr):
+        """Return a global attribute.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            attr: `str`
+                The attribute name.
+
+        :Returns:
+
+                The attribute value.
+
+        """
+        return self._attributes[attr]
+
+    def ncattrs(self):
+        """Return the global attribute names.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Returns:
+
+            `list`
+
+        """
+        return list(self._attributes)
+
+    def setncattr(self, attr, value):
+        """Set a global attribute.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            attr: `str`
+                The attribute name.
+
+            value:
+                The attribute value.
+
+        :Returns:
+
+            `None`
+
+        """
+        self._attributes[attr] = value
+
+
+class FlatDimension:
+    """A dimension of a `FlatDataset`.
+
+    Has the same API as `netCDF4.Dimension`, and wraps a dimension of
+    the original grouped dataset.
+
+    .. versionadded:: (cfdm) NEXTVERSION
+
+    """
+
+    def __init__(self, name, dimension):
+        """**Initialisation**
+
+        :Parameters:
+
+            name: `str`
+                The flattened dimension name.
+
+            dimension:
+                The dimension of the original grouped dataset.
+
+        """
+        self.name = name
+        self._dimension = dimension
+
+    def __len__(self):
+        """The size of the dimension.
+
+        x.__len__() <==> len(x)
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        """
+        return len(self._dimension)
+
+    def __repr__(self):
+        """Called by the `repr` built-in function.
+
+        x.__repr__() <==> repr(x)
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        """
+        return f"<{self.__class__.__name__} {self.name!r}, size {self.size}>"
+
+    @property
+    def size(self):
+        """The size of the dimension.
+
+        Unlike the dimensions of a diskless netCDF4 flattened
+        dataset, the size of an unlimited dimension is its actual
+        size in the original grouped dataset.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        """
+        return len(self._dimension)
+
+    def isunlimited(self):
+        """Whether or not the dimension is unlimited.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Returns:
+
+            `bool`
+                `True` if and only if the dimension is unlimited.
+
+        """
+        return bool(self._dimension.isunlimited())
+
+
+class FlatVariable:
+    """A variable of a `FlatDataset`.
+
+    Has the same API as a `netCDF4.Variable` opened for reading, and
+    wraps a variable of the original grouped dataset, from which its
+    data are read.
+
+    .. versionadded:: (cfdm) NEXTVERSION
+
+    """
+
+    def __init__(self, name, variable, dimensions, attributes, flattener):
+        """**Initialisation**
+
+        :Parameters:
+
+            name: `str`
+                The flattened variable name.
+
+            variable:
+                The variable of the original grouped dataset.
+
+            dimensions: sequence of `str`
+                The flattened dimension names.
+
+            attributes: `dict`
+                The variable attributes.
+
+            flattener: `_Flattener`
+                The flattener that created the variable, which knows
+                how to inspect *variable*.
+
+        """
+        self.name = name
+        self.dimensions = tuple(dimensions)
+        self._variable = variable
+        self._attributes = attributes
+        self._flattener = flattener
+
+    def __getitem__(self, index):
+        """Return a subspace of the original variable's data.
+
+        x.__getitem__(index) <==> x[index]
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        """
+        return self._variable[index]
+
+    def __repr__(self):
+        """Called by the `repr` built-in function.
+
+        x.__repr__() <==> repr(x)
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        """
+        return (
+            f"<{self.__class__.__name__} {self.name!r}, "
+            f"dimensions {self.dimensions}>"
+        )
+
+    @property
+    def dtype(self):
+        """The data type, with `str` for variable length strings.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        """
+        return self._flattener.dtype(self._variable)
+
+    @property
+    def ndim(self):
+        """The number of dimensions.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        """
+        return len(self.dimensions)
+
+    @property
+    def shape(self):
+        """The shape of the data.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        """
+        return tuple(self._variable.shape)
+
+    @property
+    def size(self):
+        """The number of elements in the data.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        """
+        size = 1
+        for n in self.shape:
+            size *= n
+
+        return size
+
+    def chunking(self):
+        """Return the storage chunking of the original variable.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Returns:
+
+            `str` or `list` of `int`
+                ``'contiguous'`` if the data are not chunked,
+                otherwise the size of the storage chunks along each
+                dimension.
+
+        """
+        flattener = self._flattener
+        if flattener.contiguous(self._variable):
+            return "contiguous"
+
+        return list(flattener.chunksizes(self._variable))
+
+    def endian(self):
+        """Return the endian-ness of the original variable.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Returns:
+
+            `str`
+                One of ``'little'``, ``'big'``, or ``'native'``.
+
+        """
+        return self._flattener.endian(self._variable)
+
+    def getncattr(self, attr):
+        """Return an attribute.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            attr: `str`
+                The attribute name.
+
+        :Returns:
+
+                The attribute value.
+
+        """
+        return self._attributes[attr]
+
+    def ncattrs(self):
+        """Return the attribute names.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Returns:
+
+            `list`
+
+        """
+        return list(self._attributes)
+
+    def setncattr(self, attr, value):
+        """Set an attribute.
+
+        Only the flattened view is changed, the original variable is
+        unaffected.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            attr: `str`
+                The attribute name.
+
+            value:
+                The attribute value.
+
+        :Returns:
+
+            `None`
+
+        """
+        self._attributes[attr] = value
+
+    def setncatts(self, attributes):
+        """Set multiple attributes.
+
+        Only the flattened view is changed, the original variable is
+        unaffected.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            attributes: `dict`
+                The attribute values keyed by their names.
+
+        :Returns:
+
+            `None`
+
+        """
+        self._attributes.update(attributes)
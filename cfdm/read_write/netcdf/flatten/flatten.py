@@ -28,6 +28,7 @@ from .config import (
     max_name_len,
     ref_not_found_error,
 )
+from .flatdataset import FlatDataset, FlatDimension, FlatVariable
 
 logger = logging.getLogger(__name__)
 
@@ -47,7 +48,7 @@ referencing_attributes = set(flattening_rules)
 
 def dataset_flatten(
     input_ds,
-    output_ds,
+    output_ds=None,
     strict=True,
     copy_data=True,
     group_dimension_search="closest_ancestor",
@@ -82,6 +83,16 @@ def dataset_flatten(
     /group1/lat'``, and the ``_flattener_dimension_map`` global
     attribute will contain the mapping ``'lat: /lat'``.
 
+    **Virtual flattening**
+
+    If no *output_ds* is given then a virtual flattened view of the
+    input dataset is returned, rather than a copy of it. The view has
+    the same read API as a `netCDF4.Dataset`, and its dimensions and
+    variables wrap those of the input dataset with their flattened
+    names and attributes, from which all data are read. No data are
+    copied and no `netCDF4` dataset is created, so this is fast and
+    uses little memory even for datasets with very many variables.
+
     .. versionadded:: (cfdm) 1.11.2.0
 
     :Parameters:
@@ -91,9 +102,14 @@ def dataset_flatten(
             with the same API as `netCDF4.Dataset`, `h5netcdf.File`,
             or `zarr.Group`.
 
-        output_ds: `netCDF4.Dataset`
+        output_ds: `netCDF4.Dataset` or `None`, optional
             A container for the flattened dataset that will get
-            updated in-place with the flattened input dataset.
+            updated in-place with the flattened input dataset. If
+            `None` (the default) then a virtual flattened view of the
+            input dataset is created and returned instead.
+
+            .. versionchanged:: (cfdm) NEXTVERSION
+                No longer required
 
         strict: `bool`, optional
             If True, the default, then failing to resolve a reference
@@ -105,7 +121,9 @@ def dataset_flatten(
             *input_ds* are copied to *output_ds*. If False then no
             data arrays are copied, instead all variables' data will
             be represented by the fill value, but without having to
-            actually create these arrays in memory or on disk.
+            actually create these arrays in memory or on disk. Ignored
+            for a virtual flattened view, whose data are always read
+            from the input dataset.
 
         group_dimension_search: `str`, optional
             How to interpret a dimension name that contains no
@@ -166,16 +184,30 @@ def dataset_flatten(
 
     :Returns:
 
-        `None`
+        `FlatDataset` or `None`
+            The virtual flattened view of the input dataset, or
+            `None` if *output_ds* was given.
+
+    **Examples**
+
+    >>> import netCDF4
+    >>> nc = netCDF4.Dataset('grouped.nc')
+    >>> flat = cfdm.dataset_flatten(nc)
+    >>> flat.variables['forecast__model__ta']
+    <FlatVariable 'forecast__model__ta', dimensions ('forecast__y', 'x')>
 
     """
-    _Flattener(
+    flattener = _Flattener(
         input_ds,
         output_ds,
         strict,
         copy_data=copy_data,
         group_dimension_search=group_dimension_search,
-    ).flatten()
+    )
+    flattener.flatten()
+
+    if output_ds is None:
+        return flattener._output_ds
 
 
 def parse_attribute(name, attribute):
@@ -316,8 +348,9 @@ class _Flattener:
                 the same API as `netCDF4.Dataset` or
                 `h5netcdf.File`, or else a `zarr.Group` object.
 
-            output_ds: `netCDF4.Dataset`
-                A container for the flattened dataset.
+            output_ds: `netCDF4.Dataset` or `None`
+                A container for the flattened dataset, or `None` to
+                create a virtual flattened view of the input dataset.
 
             strict: `bool`, optional
                 See `dataset_flatten`.
@@ -401,8 +434,30 @@ class _Flattener:
         # `_populate_dimension_maps`.
         self._var_to_dims = {}
 
+        # Symbol tables of the dimensions, variables, child groups
+        # and parent group defined by each group, keyed by full-path
+        # group names. Generated on demand by `_group_symbol_table`.
+        #
+        # E.g. {'/forecast': {'dimensions': {'y': <Dimension>},
+        #                     'variables': {'y': <Variable>},
+        #                     'groups': {'model': <Group>},
+        #                     'parent': <Group>}}
+        self._group_symbols = {}
+
+        # Memoised results of reference searches, keyed by
+        # (reference, full-path group name, attribute name)
+        #
+        # E.g. {('x', '/forecast', 'coordinates'):
+        #           ('/x', 'variable', 'Proximity')}
+        self._resolved_references = {}
+
+        # Memoised parsed referencing attributes, keyed by
+        # (attribute name, attribute value)
+        #
+        # E.g. {('coordinates', 'x y'): {'x': None, 'y': None}}
+        self._parsed_attributes = {}
+
         self._input_ds = input_ds
-        self._output_ds = output_ds
 
         # Record the backend that defines 'input_ds'
         if hasattr(input_ds, "_h5file"):
@@ -421,7 +476,13 @@ class _Flattener:
         self._copy_data = bool(copy_data)
         self._group_dimension_search = group_dimension_search
 
-        if (
+        # Whether or not to create a virtual flattened view, rather
+        # than a flattened copy.
+        self._virtual = output_ds is None
+        if self._virtual:
+            output_ds = FlatDataset(self.dataset_name())
+            self._copy_data = False
+        elif (
             output_ds == input_ds
             or output_ds.filepath() == self.dataset_name()
             or output_ds.data_model != "NETCDF4"
@@ -431,6 +492,8 @@ class _Flattener:
                 "be different, and output should be of the 'NETCDF4' format."
             )
 
+        self._output_ds = output_ds
+
         self._debug = is_log_level_debug(logger)
 
     def _variable_attrs(self, variable, dataset=None):
@@ -903,13 +966,15 @@ class _Flattener:
         for attr_name in self._attribute_names(input_group):
             self.flatten_attribute(input_group, attr_name)
 
-        for dim in self._group_dimensions(input_group).values():
+        symbols = self._group_symbol_table(input_group)
+
+        for dim in symbols["dimensions"].values():
             self.flatten_dimension(dim)
 
-        for var in self._group_variables(input_group).values():
+        for var in symbols["variables"].values():
             self.flatten_variable(var)
 
-        for child_group in self._child_groups(input_group).values():
+        for child_group in symbols["groups"].values():
             self.process_group(child_group)
 
     def flatten_attribute(self, input_group, attr_name):
@@ -976,9 +1041,12 @@ class _Flattener:
             )  # pragma: no cover
 
         # Write dimension
-        self._output_ds.createDimension(
-            new_name, (len(dim), None)[dim.isunlimited()]
-        )
+        if self._virtual:
+            self._output_ds.dimensions[new_name] = FlatDimension(new_name, dim)
+        else:
+            self._output_ds.createDimension(
+                new_name, (len(dim), None)[dim.isunlimited()]
+            )
 
         # Store new name in dict for resolving references later
         self._dim_map[self.pathname(group, name)] = new_name
@@ -1027,32 +1095,44 @@ class _Flattener:
         # Write variable
         attributes = self._variable_attrs(var)
 
-        copy_data = self._copy_data
-        if copy_data:
-            fill_value = attributes.pop("_FillValue", None)
+        if self._virtual:
+            # Decode byte-string attributes, as would happen when
+            # writing them to a netCDF4 flattened dataset
+            for attr, value in attributes.items():
+                if isinstance(value, bytes):
+                    attributes[attr] = value.decode()
+
+            # Wrap the original variable, which also provides the
+            # data
+            new_var = FlatVariable(new_name, var, new_dims, attributes, self)
+            self._output_ds.variables[new_name] = new_var
         else:
-            fill_value = False
-
-        new_var = self._output_ds.createVariable(
-            new_name,
-            self.dtype(var),
-            new_dims,
-            zlib=False,
-            complevel=4,
-            shuffle=True,
-            fletcher32=False,
-            contiguous=self.contiguous(var),
-            chunksizes=self.chunksizes(var),
-            endian=self.endian(var),
-            least_significant_digit=None,
-            fill_value=fill_value,
-        )
+            copy_data = self._copy_data
+            if copy_data:
+                fill_value = attributes.pop("_FillValue", None)
+            else:
+                fill_value = False
+
+            new_var = self._output_ds.createVariable(
+                new_name,
+                self.dtype(var),
+                new_dims,
+                zlib=False,
+                complevel=4,
+                shuffle=True,
+                fletcher32=False,
+                contiguous=self.contiguous(var),
+                chunksizes=self.chunksizes(var),
+                endian=self.endian(var),
+                least_significant_digit=None,
+                fill_value=fill_value,
+            )
 
-        if copy_data:
-            self.write_data(var, new_var)
+            if copy_data:
+                self.write_data(var, new_var)
 
-        # Copy attributes
-        new_var.setncatts(attributes)
+            # Copy attributes
+            new_var.setncatts(attributes)
 
         # Store new name in dict for resolving references later
         self._var_map[self.pathname(self.group(var), self.name(var))] = (
@@ -1148,7 +1228,7 @@ class _Flattener:
         import dask.array as da
         import numpy as np
 
-        from cfdm.data.locks import netcdf_lock
+        from cfdm.data.locks import get_lock
 
         # Need to convert a string-valued 'old_var' to a numpy array
         if self.dtype(old_var) == str:
@@ -1200,7 +1280,7 @@ class _Flattener:
                 new_var,
                 compute=True,
                 return_stored=False,
-                lock=netcdf_lock,
+                lock=get_lock(self._backend(), self.dataset_name()),
             )
 
     def resolve_reference(self, orig_ref, orig_var, rules):
@@ -1209,6 +1289,10 @@ class _Flattener:
         Resolves the absolute path to a coordinate variable within the
         group structure.
 
+        The search of the group structure is memoised, so a reference
+        that has already been resolved from the same group with the
+        same rules is not searched for again.
+
         .. versionadded:: (cfdm) 1.11.2.0
 
         :Parameters:
@@ -1228,7 +1312,52 @@ class _Flattener:
                 The absolute path to the reference.
 
         """
-        ref = orig_ref
+        group = self.group(orig_var)
+        key = (orig_ref, self.path(group), rules.name)
+        resolved = self._resolved_references.get(key)
+        if resolved is None:
+            resolved = self.search_reference(orig_ref, group, rules)
+            self._resolved_references[key] = resolved
+
+        absolute_ref, ref_type, method = resolved
+
+        # Post-search checks and return result
+        return self.resolve_reference_post_processing(
+            absolute_ref,
+            orig_ref,
+            orig_var,
+            rules,
+            ref_type,
+            method,
+        )
+
+    def search_reference(self, ref, group, rules):
+        """Search the group structure for a reference.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            ref: `str`
+                The reference to resolve.
+
+            group:
+                The group object of the variable containing the
+                reference.
+
+            rules: `FlatteningRules`
+                The flattening rules that apply to the reference.
+
+        :Returns:
+
+            3-`tuple`
+                The absolute path to the reference (or `None` if
+                unresolved), the type of reference (either
+                ``'dimension'``, ``'variable'``, or ``''``), and the
+                method of reference resolution (one of
+                ``'Absolute'``, ``'Relative'``, or ``'Proximity'``).
+
+        """
         absolute_ref = None
         ref_type = ""
 
@@ -1257,7 +1386,7 @@ class _Flattener:
                 ref_type = "variable"
 
             absolute_ref = self.search_by_relative_path(
-                orig_ref, self.group(orig_var), resolve_dim_or_var
+                ref, group, resolve_dim_or_var
             )
 
             # If failed and alternative possible, second tentative
@@ -1268,7 +1397,7 @@ class _Flattener:
                     ref_type = "dimension"
 
                 absolute_ref = self.search_by_relative_path(
-                    orig_ref, self.groupp(orig_var), not resolve_dim_or_var
+                    ref, group, not resolve_dim_or_var
                 )
 
         # Reference is to be searched by proximity
@@ -1278,22 +1407,14 @@ class _Flattener:
                 ref,
                 resolve_dim_or_var,
                 resolve_alt,
-                orig_var,
+                group,
                 rules,
             )
 
-        # Post-search checks and return result
-        return self.resolve_reference_post_processing(
-            absolute_ref,
-            orig_ref,
-            orig_var,
-            rules,
-            ref_type,
-            method,
-        )
+        return absolute_ref, ref_type, method
 
     def resolve_reference_proximity(
-        self, ref, resolve_dim_or_var, resolve_alt, orig_var, rules
+        self, ref, resolve_dim_or_var, resolve_alt, group, rules
     ):
         """Resolve reference: search by proximity.
 
@@ -1312,8 +1433,12 @@ class _Flattener:
                 Resolve as variable if resolving as dimension failed,
                 and vice versa.
 
-            orig_var:
-                The original variable object containing the reference.
+            group:
+                The group object of the variable containing the
+                reference.
+
+                .. versionchanged:: (cfdm) NEXTVERSION
+                    Replaces the *orig_var* parameter.
 
             rules: `FlatteningRules`
                 The flattening rules that apply to the reference.
@@ -1336,7 +1461,7 @@ class _Flattener:
 
         resolved_var = self.search_by_proximity(
             ref,
-            self.group(orig_var),
+            group,
             resolve_dim_or_var,
             False,
             stop_at_local_apex,
@@ -1351,7 +1476,7 @@ class _Flattener:
 
             resolved_var = self.search_by_proximity(
                 ref,
-                self.group(orig_var),
+                group,
                 not resolve_dim_or_var,
                 False,
                 stop_at_local_apex,
@@ -1479,7 +1604,7 @@ class _Flattener:
         """
         # Go up parent groups
         while ref.startswith(f"..{group_separator}"):
-            parent = self.parent(current_group)
+            parent = self._group_symbol_table(current_group)["parent"]
             if parent is None:
                 return
 
@@ -1490,19 +1615,25 @@ class _Flattener:
         ref_split = ref.split(group_separator)
         for g in ref_split[:-1]:
             try:
-                current_group = self._child_groups(current_group)[g]
+                current_group = self._group_symbol_table(current_group)[
+                    "groups"
+                ][g]
             except KeyError:
                 return
 
         # Get variable or dimension
+        symbols = self._group_symbol_table(current_group)
         if search_dim:
-            elt = tuple(self._group_dimensions(current_group))[ref_split[-1]]
-
+            dims_or_vars = symbols["dimensions"]
         else:
-            elt = tuple(self._group_variables(current_group))[ref_split[-1]]
+            dims_or_vars = symbols["variables"]
+
+        name = ref_split[-1]
+        if name not in dims_or_vars:
+            return
 
         # Get absolute reference
-        return self.pathname(self.group(elt), self.name(elt))
+        return self.pathname(current_group, name)
 
     def search_by_proximity(
         self,
@@ -1548,23 +1679,22 @@ class _Flattener:
                 `None`.
 
         """
+        symbols = self._group_symbol_table(current_group)
         if search_dim:
-            dims_or_vars = self._group_dimensions(current_group)
+            dims_or_vars = symbols["dimensions"]
         else:
-            dims_or_vars = self._group_variables(current_group)
+            dims_or_vars = symbols["variables"]
 
         # Found in current group
         if ref in dims_or_vars:
             return dims_or_vars[ref]
 
-        local_apex_reached = (
-            local_apex_reached or ref in self._group_dimensions(current_group)
-        )
+        local_apex_reached = local_apex_reached or ref in symbols["dimensions"]
 
         # Check if have to continue looking in parent group
         # - normal search: continue until root is reached
         # - coordinate variable: continue until local apex is reached
-        parent_group = self.parent(current_group)
+        parent_group = symbols["parent"]
         if is_coordinate_variable:
             top_reached = local_apex_reached or parent_group is None
         else:
@@ -1584,7 +1714,7 @@ class _Flattener:
             # Coordinate variable and local apex reached, so search
             # down in siblings.
             found_elt = None
-            for child_group in self._child_groups(current_group).values():
+            for child_group in symbols["groups"].values():
                 found_elt = self.search_by_proximity(
                     ref,
                     child_group,
@@ -1625,7 +1755,7 @@ class _Flattener:
         var_attrs = self._variable_attrs(var, "output")
         for name in referencing_attributes.intersection(var_attrs):
             # Parse attribute value
-            parsed_attribute = parse_attribute(name, var_attrs[name])
+            parsed_attribute = self._parse_attribute(name, var_attrs[name])
 
             # Resolved references in parsed as required by attribute
             # properties
@@ -1673,7 +1803,7 @@ class _Flattener:
         for name in referencing_attributes.intersection(var_attrs):
             # Parse attribute value
             value = var_attrs[name]
-            parsed_attribute = parse_attribute(name, value)
+            parsed_attribute = self._parse_attribute(name, value)
 
             adapted_parsed_attr = {}
 
@@ -1780,7 +1910,7 @@ class _Flattener:
                 The absolute path to the dimension or variable
 
         """
-        if self.parent(group) is None:
+        if self._group_symbol_table(group)["parent"] is None:
             return group_separator + name
 
         return group_separator.join((self.path(group), name))
@@ -1996,6 +2126,77 @@ class _Flattener:
             case "zarr":
                 return dict(group.arrays())
 
+    def _group_symbol_table(self, group):
+        """Return the symbol table of a group.
+
+        The symbol table is created on the first call for a group, and
+        subsequently retrieved from `_group_symbols`, so that searching
+        the group hierarchy when resolving references does not need to
+        repeatedly inspect the input dataset.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            group:
+                The group object.
+
+        :Returns:
+
+            `dict`
+                The dimensions, variables, and child groups defined in
+                the group, and the parent group, keyed by
+                ``'dimensions'``, ``'variables'``, ``'groups'``, and
+                ``'parent'`` respectively.
+
+        """
+        path = self.path(group)
+        symbols = self._group_symbols.get(path)
+        if symbols is None:
+            symbols = {
+                "dimensions": self._group_dimensions(group),
+                "variables": self._group_variables(group),
+                "groups": self._child_groups(group),
+                "parent": self.parent(group),
+            }
+            self._group_symbols[path] = symbols
+
+        return symbols
+
+    def _parse_attribute(self, name, attribute):
+        """Parse a referencing attribute, memoising the result.
+
+        See `parse_attribute` for details.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            name: `str`
+                The attribute name (e.g. ``'cell_methods'``).
+
+            attribute: `str`
+                The attribute value to parse.
+
+        :Returns:
+
+            `dict`
+                The parsed string. Must not be changed in-place.
+
+        """
+        key = (name, attribute)
+        try:
+            return self._parsed_attributes[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # Unhashable attribute value
+            return parse_attribute(name, attribute)
+
+        out = parse_attribute(name, attribute)
+        self._parsed_attributes[key] = out
+        return out
+
     def _populate_dimension_maps(self, group):
         """Populate the dimension map dictionaries.
 
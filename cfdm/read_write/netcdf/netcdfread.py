@@ -451,7 +451,7 @@ class NetCDFRead(IORead):
         """Close all netCDF datasets that have been opened.
 
         Includes the input dataset being read, any external datasets,
-        and any temporary flattened dataset.
+        and any original grouped dataset.
 
         :Returns:
 
@@ -486,11 +486,6 @@ class NetCDFRead(IORead):
             except AttributeError:
                 pass
 
-        # Close temporary flattened datasets, which are
-        # netCDF4.Dataset
-        for flat_dataset in g["flat_datasets"]:
-            flat_dataset.close()
-
         # Close the original grouped file (v1.8.8.1)
         if "nc_grouped" in g:
             try:
@@ -501,8 +496,9 @@ class NetCDFRead(IORead):
     def dataset_open(self, dataset, flatten=True, verbose=None):
         """Open the netCDF dataset for reading.
 
-        If the file has hierarchical groups then a flattened version
-        of it is returned, and the original grouped file remains open.
+        If the file has hierarchical groups then a virtual flattened
+        view of it is returned (see `dataset_flatten`), and the
+        original grouped file remains open.
 
         .. versionadded:: (cfdm) 1.7.0
 
@@ -616,44 +612,24 @@ class NetCDFRead(IORead):
         # If the file has a group structure then flatten it (CF>=1.8)
         # ------------------------------------------------------------
         if flatten and self._dataset_has_groups(nc):
-            import netCDF4
-
-            # Create a diskless, non-persistent container for the
-            # flattened file
-            flat_dataset = tempfile.NamedTemporaryFile(
-                mode="wb",
-                dir=tempfile.gettempdir(),
-                prefix="cfdm_flat_",
-                suffix=".nc",
-                delete=True,
-            )
-
-            flat_nc = netCDF4.Dataset(
-                flat_dataset, "w", diskless=True, persist=False
-            )
-            flat_nc.set_fill_off()
-
-            # Flatten the file
-            dataset_flatten(
+            # Create a virtual flattened view of the file, which
+            # wraps the original variables and dimensions without
+            # copying them
+            flat_nc = dataset_flatten(
                 nc,
-                flat_nc,
                 strict=False,
-                copy_data=False,
                 group_dimension_search=g["group_dimension_search"],
             )
 
-            # Store the original grouped file. This is primarily
-            # because the unlimited dimensions in the flattened
-            # dataset have size 0, since it contains no
-            # data. (v1.8.8.1)
+            # Store the original grouped file, from which the data
+            # are read. (v1.8.8.1)
             g["nc_grouped"] = nc
 
             nc = flat_nc
 
+            # The flattened view has the same API as netCDF4.Dataset
             g["nc_opened_with"] = "netCDF4"
             g["has_groups"] = True
-            g["flat_datasets"].append(flat_dataset)
-            g["nc_opened_with"] = "netCDF4"
         else:
             g["nc_opened_with"] = g["original_dataset_opened_with"]
 
@@ -1493,8 +1469,6 @@ class NetCDFRead(IORead):
             # structure
             "has_groups": False,
             "group_dimension_search": group_dimension_search,
-            # Keep a list of flattened dataset names
-            "flat_datasets": [],
             # --------------------------------------------------------
             # Domains (CF>=1.9)
             # --------------------------------------------------------
@@ -1707,8 +1681,10 @@ class NetCDFRead(IORead):
         flattener_attributes = {}
 
         if has_groups:
-            flattener_name_mapping_variables = getattr(
-                nc, flattener_variable_map, None
+            global_attributes = self._file_global_attributes(nc)
+
+            flattener_name_mapping_variables = global_attributes.get(
+                flattener_variable_map
             )
             if flattener_name_mapping_variables is not None:
                 if isinstance(flattener_name_mapping_variables, str):
@@ -1720,8 +1696,8 @@ class NetCDFRead(IORead):
                     for x in flattener_name_mapping_variables
                 )
 
-            flattener_name_mapping_dimensions = getattr(
-                nc, flattener_dimension_map, None
+            flattener_name_mapping_dimensions = global_attributes.get(
+                flattener_dimension_map
             )
             if flattener_name_mapping_dimensions is not None:
                 if isinstance(flattener_name_mapping_dimensions, str):
@@ -1739,8 +1715,8 @@ class NetCDFRead(IORead):
                     if value.startswith("/") and value.count("/") == 1:
                         flattener_dimensions[key] = value[1:]
 
-            flattener_name_mapping_attributes = getattr(
-                nc, flattener_attribute_map, None
+            flattener_name_mapping_attributes = global_attributes.get(
+                flattener_attribute_map
             )
             if flattener_name_mapping_attributes is not None:
                 if isinstance(flattener_name_mapping_attributes, str):
@@ -1925,22 +1901,9 @@ class NetCDFRead(IORead):
         g["internal_variables"] = set(variables)
 
         # The netCDF dimensions of the parent file
-        internal_dimension_sizes = {}
-        for name, dimension in file_dimensions.items():
-            if (
-                has_groups
-                and dimension_isunlimited[flattener_dimensions[name]]
-            ):
-                # For grouped datasets, get the unlimited dimension
-                # size from the original grouped dataset, because
-                # unlimited dimensions have size 0 in the flattened
-                # dataset (because it contains no data) (v1.8.8.1)
-                group, ncdim = self._netCDF4_group(
-                    g["nc_grouped"], flattener_dimensions[name]
-                )
-                internal_dimension_sizes[name] = group.dimensions[ncdim].size
-            else:
-                internal_dimension_sizes[name] = dimension.size
+        internal_dimension_sizes = {
+            name: dimension.size for name, dimension in file_dimensions.items()
+        }
 
         if g["has_groups"]:
             internal_dimension_sizes = {
@@ -3533,7 +3496,7 @@ class NetCDFRead(IORead):
         g = self.read_vars
 
         index_array = self.implementation.get_array(index)
-        (_, count) = np.unique(index_array, return_counts=True)
+        _, count = np.unique(index_array, return_counts=True)
 
         # The number of elements per instance. For the instances array
         # example above, the elements_per_instance array is [7, 5, 7].
@@ -1,6 +1,7 @@
 import copy
 import logging
 import os
+from itertools import islice
 from math import prod
 from numbers import Integral
 
@@ -8,7 +9,12 @@ import numpy as np
 
 from cfdm.data.dask_utils import cfdm_to_memory
 from cfdm.decorators import _manage_log_level_via_verbosity
-from cfdm.functions import abspath, dirname, integer_dtype
+from cfdm.functions import (
+    _construct_signature,
+    abspath,
+    dirname,
+    integer_dtype,
+)
 
 from .. import IOWrite
 from .constants import (
@@ -949,12 +955,17 @@ class NetCDFWrite(IOWrite):
                 count_variable, "element"
             )
             sample_ncdim = self._name(sample_ncdim)
-            self._write_dimension(
-                sample_ncdim,
-                f,
-                None,
-                size=int(self.implementation.get_data_sum(count_variable)),
-            )
+
+            # Get the sample dimension size from the data's offset
+            # index, if it has one, to save reading the count
+            # variable
+            offset_index = self.implementation.get_offset_index(f)
+            if offset_index is None:
+                size = int(self.implementation.get_data_sum(count_variable))
+            else:
+                size = offset_index["size"]
+
+            self._write_dimension(sample_ncdim, f, None, size=size)
 
             extra = {"sample_dimension": sample_ncdim}
 
@@ -1301,7 +1312,24 @@ class NetCDFWrite(IOWrite):
 
         seen = g["seen"]
 
-        for value in seen.values():
+        # Bring the signature index up to date with any variables
+        # that have been added to the 'seen' dictionary since the
+        # last call. Only variables with the same signature as the
+        # input variable can be equal to it, so the (potentially
+        # expensive) full equality test can be restricted to those.
+        seen_index = g["seen_index"]
+        n_indexed = g["n_seen_indexed"]
+        if n_indexed < len(seen):
+            for key, value in islice(seen.items(), n_indexed, None):
+                seen_index.setdefault(
+                    _construct_signature(value["variable"]), []
+                ).append(key)
+
+            g["n_seen_indexed"] = len(seen)
+
+        candidates = seen_index.get(_construct_signature(variable), ())
+        for key in candidates:
+            value = seen[key]
             if ncdims is not None and ncdims != value["ncdims"]:
                 # The dataset dimensions (names and order) of the
                 # input variable are different to those of this
@@ -3653,7 +3681,9 @@ class NetCDFWrite(IOWrite):
         if lock is None:
             # We need to define the dataset lock for data writing from
             # Dask
-            from cfdm.data.locks import netcdf_lock as lock
+            from cfdm.data.locks import get_lock
+
+            lock = get_lock(g["backend"], g["dataset_name"])
 
         # Set the current size of unlimited dimensions
         self.set_unlimited_dimension_sizes(g["nc"][ncvar], data.shape)
@@ -5202,6 +5232,14 @@ class NetCDFWrite(IOWrite):
 
         g = self.write_vars
 
+        # Close any pooled open datasets for the file that is about
+        # to be written to, and forget any tie points read from it
+        from ...data.datasetpool import dataset_pool
+        from ...data.tiepointcache import tie_point_cache
+
+        dataset_pool.clear(abspath(dataset_name))
+        tie_point_cache.clear(abspath(dataset_name))
+
         # mode == 'w' is safer than != 'a' in case of a typo (the
         # letters are neighbours on a QWERTY keyboard) since 'w' is
         # destructive. Note that for append ('a') mode the original
@@ -5655,6 +5693,11 @@ class NetCDFWrite(IOWrite):
             # dimensions keyed by items of the field (such as a
             # coordinate or a coordinate reference)
             "seen": {},
+            # Index of the 'seen' dictionary keys, keyed by variable
+            # signature, and the number of 'seen' entries that
+            # have been indexed so far
+            "seen_index": {},
+            "n_seen_indexed": 0,
             # Dry run: populate 'seen' dict without actually writing
             # to dataset.
             "dry_run": False,
@@ -1,14 +1,17 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from copy import copy
 from functools import partial
 from glob import iglob
 from logging import getLogger
-from os import walk
+from multiprocessing import get_context
+from os import environ, makedirs, remove, replace, scandir, stat, walk
 from os.path import expanduser, expandvars, isdir, join
 
 from cfdm.decorators import _manage_log_level_via_verbosity
-from cfdm.functions import abspath, is_log_level_info
+from cfdm.functions import abspath, chunksize, is_log_level_info
 
 from .abstract import ReadWrite
-from .exceptions import DatasetTypeError
+from .exceptions import DatasetTypeError, ReadError
 from .netcdf import NetCDFRead
 
 logger = getLogger(__name__)
@@ -198,6 +201,14 @@ class read(ReadWrite):
 
             .. versionadded:: (cfdm) 1.13.0.0
 
+        {{read parallel: `bool` or `str`, optional}}
+
+            .. versionadded:: (cfdm) NEXTVERSION
+
+        {{read metadata_cache: `bool` or `str`, optional}}
+
+            .. versionadded:: (cfdm) NEXTVERSION
+
         ignore_unknown_type: Deprecated at version 1.12.2.0
             Use *dataset_type* instead.
 
@@ -258,6 +269,8 @@ class read(ReadWrite):
         cdl_string=False,
         extra_read_vars=None,
         group_dimension_search="closest_ancestor",
+        parallel=False,
+        metadata_cache=False,
         **kwargs,
     ):
         """Read field or domain constructs from datasets.
@@ -288,16 +301,20 @@ class read(ReadWrite):
                 f"{self.allowed_dataset_types}"
             )
 
-        # Loop round the input datasets
-        for dataset in self._datasets():
-            # Read the dataset
-            self._pre_read(dataset)
-            self._read(dataset)
-            self._post_read(dataset)
-
-            # Add the dataset contents to the output list
-            self.n_datasets += 1
-            self.constructs.extend(self.dataset_contents)
+        if self.parallel:
+            # Read the input datasets concurrently
+            self._read_parallel()
+        else:
+            # Loop round the input datasets
+            for dataset in self._datasets():
+                # Read the dataset
+                self._pre_read(dataset)
+                self._read(dataset)
+                self._post_read(dataset)
+
+                # Add the dataset contents to the output list
+                self.n_datasets += 1
+                self.constructs.extend(self.dataset_contents)
 
         # Actions to be taken after all datasets have been read
         self._finalise()
@@ -313,6 +330,17 @@ class read(ReadWrite):
         # Return the field or domain constructs
         return self.constructs
 
+    def __reduce__(self):
+        """Support for copying and pickling.
+
+        An instance is created by `object.__new__`, rather than by
+        `__new__`, which would read datasets.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        """
+        return (object.__new__, (self.__class__,), self.__dict__)
+
     def _datasets(self):
         """Find all of the datasets.
 
@@ -458,6 +486,66 @@ class read(ReadWrite):
 
         self.dataset_type = dataset_type
 
+        # Parse the 'parallel' keyword parameter
+        parallel = kwargs.get("parallel", False)
+        if parallel is True:
+            parallel = "threads"
+        elif parallel is None:
+            parallel = False
+
+        if parallel not in (False, "threads", "processes"):
+            raise ValueError(
+                "'parallel' keyword must be one of False, True, "
+                f"'threads', or 'processes'. Got: {parallel!r}"
+            )
+
+        if parallel == "processes" and kwargs.get("cdl_string"):
+            raise ValueError(
+                "Can't set parallel='processes' when cdl_string=True"
+            )
+
+        if parallel == "threads":
+            # The netCDF-C library is not thread-safe, so datasets
+            # that are read concurrently by threads must not be
+            # opened with the netCDF4 backend
+            netcdf_backend = kwargs.get("netcdf_backend")
+            if netcdf_backend is None:
+                kwargs["netcdf_backend"] = (
+                    "h5netcdf-pyfive",  # netCDF-4
+                    "h5netcdf-h5py",  # netCDF-4
+                    "netcdf_file",  # netCDF-3
+                )
+            elif "netCDF4" in (
+                (netcdf_backend,)
+                if isinstance(netcdf_backend, str)
+                else netcdf_backend
+            ):
+                raise ValueError(
+                    "Can't set parallel='threads' when the 'netCDF4' "
+                    "backend is in netcdf_backend, because netCDF-C is "
+                    "not thread-safe. Use parallel='processes' instead."
+                )
+
+        self.parallel = parallel
+
+        # Parse the 'metadata_cache' keyword parameter
+        metadata_cache = kwargs.get("metadata_cache", False)
+        if metadata_cache is True:
+            metadata_cache = join(
+                environ.get("XDG_CACHE_HOME", join("~", ".cache")),
+                "cfdm",
+                "read",
+            )
+
+        if metadata_cache:
+            metadata_cache = abspath(
+                expanduser(expandvars(metadata_cache)), uri=False
+            )
+        else:
+            metadata_cache = None
+
+        self.metadata_cache = metadata_cache
+
         # Recognised netCDF dataset formats
         self.netCDF_dataset_types = set(("netCDF", "CDL", "Zarr"))
 
@@ -478,6 +566,199 @@ class read(ReadWrite):
         # Initialise the set of different dataset categories.
         self.unique_dataset_categories = set()
 
+    def _metadata_cache_file(self, dataset):
+        """Return the metadata cache file name for a dataset.
+
+        The file name has two parts. The first is a hash of the
+        dataset's absolute path and the keyword parameters that
+        affect how the dataset is interpreted, which identifies the
+        cache entry. The second is a hash of the dataset's file system
+        signature (size and modification time, as well as those of
+        any external datasets) and the `cfdm` version, which
+        identifies the version of the entry. The file name therefore
+        changes whenever the dataset is modified or is read in a
+        different way, and `_metadata_cache_save` removes older
+        versions of the same entry.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        .. seealso:: `_metadata_cache_load`, `_metadata_cache_save`
+
+        :Parameters:
+
+            dataset: `str`
+                The pathname of the dataset.
+
+        :Returns:
+
+            `str` or `None`
+                The name of the cache file, or `None` if the dataset
+                can not be cached, which is the case when the metadata
+                cache is not being used, when *dataset* is a CDL
+                string, or when *dataset* is not on local disk.
+
+        """
+        if self.metadata_cache is None:
+            return
+
+        kwargs = self.kwargs
+        if kwargs["cdl_string"]:
+            return
+
+        signature = []
+        for x in (dataset,) + tuple(self._flat(kwargs["external"] or ())):
+            x = abspath(x, uri=False)
+            try:
+                s = stat(x)
+            except (OSError, ValueError):
+                # Not a local dataset
+                return
+
+            signature.append((x, s.st_size, s.st_mtime_ns))
+            if isdir(x):
+                # Include the contents of a Zarr dataset's top-level
+                # directory, which changes when its metadata changes
+                signature.extend(
+                    (e.name, e.stat().st_size, e.stat().st_mtime_ns)
+                    for e in sorted(scandir(x), key=lambda e: e.name)
+                )
+
+        from dask.base import tokenize
+
+        from .. import __version__
+
+        read_kwargs = {
+            key: value
+            for key, value in kwargs.items()
+            if key
+            not in (
+                "cls",
+                "datasets",
+                "verbose",
+                "parallel",
+                "metadata_cache",
+                "recursive",
+                "followlinks",
+            )
+        }
+
+        entry = tokenize(
+            self.__class__.__module__,
+            self.__class__.__name__,
+            signature[0][0],
+            read_kwargs,
+        )
+        version = tokenize(__version__, chunksize().value, signature)
+        return join(self.metadata_cache, f"{entry}-{version}.pickle")
+
+    def _metadata_cache_load(self, cache_file):
+        """Return the contents of a dataset from the metadata cache.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        .. seealso:: `_metadata_cache_file`, `_metadata_cache_save`
+
+        :Parameters:
+
+            cache_file: `str` or `None`
+                The name of the dataset's cache file, as returned by
+                `_metadata_cache_file`.
+
+        :Returns:
+
+            `list` or `None`
+                The constructs read from the dataset, or `None` if
+                there is no valid cache entry for the dataset.
+
+        """
+        if cache_file is None:
+            return
+
+        import pickle
+
+        try:
+            with open(cache_file, "rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return
+        except Exception as error:
+            # An unreadable cache entry is ignored, and will get
+            # replaced after the dataset has been read
+            logger.info(
+                f"Ignoring unreadable metadata cache file {cache_file}: "
+                f"{error}"
+            )  # pragma: no cover
+            return
+
+    def _metadata_cache_save(self, cache_file, dataset_contents):
+        """Store the contents of a dataset in the metadata cache.
+
+        The cache file is written atomically, so that concurrent
+        reads from other threads or processes never see a partially
+        written file. Older versions of the same cache entry, which
+        were created before the dataset was last modified, are
+        removed.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        .. seealso:: `_metadata_cache_file`, `_metadata_cache_load`
+
+        :Parameters:
+
+            cache_file: `str` or `None`
+                The name of the dataset's cache file, as returned by
+                `_metadata_cache_file`.
+
+            dataset_contents: `list`
+                The constructs read from the dataset.
+
+        :Returns:
+
+            `None`
+
+        """
+        if cache_file is None:
+            return
+
+        import pickle
+        from glob import escape as glob_escape
+        from glob import glob
+        from tempfile import NamedTemporaryFile
+
+        tmpfile = None
+        try:
+            makedirs(self.metadata_cache, exist_ok=True)
+            with NamedTemporaryFile(
+                "wb", dir=self.metadata_cache, suffix=".tmp", delete=False
+            ) as f:
+                tmpfile = f.name
+                pickle.dump(
+                    dataset_contents, f, protocol=pickle.HIGHEST_PROTOCOL
+                )
+
+            replace(tmpfile, cache_file)
+
+            # Remove stale versions of this cache entry
+            entry = cache_file[: cache_file.rindex("-")]
+            for stale in glob(f"{glob_escape(entry)}-*.pickle"):
+                if stale != cache_file:
+                    try:
+                        remove(stale)
+                    except OSError:
+                        pass
+        except Exception as error:
+            # Failing to cache a dataset is not fatal
+            if tmpfile is not None:
+                try:
+                    remove(tmpfile)
+                except OSError:
+                    pass
+
+            logger.info(
+                f"Could not write metadata cache file {cache_file}: "
+                f"{error}"
+            )  # pragma: no cover
+
     def _post_read(self, dataset):
         """Actions to take immediately after reading a dataset.
 
@@ -534,6 +815,109 @@ class read(ReadWrite):
         # because `dataset_contents` will no longer be None.
         self.dataset_format_errors = []
 
+    def _read_dataset(self, dataset):
+        """Read a single dataset on behalf of `_read_parallel`.
+
+        The dataset is read with `_pre_read`, `_read` and
+        `_post_read`, in the same way as when datasets are read one
+        after another.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            dataset: `str`
+                The pathname of the dataset to be read.
+
+        :Returns:
+
+            2-`tuple`
+                The list of constructs read from the dataset, and the
+                set of dataset categories that were successfully
+                read.
+
+        """
+        self._pre_read(dataset)
+        self._read(dataset)
+        self._post_read(dataset)
+        return self.dataset_contents, self.unique_dataset_categories
+
+    def _read_parallel(self):
+        """Read all of the datasets concurrently.
+
+        Each dataset is read by a separate worker in a pool of threads
+        or processes, as defined by the `parallel` attribute. Each
+        worker is a shallow copy of this instance, so the subclass
+        methods `_pre_read`, `_read` and `_post_read` are applied to
+        each dataset in exactly the same way as when datasets are
+        read one after another.
+
+        The contents of the datasets are added to the output list in
+        the order in which the datasets were found, so that the
+        output is identical to that from a serial read.
+
+        Called by `__new__`.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Returns:
+
+            `None`
+
+        """
+        datasets = tuple(self._datasets())
+        if not datasets:
+            return
+
+        if self.parallel == "processes":
+            # Start new worker processes, rather than forking this
+            # one, since forking a process in which other threads hold
+            # HDF5 or netCDF-C library locks can deadlock
+            executor = partial(
+                ProcessPoolExecutor, mp_context=get_context("spawn")
+            )
+        else:
+            executor = ThreadPoolExecutor
+
+        # Each worker gets its own copy of the per-dataset state, and
+        # creates its own netCDF read function when it needs one
+        worker = copy(self)
+        worker.__dict__.pop("netcdf_read", None)
+        worker.kwargs = dict(self.kwargs, datasets=None)
+        worker.constructs = []
+
+        results = []
+        errors = []
+        with executor() as pool:
+            futures = []
+            for dataset in datasets:
+                w = copy(worker)
+                w.unique_dataset_categories = set()
+                futures.append(pool.submit(w._read_dataset, dataset))
+
+            for dataset, future in zip(datasets, futures):
+                try:
+                    results.append(future.result())
+                except Exception as error:
+                    errors.append((dataset, error))
+
+        if errors:
+            n = len(errors)
+            message = "\n".join(
+                f"{dataset}: {error.__class__.__name__}: {error}"
+                for dataset, error in errors
+            )
+            raise ReadError(
+                f"Failed to read {n} of {len(datasets)} "
+                f"dataset{'s' if len(datasets) != 1 else ''}:\n{message}"
+            ) from errors[0][1]
+
+        for dataset_contents, categories in results:
+            # Add the dataset contents to the output list
+            self.n_datasets += 1
+            self.constructs.extend(dataset_contents)
+            self.unique_dataset_categories.update(categories)
+
     def _read(self, dataset):
         """Read a given dataset into field or domain constructs.
 
@@ -597,8 +981,15 @@ class read(ReadWrite):
                 )
 
             try:
-                # Try to read the dataset
-                self.dataset_contents = self.netcdf_read(dataset)
+                # Try to read the dataset, or else get its contents
+                # from the metadata cache
+                cache_file = self._metadata_cache_file(dataset)
+                dataset_contents = self._metadata_cache_load(cache_file)
+                if dataset_contents is None:
+                    dataset_contents = self.netcdf_read(dataset)
+                    self._metadata_cache_save(cache_file, dataset_contents)
+
+                self.dataset_contents = dataset_contents
             except DatasetTypeError as error:
                 if dataset_type is None:
                     self.dataset_format_errors.append(error)
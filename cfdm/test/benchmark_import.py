@@ -0,0 +1,90 @@
+"""Benchmark the time taken by 'import cfdm'.
+
+Each measurement imports cfdm in a new Python process, and the fastest
+of several runs is reported, to reduce the effect of other processes.
+cfdm is imported from the same location as it is by this script.
+
+If a maximum time is given with ``--max-seconds`` then the script
+exits with a non-zero status when the import takes longer, so that it
+can be used to check for import time regressions.
+
+Usage::
+
+   python benchmark_import.py [runs] [--max-seconds SECONDS]
+
+"""
+
+import os
+import subprocess
+import sys
+from argparse import ArgumentParser
+
+import cfdm
+
+
+def import_time(runs=5):
+    """Return the fastest time, in seconds, taken by 'import cfdm'.
+
+    :Parameters:
+
+        runs: `int`, optional
+            The number of times to import cfdm.
+
+    :Returns:
+
+        `float`
+            The fastest import time.
+
+    """
+    env = os.environ.copy()
+    env["PYTHONPATH"] = os.pathsep.join(
+        (
+            os.path.dirname(os.path.dirname(os.path.abspath(cfdm.__file__))),
+            env.get("PYTHONPATH", ""),
+        )
+    )
+    code = (
+        "import time; t = time.perf_counter(); import cfdm; "
+        "print(time.perf_counter() - t)"
+    )
+    return min(
+        float(
+            subprocess.run(
+                [sys.executable, "-c", code],
+                env=env,
+                capture_output=True,
+                check=True,
+                text=True,
+            ).stdout
+        )
+        for i in range(runs)
+    )
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument(
+        "runs",
+        nargs="?",
+        type=int,
+        default=5,
+        help="the number of times to import cfdm",
+    )
+    parser.add_argument(
+        "--max-seconds",
+        dest="max_seconds",
+        type=float,
+        help="exit with a non-zero status if the import takes longer",
+    )
+    args = parser.parse_args()
+
+    runs = args.runs
+    seconds = import_time(runs)
+    print(f"'import cfdm' took {seconds:.3f} s (fastest of {runs})")
+
+    max_seconds = args.max_seconds
+    if max_seconds is not None and seconds > max_seconds:
+        sys.exit(
+            f"'import cfdm' took longer than the maximum of "
+            f"{max_seconds:.3f} s"
+        )
@@ -4,6 +4,8 @@ import faulthandler
 import re
 import unittest
 
+import numpy as np
+
 faulthandler.enable()  # to debug seg faults and timeouts
 
 import cfdm
@@ -122,6 +124,46 @@ class ConstructsTest(unittest.TestCase):
         with self.assertRaises(TypeError):
             c.filter(bad_kwarg=None)
 
+    def test_Constructs_filter_memoised(self):
+        """Test the memoisation of Constructs filter results."""
+        f = self.f.copy()
+        c = f.constructs
+
+        kwargs = {
+            "filter_by_type": ("domain_axis",),
+            "filter_by_size": (1,),
+            "todict": True,
+        }
+        d = c.filter(**kwargs)
+        self.assertEqual(len(d), 2)
+
+        # Modifying a result does not change subsequent results
+        d.clear()
+        self.assertEqual(len(c.filter(**kwargs)), 2)
+        self.assertEqual(len(c.filter_by_size(1, todict=True)), 2)
+
+        # Results are updated after changes to the constructs
+        key = f.domain_axis("grid_latitude", key=True)
+        c[key].set_size(1)
+        self.assertEqual(len(c.filter(**kwargs)), 3)
+        self.assertEqual(len(c.filter_by_size(1, todict=True)), 3)
+        self.assertEqual(len(c.filter_by_size(10, todict=True)), 0)
+
+        n = len(c.filter_by_type("auxiliary_coordinate", todict=True))
+        f.del_construct("latitude")
+        self.assertEqual(
+            len(c.filter_by_type("auxiliary_coordinate", todict=True)), n - 1
+        )
+
+        x = f.coordinate("longitude")
+        self.assertEqual(len(c.filter_by_ncvar("lon", todict=True)), 0)
+        x.nc_set_variable("lon")
+        self.assertEqual(len(c.filter_by_ncvar("lon", todict=True)), 1)
+
+        self.assertEqual(
+            len(c.filter_by_size(*np.array([1, 9]), todict=True)), 4
+        )
+
     def test_Constructs_FILTERING(self):
         """Test Constructs methods that invert or reverse filters."""
         c = self.c
@@ -335,6 +377,54 @@ class ConstructsTest(unittest.TestCase):
         with self.assertRaises(TypeError):
             c("latitude", filter_by_identity=("longitude",))
 
+        # Check that cached identities are updated after changes to
+        # the constructs
+        f = self.f.copy()
+        c = f.constructs
+        self.assertEqual(len(c.filter_by_identity("ncvar%lat")), 0)
+        lat = f.coordinate("latitude")
+        lat.nc_set_variable("lat")
+        self.assertEqual(len(c.filter_by_identity("ncvar%lat")), 1)
+        lat.set_property("standard_name", "foo")
+        self.assertEqual(len(c.filter_by_identity("latitude")), 0)
+        self.assertEqual(len(c.filter_by_identity("foo")), 1)
+        lat.del_property("standard_name")
+        self.assertEqual(len(c.filter_by_identity("foo")), 0)
+        self.assertEqual(len(c.filter_by_identity("ncvar%lat")), 1)
+
+        lon = f.coordinate("longitude")
+        key = f.construct_key("longitude")
+        axes = f.get_data_axes(key)
+        f.del_construct(key)
+        self.assertEqual(len(c.filter_by_identity("longitude")), 0)
+        f.set_construct(lon, axes=axes, key=key)
+        self.assertEqual(len(c.filter_by_identity("longitude")), 1)
+
+        d = f.domain
+        self.assertEqual(len(d.constructs.filter_by_identity("longitude")), 1)
+        d.del_construct(key)
+        self.assertEqual(len(c.filter_by_identity("longitude")), 0)
+
+        # Changes to bounds, which can provide identities, are
+        # tracked
+        f = self.f.copy()
+        c = f.constructs
+        x = f.dimension_coordinate("grid_latitude")
+        x.del_property("standard_name")
+        x.nc_del_variable()
+        identity = "standard_name=bounds_name"
+        self.assertEqual(len(c.filter_by_identity(identity)), 0)
+        x.bounds.set_property("standard_name", "bounds_name")
+        self.assertEqual(len(c.filter_by_identity(identity)), 1)
+
+        # Changes to other constructs do not invalidate the index
+        index = c._identity_index(False)
+        g = self.f.copy()
+        g.coordinate("latitude").set_property("foo", "bar")
+        self.assertIs(c._identity_index(False), index)
+        f.coordinate("latitude").set_property("foo", "bar")
+        self.assertIsNot(c._identity_index(False), index)
+
     def test_Constructs_filter_by_axis(self):
         """Test the `filter_by_axis` Constructs method."""
         c = self.c
@@ -357,6 +447,68 @@ class ConstructsTest(unittest.TestCase):
         with self.assertRaises(ValueError):
             c.filter_by_axis(0, 1, axis_mode="bad_mode")
 
+    def test_Constructs_axis_index(self):
+        """Test the reverse index of domain axes to constructs."""
+        c = self.c.copy()
+
+        def scanned():
+            out = {}
+            for key, axes in c.data_axes().items():
+                for axis in axes:
+                    out.setdefault(axis, set()).add(key)
+
+            return out
+
+        def indexed():
+            return {
+                axis: set(keys) for axis, keys in c._axis_constructs.items()
+            }
+
+        self.assertEqual(indexed(), scanned())
+
+        axis = c._set_construct(cfdm.DomainAxis(10))
+        c._set_construct_data_axes("auxiliarycoordinate2", [axis])
+        self.assertEqual(indexed(), scanned())
+        self.assertEqual(
+            set(c.filter_by_axis(axis, axis_mode="exact")),
+            {"auxiliarycoordinate2"},
+        )
+        self.assertNotIn(
+            "auxiliarycoordinate2", c.filter_by_axis("domainaxis1")
+        )
+
+        c._del_construct("auxiliarycoordinate2")
+        c._del_construct(axis)
+        self.assertEqual(indexed(), scanned())
+
+        # A domain axis spanned by a construct can not be deleted
+        with self.assertRaises(ValueError):
+            c._del_construct("domainaxis2")
+
+        c._del_construct("dimensioncoordinate3")
+        c._del_construct("cellmethod1")
+        c._del_construct("domainaxis3")
+        self.assertEqual(indexed(), scanned())
+
+        key = c._set_construct(cfdm.AuxiliaryCoordinate(), axes=())
+        self.assertEqual(key, "auxiliarycoordinate2")
+        key = c._set_construct(cfdm.AuxiliaryCoordinate(), axes=())
+        self.assertEqual(key, "auxiliarycoordinate3")
+        self.assertEqual(indexed(), scanned())
+
+        # New keys carry on from the last new key
+        c._del_construct("auxiliarycoordinate0")
+        c._del_construct("auxiliarycoordinate2")
+        self.assertEqual(
+            c.new_identifier("auxiliary_coordinate"), "auxiliarycoordinate4"
+        )
+
+        d = c.copy()
+        self.assertEqual(
+            d.new_identifier("auxiliary_coordinate"), "auxiliarycoordinate4"
+        )
+        self.assertEqual(d._axis_constructs, c._axis_constructs)
+
     def test_Constructs_clear_filters_applied(self):
         """Test the `clear_filters_applied` Constructs method."""
         c = self.c
@@ -8,6 +8,7 @@ import unittest
 import warnings
 
 import cftime
+import dask
 import dask.array as da
 import numpy as np
 
@@ -744,7 +745,11 @@ class DataTest(unittest.TestCase):
         d3 = cfdm.Data(a.astype(np.float64), "m", chunks=chunksize)
         h = cfdm.Data(np.full(shape, np.nan), "m", chunks=chunksize)
         # TODODASK: implement and test equal_nan kwarg to configure NaN eq.
-        self.assertFalse(h.equals(h.copy()))
+        # NaNs are unequal, unless the deterministic names are equal
+        self.assertTrue(h.equals(h.copy()))
+        self.assertFalse(
+            h.equals(cfdm.Data(np.full(shape, np.nan), "m", chunks=shape))
+        )
         with self.assertLogs(level=-1) as catch:
             # Compare to d3 not d since np.nan has dtype float64 (IEEE 754)
             self.assertFalse(h.equals(d3, verbose=2))
@@ -1000,6 +1005,19 @@ class DataTest(unittest.TestCase):
                 e = cfdm.Data(np.arange(6).reshape(2, 3), "m", chunks=(j, i))
                 self.assertTrue(d.equals(e))
 
+        # Test equal deterministic names, for which the values are not
+        # compared (and so NaNs are considered equal)
+        d = cfdm.Data([np.nan, 1.0], "m")
+        e = d.copy()
+        self.assertTrue(d.equals(e))
+        e[1] = 1.0
+        self.assertNotEqual(
+            e.get_deterministic_name(), d.get_deterministic_name()
+        )
+        self.assertFalse(d.equals(e))
+        e = cfdm.Data([np.nan, 1.0], "km")
+        self.assertFalse(d.equals(e))
+
     def test_Data_max_min_sum_squeeze(self):
         """Test the max, min, sum and squeeze Data methods."""
         a = np.ma.arange(2 * 3 * 5).reshape(2, 1, 3, 5)
@@ -1432,6 +1450,108 @@ class DataTest(unittest.TestCase):
         self.assertIsInstance(dx, da.Array)
         self.assertTrue((d.array == dx.compute()).all())
 
+    def test_Data_to_dask_array_coalesce_reads(self):
+        """Test Data.to_dask_array with coalesce_reads."""
+        f = cfdm.read(self.filename, netcdf_backend="netCDF4")[0]
+        d = cfdm.Data(f.data.source(), chunks=2)
+        a = d.array
+
+        dx = d.to_dask_array(coalesce_reads=True)
+        self.assertEqual(dx.name, d.to_dask_array().name)
+        self.assertEqual(dx.chunks, d.chunks)
+        batches = [k for k in dict(dx.dask) if k[0].startswith("coalesce-")]
+        self.assertEqual(len(batches), 1)
+        self.assertTrue((dx.compute() == a).all())
+
+        # Merged reads no larger than a given size
+        for limit in (2, 4, 8, 16, 40, 90):
+            limit *= a.itemsize
+            dx = d.to_dask_array(_force_mask_hardness=False)
+            dx = cfdm.data.utils.coalesce_reads(dx, limit=limit)
+            dsk = dict(dx.dask)
+            batches = [k for k in dsk if k[0].startswith("coalesce-")]
+            for key in batches:
+                self.assertLessEqual(dask.get(dsk, key).nbytes, limit)
+
+            self.assertTrue((dx.compute() == a).all())
+
+        # A single chunk is 4 elements, so no merged reads for a
+        # limit of 4 elements
+        dx = d.to_dask_array(_force_mask_hardness=False)
+        dx = cfdm.data.utils.coalesce_reads(dx, limit=4 * a.itemsize)
+        batches = [k for k in dict(dx.dask) if k[0].startswith("coalesce-")]
+        self.assertEqual(len(batches), 0)
+
+        dx = d.to_dask_array(_force_mask_hardness=False)
+        dx = cfdm.data.utils.coalesce_reads(dx, limit=8 * a.itemsize)
+        batches = [k for k in dict(dx.dask) if k[0].startswith("coalesce-")]
+        self.assertEqual(len(batches), 10)
+        self.assertTrue((dx.compute() == a).all())
+
+        # Chunks are copies, rather than views, of the merged reads
+        dsk = dict(dx.dask)
+        keys = [
+            key
+            for key, task in dsk.items()
+            if getattr(task, "func", None)
+            is cfdm.data.dask_utils.cfdm_subspace_copy
+        ]
+        self.assertEqual(len(keys), 20)
+        for key in keys:
+            self.assertIsNone(dask.get(dsk, key).base)
+
+        # Only needed chunks are read
+        e = d[0, 1:3, 0]
+        dx = e.to_dask_array(coalesce_reads=True)
+        self.assertEqual(dx.npartitions, 2)
+        self.assertTrue((dx.compute() == e.array).all())
+
+        # In-memory data is unchanged
+        d = cfdm.Data([1, 2, 3, 4], chunks=2)
+        dx = d.to_dask_array(coalesce_reads=True)
+        self.assertEqual(
+            dict(dx.dask).keys(), dict(d.to_dask_array().dask).keys()
+        )
+
+    def test_Data_ragged_features(self):
+        """Test Data.ragged_features."""
+        r = cfdm.RaggedIndexedArray(
+            cfdm.Data(np.arange(11.0)),
+            shape=(3, 5),
+            index_variable=cfdm.Index(data=[2, 1, 2, 1, 1, 0, 2, 1, 0, 2, 1]),
+        )
+        d = cfdm.Data(r)
+        self.assertEqual(
+            [x.tolist() for x in d.ragged_features()],
+            [[5, 8], [1, 3, 4, 7, 10], [0, 2, 6, 9]],
+        )
+        self.assertEqual(
+            [[x.tolist() for x in b] for b in d.ragged_features(batch_size=2)],
+            [[[5, 8], [1, 3, 4, 7, 10]], [[0, 2, 6, 9]]],
+        )
+        self.assertEqual(
+            [x.tolist() for x in d.ragged_features(features=[2])],
+            [[0, 2, 6, 9]],
+        )
+
+        # Features with no elements
+        r = cfdm.RaggedContiguousArray(
+            np.arange(4.0),
+            shape=(3, 4),
+            count_variable=cfdm.Count(data=[0, 4, 0]),
+        )
+        d = cfdm.Data(r)
+        self.assertEqual(
+            [x.tolist() for x in d.ragged_features()], [[], [0, 1, 2, 3], []]
+        )
+        self.assertEqual(
+            [x.tolist() for x in d.ragged_features(features=[0, 2])],
+            [[], []],
+        )
+
+        with self.assertRaises(ValueError):
+            cfdm.Data([1, 2]).ragged_features()
+
     def test_Data_persist(self):
         """Test Data.persist."""
         d = cfdm.Data(9, "km")
@@ -2927,6 +3047,35 @@ class DataTest(unittest.TestCase):
             if a is not np.ma.masked:
                 self.assertEqual(a.dtype, d.dtype)
 
+    def test_Data__get_sorted_values(self):
+        """Test Data._get_sorted_values."""
+        d = cfdm.Data([1, 2, 3, 5])
+        values, positions = d._get_sorted_values()
+        self.assertEqual(values.tolist(), [1, 2, 3, 5])
+        self.assertIsNone(positions)
+        self.assertFalse(values.flags.writeable)
+
+        # Cached
+        self.assertIs(d._get_sorted_values()[0], values)
+        self.assertIs(d.copy()._get_sorted_values()[0], values)
+
+        # Cache is removed when the values change
+        d[0] = 9
+        values, positions = d._get_sorted_values()
+        self.assertEqual(values.tolist(), [2, 3, 5, 9])
+        self.assertEqual(positions.tolist(), [1, 2, 3, 0])
+
+        d = cfdm.Data([5, 3, 2, 1])
+        values, positions = d._get_sorted_values()
+        self.assertEqual(values.tolist(), [1, 2, 3, 5])
+        self.assertEqual(positions.tolist(), [3, 2, 1, 0])
+
+        # Missing values are excluded
+        d = cfdm.Data(np.ma.array([4, 1, 2, 3], mask=[0, 0, 1, 0]))
+        values, positions = d._get_sorted_values()
+        self.assertEqual(values.tolist(), [1, 3, 4])
+        self.assertEqual(positions.tolist(), [1, 3, 0])
+
     def test_Data_cache_elements(self):
         """Test setting of cached elements."""
         d = cfdm.Data(1)
@@ -84,6 +84,18 @@ class DataUtilsTest(unittest.TestCase):
         b2 = a / 10000
         self.assertTrue(allclose(b1, b2, atol=1e-05, rtol=rtol).compute())
 
+        # Test the 'mask' parameter
+        self.assertTrue(allclose(a2, a, mask=True, **tol).compute())
+        self.assertFalse(allclose(b, a, mask=True, **tol).compute())
+        self.assertFalse(allclose(d, a, mask=True, **tol).compute())
+
+        # Test the 'compute' parameter
+        x = da.arange(100.0, chunks=10)
+        y = x.copy()
+        self.assertIs(allclose(x, y, compute=True, **tol), True)
+        y = da.where(da.arange(100) == 95, -1, x).rechunk(25)
+        self.assertIs(allclose(x, y, compute=True, **tol), False)
+
     def test_Data_utils_is_numeric_dtype(self):
         """Test is_numeric_dtype."""
         is_numeric_dtype = cfdm.data.utils.is_numeric_dtype
@@ -6,6 +6,7 @@ import re
 import tempfile
 import unittest
 
+import dask.array as da
 import numpy as np
 
 faulthandler.enable()  # to debug seg faults and timeouts
@@ -603,6 +604,27 @@ class FieldTest(unittest.TestCase):
                     self.assertTrue(u.equals(c, verbose=3), message)
                     self.assertTrue(f.equals(c, verbose=3), message)
 
+                    if method1 == method:
+                        # Check that the derived count and index
+                        # variables match those in the file (the
+                        # compressed features are always in order)
+                        if method1 == "contiguous":
+                            self.assertTrue(
+                                (
+                                    c.data.get_count().array
+                                    == f.data.get_count().array
+                                ).all(),
+                                message,
+                            )
+                        else:
+                            self.assertTrue(
+                                (
+                                    c.data.get_index().array
+                                    == np.sort(f.data.get_index().array)
+                                ).all(),
+                                message,
+                            )
+
                     c = f.compress(method1)
                     self.assertTrue(
                         bool(c.data.get_compression_type()), message
@@ -845,6 +867,32 @@ class FieldTest(unittest.TestCase):
         with self.assertRaises(ValueError):
             f.indices(**{"longitude": 112.5, key: 22.5})
 
+        # Slices for evenly spaced positions
+        self.assertEqual(f.indices(longitude=112.5)[1], slice(2, 3, 1))
+        self.assertEqual(
+            f.indices(longitude=[157.5, 67.5, 247.5])[1], slice(1, 6, 2)
+        )
+        self.assertEqual(
+            f.indices(longitude=[67.5, 112.5, 337.5])[1].tolist(),
+            [False, True, True, False, False, False, False, True],
+        )
+
+        # Lazy values
+        self.assertEqual(
+            f.indices(latitude=da.from_array([75, -45]))[0], slice(1, 5, 3)
+        )
+        self.assertEqual(
+            f.indices(latitude=cfdm.Data([75, -45]))[0], slice(1, 5, 3)
+        )
+
+        # Decreasing coordinates
+        g = f[::-1]
+        self.assertEqual(g.indices(latitude=[45, 0])[0], slice(1, 3, 1))
+        self.assertEqual(
+            g.indices(latitude=[45, 0, -75])[0].tolist(),
+            [False, True, True, False, True],
+        )
+
     def test_Field_get_original_filenames(self):
         """Test Field.orignal_filenames."""
         f = self.f0
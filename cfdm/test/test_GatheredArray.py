@@ -0,0 +1,108 @@
+import datetime
+import faulthandler
+import unittest
+
+import numpy as np
+
+faulthandler.enable()  # to debug seg faults and timeouts
+
+import cfdm
+
+
+class GatheredArrayTest(unittest.TestCase):
+    """Unit test for the GatheredArray class."""
+
+    def setUp(self):
+        """Preparations called immediately before each test method."""
+        # Disable log messages to silence expected warnings
+        cfdm.log_level("DISABLE")
+        # Note: to enable all messages for given methods, lines or calls (those
+        # without a 'verbose' option to do the same) e.g. to debug them, wrap
+        # them (for methods, start-to-end internally) as follows:
+        # cfdm.log_level('DEBUG')
+        # < ... test code ... >
+        # cfdm.log_level('DISABLE')
+
+        self.compressed_data = np.arange(24.0).reshape(3, 8)
+        self.list_variable = cfdm.List(data=[1, 2, 5, 6, 13, 15, 16, 22])
+        self.g = cfdm.GatheredArray(
+            compressed_array=cfdm.Data(self.compressed_data),
+            shape=(3, 4, 6),
+            compressed_dimensions={1: (1, 2)},
+            list_variable=self.list_variable,
+        )
+
+        u = np.ma.masked_all((3, 24))
+        u[:, self.list_variable.array] = self.compressed_data
+        self.u = u.reshape(3, 4, 6)
+
+    def test_GatheredArray__getitem__(self):
+        """Test `GatheredArray.__getitem__`"""
+        u = self.g[...]
+        self.assertTrue((np.ma.getmaskarray(u) == self.u.mask).all())
+        self.assertTrue((u == self.u).all())
+        self.assertTrue((self.g[1, :2, 2:] == self.u[1, :2, 2:]).all())
+
+    def test_GatheredArray_to_dask_array(self):
+        """Test `GatheredArray.to_dask_array`"""
+        for chunks, chunk_sizes in (
+            (-1, ((3,), (4,), (6,))),
+            (2, ((2, 1), (2, 2), (2, 2, 2))),
+            ((None, (3, 1), (1, 5)), ((3,), (3, 1), (1, 5))),
+            ({2: 4}, ((3,), (4,), (4, 2))),
+        ):
+            dx = self.g.to_dask_array(chunks=chunks)
+            self.assertEqual(dx.chunks, chunk_sizes)
+            u = dx.compute()
+            self.assertTrue((np.ma.getmaskarray(u) == self.u.mask).all())
+            self.assertTrue((u == self.u).all())
+
+        # Each chunk only reads the part of the compressed data that
+        # spans its elements
+        dx = self.g.to_dask_array(chunks=(None, (1, 3), (3, 3)))
+        c_indices = [
+            v.indices
+            for v in dict(dx.dask).values()
+            if isinstance(v, cfdm.GatheredSubarray)
+        ]
+        self.assertEqual(
+            sorted(c[1] for c in c_indices),
+            [slice(0, 2), slice(2, 3), slice(3, 5), slice(5, 8)],
+        )
+
+    def test_GatheredArray_fill_value(self):
+        """Test GatheredArray with a fill value."""
+        g = cfdm.GatheredArray(source=self.g)
+        self.assertIsNone(g.get_fill_value(None))
+        with self.assertRaises(ValueError):
+            g.get_fill_value()
+
+        g = cfdm.GatheredArray(
+            compressed_array=cfdm.Data(self.compressed_data),
+            shape=(3, 4, 6),
+            compressed_dimensions={1: (1, 2)},
+            list_variable=self.list_variable,
+            fill_value=-99,
+        )
+        self.assertEqual(g.get_fill_value(), -99)
+        self.assertEqual(cfdm.GatheredArray(source=g).get_fill_value(), -99)
+
+        filled = self.u.filled(-99)
+        for u in (g[...], g.to_dask_array(chunks=2).compute()):
+            self.assertFalse(np.ma.isMA(u))
+            self.assertTrue((u == filled).all())
+
+    def test_GatheredArray_to_memory(self):
+        """Test `GatheredArray.to_memory`"""
+        self.assertIsInstance(self.g.to_memory(), cfdm.GatheredArray)
+
+    def test_GatheredArray_get_list(self):
+        """Test `GatheredArray.get_list`"""
+        self.assertIsInstance(self.g.get_list(), cfdm.List)
+
+
+if __name__ == "__main__":
+    print("Run date:", datetime.datetime.now())
+    cfdm.environment()
+    print("")
+    unittest.main(verbosity=2)
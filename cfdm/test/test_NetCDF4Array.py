@@ -369,6 +369,86 @@ class NetCDF4ArrayTest(unittest.TestCase):
         self.assertEqual(a.dtype, np.dtype("int32"))
         self.assertTrue((a == f.array.astype("int32")).all())
 
+    def test_NetCDF4Array_lock_policy(self):
+        """Test NetCDF4Array locking with different lock policies."""
+        from cfdm.data.locks import netcdf_lock, no_lock
+
+        f = self.f0
+        cfdm.write(f, tmpfile)
+
+        n = cfdm.NetCDF4Array(
+            tmpfile, f.nc_get_variable(), shape=f.shape, dtype=f.dtype
+        )
+        m = cfdm.NetCDF4Array(
+            "other.nc", f.nc_get_variable(), shape=f.shape, dtype=f.dtype
+        )
+
+        self.assertIs(n._lock, netcdf_lock)
+
+        with cfdm.lock_policy("file"):
+            self.assertIsNot(n._lock, netcdf_lock)
+            self.assertIs(n._lock, n.copy()._lock)
+            self.assertIsNot(n._lock, m._lock)
+            self.assertTrue((n[...] == f.array).all())
+
+        with cfdm.lock_policy("none"):
+            self.assertIs(n._lock, no_lock)
+            self.assertTrue((n[...] == f.array).all())
+
+        self.assertIs(n._lock, netcdf_lock)
+
+    def test_NetCDF4Array_dataset_pool(self):
+        """Test NetCDF4Array sharing of open datasets via the pool."""
+        from cfdm.data.datasetpool import dataset_pool
+
+        f = self.f0
+        cfdm.write(f, tmpfile)
+        dataset_pool.clear()
+
+        n = cfdm.NetCDF4Array(
+            tmpfile, f.nc_get_variable(), shape=f.shape, dtype=f.dtype
+        )
+        array = f.array
+
+        # Repeated reads re-use the same open dataset
+        dataset0, _ = n.open()
+        n.close(dataset0)
+        self.assertEqual(len(dataset_pool), 1)
+        self.assertTrue(dataset0.isopen())
+
+        self.assertTrue((n[...] == array).all())
+        self.assertTrue((n[1:3] == array[1:3]).all())
+        dataset1, _ = n.open()
+        n.close(dataset1)
+        self.assertIs(dataset1, dataset0)
+        self.assertEqual(len(dataset_pool), 1)
+
+        # Writing to the file closes the pooled dataset
+        cfdm.write(f, tmpfile)
+        self.assertEqual(len(dataset_pool), 0)
+        self.assertFalse(dataset0.isopen())
+        self.assertTrue((n[...] == array).all())
+
+        # Disable pooling
+        with cfdm.dataset_pool_size(0):
+            self.assertEqual(len(dataset_pool), 0)
+            dataset, _ = n.open()
+            n.close(dataset)
+            self.assertFalse(dataset.isopen())
+            self.assertTrue((n[...] == array).all())
+            self.assertEqual(len(dataset_pool), 0)
+
+        # Idle timeout
+        with cfdm.dataset_pool_timeout(0):
+            self.assertTrue((n[...] == array).all())
+            dataset, _ = n.open()
+            n.close(dataset)
+            self.assertEqual(len(dataset_pool), 0)
+            self.assertFalse(dataset.isopen())
+
+        dataset_pool.clear()
+        self.assertEqual(len(dataset_pool), 0)
+
 
 if __name__ == "__main__":
     print("Run date:", datetime.datetime.now())
@@ -2,6 +2,8 @@ import datetime
 import faulthandler
 import unittest
 
+import numpy as np
+
 faulthandler.enable()  # to debug seg faults and timeouts
 
 import cfdm
@@ -38,6 +40,32 @@ class RaggedContiguousArrayTest(unittest.TestCase):
         r._del_component("count_variable")
         self.assertIsNone(r.get_count(None))
 
+    def test_RaggedContiguousArray_offset_index(self):
+        """Test `RaggedContiguousArray.offset_index`"""
+        r = cfdm.RaggedContiguousArray(
+            cfdm.Data(np.arange(11.0)),
+            shape=(3, 5),
+            count_variable=cfdm.Count(data=[2, 5, 4]),
+        )
+        index = r.offset_index()
+        self.assertEqual(index["offsets"].tolist(), [0, 2, 7, 11])
+        self.assertIsNone(index["order"])
+        self.assertIsNone(index["profile_offsets"])
+        self.assertEqual(index["size"], 11)
+
+        # The offset index is shared with copies
+        self.assertIs(r.copy().offset_index(), index)
+        self.assertIs(
+            cfdm.RaggedContiguousArray(source=r).offset_index(), index
+        )
+
+        self.assertEqual(r.feature_indices(0), slice(0, 2))
+        self.assertEqual(r.feature_indices(2), slice(7, 11))
+
+        u = r[...]
+        self.assertTrue((r.to_dask_array(chunks=(1, -1)).compute() == u).all())
+        self.assertEqual(u[1].tolist(), list(range(2, 7)))
+
 
 if __name__ == "__main__":
     print("Run date:", datetime.datetime.now())
@@ -2,6 +2,8 @@ import datetime
 import faulthandler
 import unittest
 
+import numpy as np
+
 faulthandler.enable()  # to debug seg faults and timeouts
 
 import cfdm
@@ -38,6 +40,41 @@ class RaggedIndexedArrayTest(unittest.TestCase):
         r._del_component("index_variable")
         self.assertIsNone(r.get_index(None))
 
+    def test_RaggedIndexedArray_offset_index(self):
+        """Test `RaggedIndexedArray.offset_index`"""
+        r = cfdm.RaggedIndexedArray(
+            cfdm.Data(np.arange(11.0)),
+            shape=(3, 5),
+            index_variable=cfdm.Index(data=[2, 1, 2, 1, 1, 0, 2, 1, 0, 2, 1]),
+        )
+        index = r.offset_index()
+        self.assertEqual(index["offsets"].tolist(), [0, 2, 7, 11])
+        self.assertEqual(
+            index["order"].tolist(), [5, 8, 1, 3, 4, 7, 10, 0, 2, 6, 9]
+        )
+        self.assertIsNone(index["profile_offsets"])
+        self.assertEqual(index["size"], 11)
+
+        # The offset index is shared with copies
+        self.assertIs(r.copy().offset_index(), index)
+
+        self.assertEqual(r.feature_indices(0).tolist(), [5, 8])
+        self.assertEqual(r.feature_indices(1).tolist(), [1, 3, 4, 7, 10])
+
+        u = r[...]
+        self.assertEqual(u[1].tolist(), [1, 3, 4, 7, 10])
+        self.assertEqual(u[0].compressed().tolist(), [5, 8])
+        self.assertTrue((r.to_dask_array(chunks=(1, -1)).compute() == u).all())
+
+        # Sorted index variable
+        r = cfdm.RaggedIndexedArray(
+            cfdm.Data(np.arange(4.0)),
+            shape=(2, 3),
+            index_variable=cfdm.Index(data=[0, 1, 1, 1]),
+        )
+        self.assertIsNone(r.offset_index()["order"])
+        self.assertEqual(r.feature_indices(1), slice(1, 4))
+
 
 if __name__ == "__main__":
     print("Run date:", datetime.datetime.now())
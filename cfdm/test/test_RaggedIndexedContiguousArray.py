@@ -2,6 +2,8 @@ import datetime
 import faulthandler
 import unittest
 
+import numpy as np
+
 faulthandler.enable()  # to debug seg faults and timeouts
 
 import cfdm
@@ -61,6 +63,43 @@ class RaggedIndexedContiguousArrayTest(unittest.TestCase):
         r._del_component("index_variable")
         self.assertIsNone(r.get_index(None))
 
+    def test_RaggedIndexedContiguousArray_offset_index(self):
+        """Test `RaggedIndexedContiguousArray.offset_index`"""
+        r = cfdm.RaggedIndexedContiguousArray(
+            compressed_array=cfdm.Data(np.arange(8.0)),
+            shape=(2, 3, 3),
+            index_variable=cfdm.Index(data=[0, 0, 1, 1]),
+            count_variable=cfdm.Count(data=[1, 3, 2, 2]),
+        )
+        index = r.offset_index()
+        self.assertEqual(index["offsets"].tolist(), [0, 2, 4])
+        self.assertIsNone(index["order"])
+        self.assertEqual(index["profile_offsets"].tolist(), [0, 1, 4, 6, 8])
+        self.assertEqual(index["size"], 8)
+
+        # The offset index is shared with copies
+        self.assertIs(r.copy().offset_index(), index)
+
+        self.assertEqual(r.feature_indices(1), [slice(4, 6), slice(6, 8)])
+
+        # Profiles out of feature order
+        r = cfdm.RaggedIndexedContiguousArray(
+            compressed_array=cfdm.Data(np.arange(8.0)),
+            shape=(2, 3, 3),
+            index_variable=cfdm.Index(data=[1, 0, 1, 0]),
+            count_variable=cfdm.Count(data=[1, 3, 2, 2]),
+        )
+        self.assertEqual(r.offset_index()["order"].tolist(), [1, 3, 0, 2])
+        self.assertEqual(r.feature_indices(0), [slice(1, 4), slice(6, 8)])
+
+        u = r[...]
+        self.assertEqual(u[0, 0].tolist(), [1, 2, 3])
+        self.assertEqual(u[1, 1].compressed().tolist(), [4, 5])
+        self.assertTrue(u[0, 2].mask.all())
+        self.assertTrue(
+            (r.to_dask_array(chunks=(1, 1, -1)).compute() == u).all()
+        )
+
 
 if __name__ == "__main__":
     print("Run date:", datetime.datetime.now())
@@ -88,6 +88,139 @@ class SubsampledArrayTest(unittest.TestCase):
         self.assertTrue(np.allclose(coords, self.u_coords))
         self.assertTrue(np.allclose(bounds, self.u_bounds))
 
+    def test_SubsampledArray_to_dask_array(self):
+        """Test `SubsampledArray.to_dask_array`"""
+        coords = self.coords[...]
+        bounds = self.bounds[...]
+
+        # Each dask chunk contains a batch of one or more
+        # interpolation subareas
+        for chunks, chunk_sizes in (
+            (-1, ((12,),)),
+            ("auto", ((12,),)),
+            (1, ((5, 3, 4),)),
+            (8, ((8, 4),)),
+        ):
+            dx = self.coords.to_dask_array(chunks=chunks)
+            self.assertEqual(dx.chunks, chunk_sizes)
+            self.assertTrue((dx.compute() == coords).all())
+
+            dx = self.bounds.to_dask_array(chunks=chunks)
+            self.assertEqual(dx.chunks, chunk_sizes + ((2,),))
+            self.assertTrue((dx.compute() == bounds).all())
+
+        # Bi-linear interpolation with two continuous areas along the
+        # first interpolated dimension
+        tie_points = cfdm.Data(np.arange(20.0).reshape(4, 5) ** 2)
+        a = cfdm.SubsampledArray(
+            interpolation_name="bi_linear",
+            compressed_array=tie_points,
+            shape=(8, 9),
+            tie_point_indices={
+                0: cfdm.TiePointIndex(data=[0, 3, 4, 7]),
+                1: cfdm.TiePointIndex(data=[0, 2, 4, 6, 8]),
+            },
+        )
+        u = a[...]
+        for chunks in (-1, 1, 3, 5):
+            self.assertTrue(
+                (a.to_dask_array(chunks=chunks).compute() == u).all()
+            )
+
+    def test_SubsampledArray_tie_point_cache(self):
+        """Test the tie point cache shared by subsampled subarrays."""
+        import pickle
+
+        from cfdm.data.tiepointcache import TiePointCache, tie_point_cache
+
+        coords = self.coords[...]
+
+        def subarrays(dx):
+            return [
+                v
+                for v in dict(dx.dask).values()
+                if isinstance(v, cfdm.QuadraticSubarray)
+            ]
+
+        # All of the subarrays use the same cache keys, which are the
+        # same for every dask array
+        tie_point_cache.clear()
+        dx = self.coords.to_dask_array(chunks=1)
+        s = subarrays(dx)
+        self.assertGreater(len(s), 1)
+        keys = s[0].tie_point_keys
+        self.assertIn("data", keys)
+        for x in s:
+            self.assertEqual(x.tie_point_keys, keys)
+
+        self.assertEqual(
+            subarrays(self.coords.to_dask_array(chunks=1))[0].tie_point_keys,
+            keys,
+        )
+
+        self.assertTrue((dx.compute() == coords).all())
+        self.assertEqual(len(tie_point_cache), len(set(keys.values())))
+
+        # Pickled subarrays keep their cache keys, and use the cache
+        # of the process in which they are computed
+        x = pickle.loads(pickle.dumps(s[0]))
+        self.assertEqual(x.tie_point_keys, keys)
+        self.assertTrue((x[...] == s[0][...]).all())
+
+        # No caching when there is only one subarray, or when the
+        # cache is disabled
+        tie_point_cache.clear()
+        for chunks, size in ((-1, cfdm.tie_point_cache_size().value), (1, 0)):
+            with cfdm.tie_point_cache_size(size):
+                dx = self.coords.to_dask_array(chunks=chunks)
+                for x in subarrays(dx):
+                    self.assertIsNone(x.tie_point_keys)
+
+                self.assertTrue((dx.compute() == coords).all())
+                self.assertEqual(len(tie_point_cache), 0)
+
+        cache = TiePointCache()
+        data = np.arange(4.0)
+        key = ("data", frozenset())
+        x = cache.get(key, data)
+        self.assertTrue((x == data).all())
+        self.assertFalse(x.flags.writeable)
+        self.assertEqual(len(cache), 1)
+        self.assertIs(cache.get(key, data), x)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+        # Only the arrays from a given file are cleared
+        cache.get(("a", frozenset(["file1.nc"])), data)
+        cache.get(("b", frozenset(["file1.nc", "file2.nc"])), data)
+        cache.get(("c", frozenset(["file2.nc"])), data)
+        cache.clear("file1.nc")
+        self.assertEqual(list(cache._arrays), [("c", frozenset(["file2.nc"]))])
+        cache.clear()
+
+        # A failed read doesn't leave its read lock behind
+        class BadArray:
+            shape = (2,)
+            dtype = data.dtype
+
+            def __array__(self, *args, **kwargs):
+                raise OSError("Read failed")
+
+        with self.assertRaises(OSError):
+            cache.get(("bad", frozenset()), BadArray())
+
+        self.assertEqual(cache._read_locks, {})
+        self.assertEqual(len(cache), 0)
+
+        # Least recently used arrays are removed from a full cache
+        with cfdm.tie_point_cache_size(data.nbytes * 2):
+            cache.get((0, frozenset()), data)
+            cache.get((1, frozenset()), data)
+            cache.get((0, frozenset()), data)
+            cache.get((2, frozenset()), data)
+            self.assertEqual([key[0] for key in cache._arrays], [0, 2])
+            self.assertIsNone(cache.get((3, frozenset()), np.arange(10.0)))
+
     def test_SubsampledArray_to_memory(self):
         """Test `SubsampledArray.to_memory."""
         self.assertIsInstance(self.coords.to_memory(), cfdm.SubsampledArray)
@@ -157,6 +157,52 @@ class UGRIDTest(unittest.TestCase):
         )
         self.assertTrue(cell_connectivity1.equals(face2.cell_connectivity()))
 
+    def test_UGRID_PointTopologyArray(self):
+        """Test PointTopologyArray from faces and edges."""
+        node, face, edge = cfdm.read(self.filename1)
+        faces = face.domain_topology().array
+        edges = edge.domain_topology().array
+
+        from_faces = np.array(
+            [
+                [0, 1, -99, -99],
+                [1, 3, 6, -99],
+                [2, 0, 3, -99],
+                [3, 1, 2, 5],
+                [4, 2, -99, -99],
+                [5, 4, -99, -99],
+                [6, 3, -99, -99],
+            ]
+        )
+        from_edges = np.array(
+            [
+                [0, 1, 2, -99, -99],
+                [1, 0, 3, 6, -99],
+                [2, 0, 3, 4, -99],
+                [3, 1, 2, 5, 6],
+                [4, 2, 5, -99, -99],
+                [5, 3, 4, -99, -99],
+                [6, 1, 3, -99, -99],
+            ]
+        )
+
+        for start_index in (0, 1):
+            for kwargs, expected in (
+                ({"face_node_connectivity": faces + start_index}, from_faces),
+                ({"edge_node_connectivity": edges + start_index}, from_edges),
+            ):
+                p = cfdm.PointTopologyArray(
+                    start_index=start_index, cell_dimension=0, **kwargs
+                )
+                a = p.array
+                self.assertEqual(p.shape, expected.shape)
+                self.assertTrue((a.mask == (expected == -99)).all())
+                self.assertTrue(
+                    (a == np.ma.masked_equal(expected, -99) + start_index)
+                    .filled(True)
+                    .all()
+                )
+
     def test_read_UGRID_domain(self):
         """Test reading of UGRID files into domains."""
         d1 = cfdm.read(self.filename1, domain=True)
@@ -350,6 +350,64 @@ class DSGTest(unittest.TestCase):
             (z.data.get_count().data.array == np.array([2, 3])).all()
         )
 
+    def test_DSG_ragged_features(self):
+        """Test iterating over the features of ragged arrays."""
+        for fields in (self.c, self.i, self.ic):
+            for f in fields:
+                u = f.data.array
+                indexed_contiguous = (
+                    f.data.get_compression_type()
+                    == "ragged indexed contiguous"
+                )
+
+                features = list(f.ragged_features())
+                self.assertEqual(len(features), f.data.shape[0])
+                for k, feature in enumerate(features):
+                    if indexed_contiguous:
+                        for p, profile in enumerate(feature):
+                            n = profile.size
+                            self.assertTrue((profile == u[k, p, :n]).all())
+                            self.assertTrue(u[k, p, n:].mask.all())
+
+                        self.assertTrue(u[k, len(feature) :].mask.all())
+                    else:
+                        n = feature.size
+                        self.assertTrue((feature == u[k, :n]).all())
+                        self.assertTrue(u[k, n:].mask.all())
+
+                # Batches of features
+                for batch_size in (1, 3, 100):
+                    batches = list(f.ragged_features(batch_size=batch_size))
+                    self.assertEqual(
+                        [len(batch) for batch in batches[:-1]],
+                        [batch_size] * (len(batches) - 1),
+                    )
+                    self.assertEqual(
+                        str([x for batch in batches for x in batch]),
+                        str(features),
+                    )
+
+                # Selected features
+                self.assertEqual(
+                    str(list(f.ragged_features(features=[-1, 0, 0]))),
+                    str([features[-1], features[0], features[0]]),
+                )
+                self.assertEqual(
+                    str(list(f.ragged_features(features=slice(1, 3)))),
+                    str(features[1:3]),
+                )
+
+        f = self.c[0]
+        with self.assertRaises(ValueError):
+            f.ragged_features(batch_size=0)
+
+        # Uncompressed data
+        with self.assertRaises(ValueError):
+            f.uncompress().ragged_features()
+
+        with self.assertRaises(ValueError):
+            f[:, :2].ragged_features()
+
 
 if __name__ == "__main__":
     print("Run date:", datetime.datetime.now())
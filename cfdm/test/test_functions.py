@@ -314,7 +314,7 @@ class FunctionsTest(unittest.TestCase):
         # Test getting of all config. and store original values to test on:
         org = cfdm.configuration()
         self.assertIsInstance(org, dict)
-        self.assertEqual(len(org), 6)
+        self.assertEqual(len(org), 10)
         org_atol = org["atol"]
         self.assertIsInstance(org_atol, float)
         org_rtol = org["rtol"]
@@ -327,6 +327,14 @@ class FunctionsTest(unittest.TestCase):
         self.assertIsInstance(org_display_data, bool)
         org_persist_data = org["persist_data"]
         self.assertIsInstance(org_persist_data, bool)
+        org_lock_policy = org["lock_policy"]
+        self.assertIsInstance(org_lock_policy, str)
+        org_dataset_pool_size = org["dataset_pool_size"]
+        self.assertIsInstance(org_dataset_pool_size, int)
+        org_dataset_pool_timeout = org["dataset_pool_timeout"]
+        self.assertIsInstance(org_dataset_pool_timeout, float)
+        org_tie_point_cache_size = org["tie_point_cache_size"]
+        self.assertIsInstance(org_tie_point_cache_size, int)
 
         # Store some sensible values to reset items to for testing,
         # ensure these are kept to be different to the defaults:
@@ -349,6 +357,14 @@ class FunctionsTest(unittest.TestCase):
         self.assertEqual(post_set["chunksize"], org_chunksize)
         self.assertEqual(post_set["display_data"], org_display_data)
         self.assertEqual(post_set["persist_data"], org_persist_data)
+        self.assertEqual(post_set["lock_policy"], org_lock_policy)
+        self.assertEqual(post_set["dataset_pool_size"], org_dataset_pool_size)
+        self.assertEqual(
+            post_set["dataset_pool_timeout"], org_dataset_pool_timeout
+        )
+        self.assertEqual(
+            post_set["tie_point_cache_size"], org_tie_point_cache_size
+        )
         # don't reset to org this time to test change persisting...
 
         # Note setting of previous items persist, e.g. atol above
@@ -406,6 +422,12 @@ class FunctionsTest(unittest.TestCase):
             cfdm.configuration(rtol="bad")
         with self.assertRaises(ValueError):
             cfdm.configuration(log_level=7)
+        with self.assertRaises(ValueError):
+            cfdm.configuration(lock_policy="bad")
+        with self.assertRaises(ValueError):
+            cfdm.configuration(dataset_pool_size=-1)
+        with self.assertRaises(ValueError):
+            cfdm.configuration(dataset_pool_timeout=-1)
 
         # 4. Check invalid kwarg given logic processes **kwargs:
         with self.assertRaises(TypeError):
@@ -491,6 +513,16 @@ class FunctionsTest(unittest.TestCase):
         self.assertEqual(u[1].get_property("project"), "model")
         self.assertEqual(u[1].get_property("foo"), "bar")
 
+        # Order of first occurrence is preserved, and constructs
+        # that are equal within the tolerances are not unique
+        h = f.copy()
+        h.data[0, 0] = f.data[0, 0].array + cfdm.atol() / 10
+        u = cfdm.unique_constructs([g, f, g, h, f2, f], copy=False)
+        self.assertEqual(len(u), 3)
+        self.assertIs(u[0], g)
+        self.assertIs(u[1], f)
+        self.assertIs(u[2], f2)
+
     def test_context_managers(self):
         """Test the context manager support of the functions."""
         # rtol and atol
@@ -530,6 +562,10 @@ class FunctionsTest(unittest.TestCase):
             log_level="DETAIL",
             display_data=False,
             persist_data=True,
+            lock_policy="file",
+            dataset_pool_size=8,
+            dataset_pool_timeout=30,
+            tie_point_cache_size=1000,
         )
         old = func()
         new = dict(old)
@@ -538,6 +574,10 @@ class FunctionsTest(unittest.TestCase):
         new["log_level"] = "DEBUG"
         new["display_data"] = True
         new["persist_data"] = False
+        new["lock_policy"] = "none"
+        new["dataset_pool_size"] = 16
+        new["dataset_pool_timeout"] = 60.0
+        new["tie_point_cache_size"] = 2000
 
         with func(**new):
             self.assertEqual(func(), new)
@@ -551,6 +591,10 @@ class FunctionsTest(unittest.TestCase):
             log_level="DETAIL",
             display_data=False,
             persist_data=True,
+            lock_policy="file",
+            dataset_pool_size=8,
+            dataset_pool_timeout=30,
+            tie_point_cache_size=1000,
         )
         old = func()
         new["rtol"] = cfdm.Constant(10 * 2)
@@ -558,6 +602,10 @@ class FunctionsTest(unittest.TestCase):
         new["log_level"] = "DEBUG"
         new["display_data"] = True
         new["persist_data"] = False
+        new["lock_policy"] = "none"
+        new["dataset_pool_size"] = 16
+        new["dataset_pool_timeout"] = 60.0
+        new["tie_point_cache_size"] = 2000
 
         with func(**new):
             self.assertEqual(func(), new)
@@ -4,6 +4,7 @@ import faulthandler
 import os
 import tempfile
 import unittest
+import warnings
 
 faulthandler.enable()  # to debug seg faults and timeouts
 
@@ -11,8 +12,12 @@ import netCDF4
 import numpy as np
 
 import cfdm
+from cfdm.read_write.netcdf.flatten.flatten import (
+    UnresolvedReferenceException,
+    _Flattener,
+)
 
-n_tmpfiles = 10
+n_tmpfiles = 11
 tmpfiles = [
     tempfile.mkstemp("_test_groups.nc", dir=os.getcwd())[1]
     for i in range(n_tmpfiles)
@@ -28,6 +33,7 @@ tmpfiles = [
     grouped_file4,
     grouped_file5,
     grouped_file6,
+    grouped_file7,
 ) = tmpfiles
 
 
@@ -574,6 +580,132 @@ class GroupsTest(unittest.TestCase):
         # This should not raise an exception
         cfdm.write(file_content, grouped_file6)
 
+    def test_groups_dataset_flatten(self):
+        """Test the virtual flattening of a grouped dataset."""
+        f = self.f0.copy()
+
+        key = f.domain_axis_key("time")
+        f.constructs[key].nc_set_unlimited(True)
+        f.insert_dimension(key, 0, inplace=True)
+
+        lat = f.construct("latitude")
+        lat.nc_set_variable_groups(["forecast"])
+        f.nc_set_variable_groups(["forecast", "model"])
+        cfdm.write(f, grouped_file7)
+
+        nc = netCDF4.Dataset(grouped_file7, "r")
+        flat = cfdm.dataset_flatten(nc)
+
+        # Compare with a flattened netCDF4 copy
+        flat_nc = netCDF4.Dataset("flat.nc", "w", diskless=True, persist=False)
+        self.assertIsNone(cfdm.dataset_flatten(nc, flat_nc, copy_data=True))
+
+        self.assertEqual(flat.groups, {})
+        self.assertEqual(set(flat.ncattrs()), set(flat_nc.ncattrs()))
+        self.assertEqual(set(flat.dimensions), set(flat_nc.dimensions))
+        for name, dim in flat.dimensions.items():
+            self.assertEqual(dim.size, flat_nc.dimensions[name].size)
+            self.assertEqual(
+                dim.isunlimited(), flat_nc.dimensions[name].isunlimited()
+            )
+
+        self.assertEqual(set(flat.variables), set(flat_nc.variables))
+        for name, var in flat.variables.items():
+            var_nc = flat_nc.variables[name]
+            self.assertEqual(var.dimensions, var_nc.dimensions)
+            self.assertEqual(var.shape, var_nc.shape)
+            self.assertEqual(var.ndim, var_nc.ndim)
+            self.assertEqual(set(var.ncattrs()), set(var_nc.ncattrs()))
+            for attr in var.ncattrs():
+                self.assertTrue(
+                    np.all(var.getncattr(attr) == var_nc.getncattr(attr))
+                )
+
+            self.assertTrue((var[...] == var_nc[...]).all())
+
+        # The flattened variables wrap the original variables
+        var = flat.variables["forecast__model__q"]
+        self.assertIs(var._variable, nc["forecast/model/q"])
+        self.assertIn(
+            "forecast__model__q: /forecast/model/q",
+            flat.getncattr("_flattener_variable_map"),
+        )
+
+        flat_nc.close()
+        nc.close()
+
+    def test_groups_dataset_flatten_references(self):
+        """Test the resolution of references when flattening."""
+        nc = netCDF4.Dataset("refs.nc", "w", diskless=True, persist=False)
+        nc.createDimension("x", 3)
+        nc.createVariable("x", "f8", ("x",))
+        nc.createVariable("lon", "f8", ("x",))
+        forecast = nc.createGroup("forecast")
+        forecast.createVariable("lat", "f8", ("x",))
+        model = forecast.createGroup("model")
+        for name in ("q", "r"):
+            var = model.createVariable(name, "f8", ("x",))
+            var.coordinates = "lat ../lat /lon"
+            var.cell_methods = "x: mean"
+
+        flattener = _Flattener(nc, None)
+        flattener.flatten()
+        flat = flattener._output_ds
+        for name in ("forecast__model__q", "forecast__model__r"):
+            var = flat.variables[name]
+            self.assertEqual(var.getncattr("coordinates"), "forecast__lat lon")
+            self.assertEqual(var.getncattr("cell_methods"), "x: mean")
+
+        # Each reference is searched for once per group
+        self.assertEqual(
+            flattener._resolved_references,
+            {
+                ("lat", "/forecast/model", "coordinates"): (
+                    "/forecast/lat",
+                    "variable",
+                    "Proximity",
+                ),
+                ("../lat", "/forecast/model", "coordinates"): (
+                    "/forecast/lat",
+                    "variable",
+                    "Relative",
+                ),
+                ("/lon", "/forecast/model", "coordinates"): (
+                    "/lon",
+                    "",
+                    "Absolute",
+                ),
+                ("x", "/forecast/model", "cell_methods"): (
+                    "/x",
+                    "dimension",
+                    "Proximity",
+                ),
+            },
+        )
+        self.assertEqual(
+            set(flattener._group_symbols),
+            set(("/", "/forecast", "/forecast/model")),
+        )
+
+        # Unresolved references are reported for every variable
+        for name in ("q", "r"):
+            model[name].coordinates = "../../../lat"
+
+        with self.assertRaises(UnresolvedReferenceException):
+            cfdm.dataset_flatten(nc)
+
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            flat = cfdm.dataset_flatten(nc, strict=False)
+
+        self.assertEqual(len(w), 2)
+        self.assertEqual(
+            flat.variables["forecast__model__q"].getncattr("coordinates"),
+            "REF_NOT_FOUND_../../../lat",
+        )
+
+        nc.close()
+
 
 if __name__ == "__main__":
     print("Run date:", datetime.datetime.now())
@@ -0,0 +1,113 @@
+import datetime
+import faulthandler
+import os
+import subprocess
+import sys
+import unittest
+
+faulthandler.enable()  # to debug seg faults and timeouts
+
+import cfdm
+
+# Modules that must not be imported by 'import cfdm', because they are
+# slow to import and not needed until data are read, written, or
+# have units.
+lazy_modules = (
+    "cfdm.examplefield",
+    "cfdm.read_write",
+    "cfunits",
+    "dask",
+    "h5netcdf",
+    "h5py",
+    "netCDF4",
+    "pyfive",
+    "zarr",
+)
+
+
+def _run(code):
+    """Run Python code in a new process, returning its standard output.
+
+    The new process imports cfdm from the same location as this
+    process.
+
+    """
+    env = os.environ.copy()
+    env["PYTHONPATH"] = os.pathsep.join(
+        (
+            os.path.dirname(os.path.dirname(os.path.abspath(cfdm.__file__))),
+            env.get("PYTHONPATH", ""),
+        )
+    )
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        env=env,
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout.strip()
+
+
+class ImportTest(unittest.TestCase):
+    """Test the modules loaded by 'import cfdm'."""
+
+    def test_import_lazy_modules(self):
+        """Test that 'import cfdm' does not import slow modules."""
+        code = (
+            "import sys; import cfdm; "
+            f"print(' '.join(m for m in {lazy_modules!r} if m in sys.modules))"
+        )
+        self.assertEqual(_run(code), "")
+
+    def test_import_lazy_attributes(self):
+        """Test lazily imported cfdm attributes."""
+        from cfdm.examplefield import example_field
+        from cfdm.read_write import read, write
+        from cfdm.read_write.netcdf.flatten import dataset_flatten
+
+        self.assertIs(cfdm.read, read)
+        self.assertIs(cfdm.write, write)
+        self.assertIs(cfdm.dataset_flatten, dataset_flatten)
+        self.assertIs(cfdm.example_field, example_field)
+        self.assertIn("read", dir(cfdm))
+        self.assertIn("example_fields", dir(cfdm))
+
+        with self.assertRaises(AttributeError):
+            cfdm.bad_attribute_name
+
+        code = (
+            "import sys; import cfdm; cfdm.read; "
+            "print('cfdm.read_write' in sys.modules, "
+            "'cfdm.examplefield' in sys.modules)"
+        )
+        self.assertEqual(_run(code), "True False")
+
+    def test_import_star(self):
+        """Test that 'from cfdm import *' includes lazy attributes."""
+        namespace = {}
+        exec("from cfdm import *", namespace)
+        for name in (
+            "read",
+            "write",
+            "dataset_flatten",
+            "example_field",
+            "example_fields",
+            "example_domain",
+            "read_write",
+            "examplefield",
+            "Field",
+            "Data",
+            "configuration",
+        ):
+            self.assertIn(name, namespace)
+
+        self.assertIs(namespace["read"], cfdm.read)
+        self.assertIs(namespace["example_field"], cfdm.example_field)
+        self.assertFalse(any(name.startswith("_") for name in cfdm.__all__))
+
+
+if __name__ == "__main__":
+    print("Run date:", datetime.datetime.now())
+    cfdm.environment()
+    print("")
+    unittest.main(verbosity=2)
@@ -160,6 +160,39 @@ class netcdf_indexerTest(unittest.TestCase):
         self.assertTrue((x.mask == array.mask).all())
         self.assertTrue((x == array).all())
 
+    def test_netcdf_indexer_mask_and_unpack(self):
+        """Test netcdf_indexer combined masking and unpacking."""
+        array = np.arange(-2, 10, dtype="int16").reshape(3, 4)
+        array[0, 0] = -99
+        attributes = {
+            "missing_value": np.array([-99, 3], dtype="int16"),
+            "_FillValue": np.int16(5),
+            "valid_min": np.int16(-1),
+            "valid_max": np.int16(8),
+            "scale_factor": np.float32(0.5),
+            "add_offset": np.float32(10),
+        }
+
+        a = np.ma.masked_array(array * np.float32(0.5) + np.float32(10))
+        a[(array == -99) | (array == 3) | (array == 5)] = np.ma.masked
+        a[(array < -1) | (array > 8)] = np.ma.masked
+
+        for data in (array, np.ma.masked_array(array)):
+            x = cfdm.netcdf_indexer(data, attributes=attributes)[...]
+            self.assertEqual(x.dtype, a.dtype)
+            self.assertEqual(x.fill_value, -99)
+            self.assertTrue((x.mask == a.mask).all())
+            self.assertTrue((x == a).all())
+
+            x = cfdm.netcdf_indexer(data, attributes=attributes)[1, 2]
+            self.assertEqual(x, a[1, 2])
+            self.assertIsInstance(x, np.float32)
+
+        # Existing masks are retained
+        data = np.ma.masked_array(array, mask=array == 7)
+        x = cfdm.netcdf_indexer(data, attributes=attributes)[...]
+        self.assertTrue((x.mask == (a.mask | (array == 7))).all())
+
     def test_netcdf_indexer_orthogonal_indexing(self):
         """Test netcdf_indexer for numpy orthogonal indexing."""
         array = np.ma.arange(120).reshape(2, 3, 4, 5)
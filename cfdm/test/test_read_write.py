@@ -3,6 +3,7 @@ import datetime
 import faulthandler
 import os
 import platform
+import shutil
 import subprocess
 import tempfile
 import unittest
@@ -899,6 +900,42 @@ class read_writeTest(unittest.TestCase):
         self.assertEqual(len(g), 1)
         self.assertTrue(g[0].equals(f, verbose=3))
 
+    def test_write_shared_metadata(self):
+        """Test that shared metadata constructs are written once."""
+        f = self.f0
+        fields = []
+        for i in range(20):
+            g = f.copy()
+            g.nc_set_variable(f"q{i}")
+            fields.append(g)
+
+        # Latitude coordinates that differ from the others only in
+        # their values
+        lat = g.dimension_coordinate("latitude")
+        lat.data[0] = -89.0
+        lat.nc_set_variable("lat2")
+
+        cfdm.write(fields, tmpfile)
+
+        nc = netCDF4.Dataset(tmpfile, "r")
+        standard_names = [
+            v.getncattr("standard_name")
+            for v in nc.variables.values()
+            if "standard_name" in v.ncattrs()
+        ]
+        self.assertIn("lat2", nc.variables)
+        nc.close()
+
+        self.assertEqual(standard_names.count("latitude"), 2)
+        self.assertEqual(standard_names.count("longitude"), 1)
+        self.assertEqual(standard_names.count("time"), 1)
+
+        h = cfdm.read(tmpfile)
+        self.assertEqual(len(h), len(fields))
+        h = {x.nc_get_variable(): x for x in h}
+        for g in fields:
+            self.assertTrue(g.equals(h[g.nc_get_variable()]))
+
     def test_write_scalar_domain_ancillary(self):
         """Test the writing of a file with a scalar domain ancillary."""
         f = self.f1.copy()
@@ -1375,6 +1412,84 @@ class read_writeTest(unittest.TestCase):
         f = cfdm.read("ugrid_[12].nc")
         self.assertEqual(len(f), 6)
 
+    def test_read_parallel(self):
+        """Test the cfdm.read 'parallel' keyword."""
+        datasets = [
+            "example_field_0.nc",
+            self.filename,
+            "geometry_1.nc",
+            "DSG_timeSeries_contiguous.nc",
+        ]
+        f = cfdm.read(datasets)
+        for parallel in (True, "threads", "processes"):
+            g = cfdm.read(datasets, parallel=parallel)
+            self.assertEqual(len(g), len(f))
+            for a, b in zip(f, g):
+                self.assertTrue(b.equals(a))
+                self.assertEqual(b.get_filenames(), a.get_filenames())
+
+        # Errors are reported for each failed dataset
+        datasets = ["test_read_write.py", "example_field_0.nc", "parent.nc"]
+        for parallel in ("threads", "processes"):
+            with self.assertRaises(ReadError) as cm:
+                cfdm.read(datasets, parallel=parallel)
+
+            self.assertIn("test_read_write.py", str(cm.exception))
+            self.assertIn("Failed to read 1 of 3", str(cm.exception))
+            self.assertIsInstance(cm.exception.__cause__, DatasetTypeError)
+
+        with self.assertRaises(ValueError):
+            cfdm.read(self.filename, parallel="bad")
+
+        # netCDF-C is not thread-safe
+        with self.assertRaises(ValueError):
+            cfdm.read(self.filename, parallel=True, netcdf_backend="netCDF4")
+
+        g = cfdm.read(
+            self.filename, parallel="processes", netcdf_backend="netCDF4"
+        )
+        self.assertEqual(len(g), len(cfdm.read(self.filename)))
+
+    def test_read_metadata_cache(self):
+        """Test the cfdm.read 'metadata_cache' keyword."""
+        cache = tempfile.mkdtemp(dir=os.getcwd())
+        atexit.register(shutil.rmtree, cache, True)
+
+        f = self.f0
+        cfdm.write(f, tmpfile)
+
+        g = cfdm.read(tmpfile, metadata_cache=cache)
+        self.assertEqual(len(g), 1)
+        self.assertTrue(g[0].equals(f))
+        self.assertEqual(len(os.listdir(cache)), 1)
+
+        # Read from the cache
+        h = cfdm.read(tmpfile, metadata_cache=cache)
+        self.assertEqual(len(h), 1)
+        self.assertTrue(h[0].equals(g[0]))
+        self.assertEqual(h[0].get_filenames(), g[0].get_filenames())
+        self.assertEqual(len(os.listdir(cache)), 1)
+
+        # Different read keywords create a new cache entry
+        h = cfdm.read(
+            tmpfile, metadata_cache=cache, extra="dimension_coordinate"
+        )
+        self.assertEqual(len(h), 4)
+        self.assertEqual(len(os.listdir(cache)), 2)
+
+        # Modifying the dataset invalidates its cache entry, which is
+        # replaced by the new one
+        f = f.copy()
+        f.set_property("comment", "modified")
+        cfdm.write(f, tmpfile)
+        h = cfdm.read(tmpfile, metadata_cache=cache)
+        self.assertEqual(h[0].get_property("comment"), "modified")
+        self.assertEqual(len(os.listdir(cache)), 2)
+
+        # No cache
+        h = cfdm.read(tmpfile, metadata_cache=False)
+        self.assertTrue(h[0].equals(f))
+
     def test_write_chunk_cache(self):
         """Test the cfdm.write 'chunk_cache' keyword."""
         f = self.f0
@@ -223,6 +223,43 @@ class SubsamplingTest(unittest.TestCase):
         # Check original filenames
         self.assertEqual(i.get_original_filenames(), set([self.biquadratic]))
 
+    def test_subsampling_modified_file(self):
+        """Test that tie points are re-read from a modified file."""
+        import shutil
+
+        import netCDF4
+
+        from cfdm.data.tiepointcache import tie_point_cache
+
+        def longitude_sum():
+            lon = cfdm.read(tempfile)[-3].construct("longitude")
+            return lon.data.source().to_dask_array(chunks=(6, 4)).sum()
+
+        shutil.copy(self.biquadratic, tempfile)
+        tie_point_cache.clear()
+        s0 = longitude_sum().compute()
+        self.assertGreater(len(tie_point_cache), 0)
+
+        # Modify the longitude tie points in-place
+        with netCDF4.Dataset(tempfile, "a") as nc:
+            nc.variables["lon"][...] += 10
+
+        # Make sure that the modification time has changed, on a file
+        # system with coarse timestamps
+        st = os.stat(tempfile)
+        os.utime(tempfile, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+        s1 = longitude_sum().compute()
+        self.assertNotEqual(s1, s0)
+
+        tie_point_cache.clear()
+        self.assertEqual(longitude_sum().compute(), s1)
+
+        # Writing to the file removes its tie points from the cache
+        self.assertGreater(len(tie_point_cache), 0)
+        cfdm.write(cfdm.example_field(0), tempfile)
+        self.assertEqual(len(tie_point_cache), 0)
+
     def test_non_standard(self):
         """Test non-standardised interpolation."""
         f = cfdm.read(self.linear)
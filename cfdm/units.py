@@ -1,5 +1,3 @@
-from cfunits import Units as cfUnits
-
 from .core.meta import DocstringRewriteMeta
 
 
@@ -16,9 +14,14 @@ class Units(metaclass=DocstringRewriteMeta):
 
     def __new__(cls, *args, **kwargs):
         """Return a new Units instance."""
+        # Import cfunits on first use, since it is slow to import
+        from cfunits import Units as cfUnits
+
         return cfUnits(*args, **kwargs)
 
     @staticmethod
     def conform(*args, **kwargs):
         """Conform values to equivalent values in a compatible unit."""
+        from cfunits import Units as cfUnits
+
         return cfUnits.conform(*args, **kwargs)